@@ -3,9 +3,32 @@
 Este pacote expõe as duas funções principais:
 - encontra_expressoes: identifica expressões predefinidas no início de sentenças
 - aplica_regras: categoriza textos aplicando regras de inferência
+
+E também o ponto de entrada combinado:
+- analisar: executa os dois problemas em uma única passada por texto
+
+As funções são importadas no primeiro acesso: importar um módulo leve do pacote
+(ex.: `cliente_daemon`) não carrega o restante.
 """
+import importlib
+
+# Módulo de origem de cada função exposta
+_ORIGENS = {
+    'encontra_expressoes': 'analizador_de_texto.problema1',
+    'aplica_regras': 'analizador_de_texto.problema2',
+    'analisar': 'analizador_de_texto.analise',
+}
+
+__all__ = ['encontra_expressoes', 'aplica_regras', 'analisar']
+
+
+def __getattr__(nome):
+    origem = _ORIGENS.get(nome)
+    if origem is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = globals()[nome] = getattr(importlib.import_module(origem), nome)
+    return valor
 
-from analizador_de_texto.problema1 import encontra_expressoes
-from analizador_de_texto.problema2 import aplica_regras
 
-__all__ = ['encontra_expressoes', 'aplica_regras']
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
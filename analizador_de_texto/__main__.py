@@ -0,0 +1,9 @@
+"""__main__.py
+============================
+Permite executar a linha de comando com `python -m analizador_de_texto`.
+"""
+import sys
+
+from analizador_de_texto.cli import main
+
+sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""analise.py
+============================
+Ponto de entrada combinado para os problemas 1 e 2.
+
+Cada texto é analisado uma única vez (sentenças, tokens e expressões) e o mesmo
+`TextoAnalisado` alimenta tanto a verificação de expressões quanto a categorização.
+
+Funções:
+- analisar: retorna as saídas dos problemas 1 e 2 em uma única passada
+"""
+from typing import List, Dict, Any
+
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.problema1 import sentencas_analisadas
+from analizador_de_texto.registro import registro
+
+def analisar(informacoes_textos: List[Dict[str, Any]],
+             arquivo_regras: str = "regras_linguagem_natural.txt",
+             arquivo_expressoes: str = "expressoes.txt") -> Dict[str, List[Dict[str, Any]]]:
+    """Verifica expressões e categoriza textos em uma única passada.
+
+    Args:
+        informacoes_textos (List[Dict[str, Any]]): Lista de dicionários com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Dicionário com 'expressoes' (saída de `encontra_expressoes`)
+        e 'categorias' (saída de `aplica_regras`).
+    """
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    avaliar_regras = registro.avaliador_regras(arquivo_regras)
+
+    resultado = {'expressoes': [], 'categorias': []}
+    for info_texto in informacoes_textos:
+        id_texto = info_texto["id"]
+        texto_analisado = TextoAnalisado(info_texto["texto"], trie_expressoes, id_texto)
+
+        resultado['expressoes'].append({
+            "id": id_texto,
+            "sentencas": sentencas_analisadas(texto_analisado)
+        })
+        resultado['categorias'].append({
+            'id': id_texto,
+            'categorias': sorted(avaliar_regras(texto_analisado))
+        })
+
+    return resultado
\ No newline at end of file
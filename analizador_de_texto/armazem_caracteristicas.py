@@ -0,0 +1,216 @@
+"""armazem_caracteristicas.py
+============================
+Armazém persistente (SQLite) das características de textos já analisados.
+
+Separar sentenças, tokenizar e buscar expressões é a parte cara da categorização,
+e não depende das regras. O armazém guarda, para cada texto (chave: id e hash do
+conteúdo), o número de sentenças e de tokens, a tabela de frequência dos tokens
+(em minúsculas), a expressão encontrada no início de cada sentença e o próprio
+texto comprimido. Categorizações seguintes, inclusive com regras editadas, leem
+essas características em vez de reanalisar o texto; as condições sobre literais
+continuam sendo verificadas no texto, com a mesma semântica de `aplica_regras`.
+
+As expressões por sentença dependem do arquivo de expressões: cada registro guarda
+o hash das expressões usadas, e um registro gerado com outras expressões é
+recalculado. Como o texto fica guardado, o armazém também pode ser usado sozinho
+em experimentos com regras novas (`ArmazemCaracteristicas.textos`).
+
+Exemplo:
+    with ArmazemCaracteristicas("caracteristicas.sqlite") as armazem:
+        aplica_regras(textos, armazem=armazem)                   # analisa e guarda
+        aplica_regras(armazem.textos(), "regras_novas.txt", armazem=armazem)  # só lê
+
+Classes:
+- ArmazemCaracteristicas: armazém de características por id e hash do texto
+"""
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, Optional
+import json
+import sqlite3
+import threading
+import zlib
+
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.tokenizador import tokenizar
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+
+# Valor guardado para sentenças sem expressão
+SEM_EXPRESSAO = -1
+
+
+class ArmazemCaracteristicas:
+    """Armazém SQLite das características de textos, indexado pelo id e pelo hash do texto."""
+
+    def __init__(self, arquivo: str = ':memory:', gravacoes_por_transacao: int = 1_000):
+        """Abre (ou cria) o armazém.
+
+        Args:
+            arquivo (str): Arquivo SQLite. Padrão: apenas em memória.
+            gravacoes_por_transacao (int): Número de textos gravados antes de cada commit.
+                Os pendentes são gravados também em `fechar`.
+        """
+        self.arquivo = arquivo
+        self.gravacoes_por_transacao = gravacoes_por_transacao
+        self.acertos = 0
+        self.faltas = 0
+        self._pendentes = 0
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+        self._conexao.execute(
+            'CREATE TABLE IF NOT EXISTS caracteristicas ('
+            ' id TEXT, hash_texto TEXT, hash_expressoes TEXT,'
+            ' qtd_sentencas INTEGER, qtd_tokens INTEGER, qtd_sentencas_com_expressao INTEGER,'
+            ' frequencias TEXT, expressoes BLOB, texto BLOB,'
+            ' PRIMARY KEY (id, hash_texto))'
+        )
+
+    def __len__(self) -> int:
+        with self._trava:
+            return self._conexao.execute('SELECT COUNT(*) FROM caracteristicas').fetchone()[0]
+
+    def __enter__(self) -> 'ArmazemCaracteristicas':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Grava os textos pendentes e fecha o arquivo."""
+        with self._trava:
+            if self._conexao is not None:
+                self._conexao.commit()
+                self._conexao.close()
+                self._conexao = None
+
+    def texto_analisado(self, texto: str, id_texto: Any, trie_expressoes: TrieExpressoes,
+                        hash_expressoes: str) -> TextoAnalisado:
+        """Texto analisado com as características lidas do armazém, ou calculadas e guardadas.
+
+        Args:
+            texto (str): Texto original.
+            id_texto (Any): Identificador do texto (serializável em JSON).
+            trie_expressoes (TrieExpressoes): Árvore de expressões.
+            hash_expressoes (str): Hash do conteúdo das expressões (`registro.hash_expressoes`).
+
+        Returns:
+            TextoAnalisado: Texto com número de sentenças, de tokens e expressões por sentença
+            já calculados.
+        """
+        chave = (json.dumps(id_texto), CacheResultados.hash_texto(texto))
+        with self._trava:
+            linha = self._conexao.execute(
+                'SELECT hash_expressoes, qtd_sentencas, qtd_tokens, qtd_sentencas_com_expressao, expressoes'
+                ' FROM caracteristicas WHERE id = ? AND hash_texto = ?', chave
+            ).fetchone()
+            if linha is not None and linha[0] == hash_expressoes:
+                self.acertos += 1
+            else:
+                self.faltas += 1
+                linha = None
+
+        if linha is not None:
+            _, qtd_sentencas, qtd_tokens, qtd_sentencas_com_expressao, indices = linha
+            expressoes = trie_expressoes.expressoes
+            texto_analisado = TextoAnalisado(texto, trie_expressoes, id_texto)
+            # As características guardadas ocupam o lugar das propriedades memorizadas
+            texto_analisado.__dict__.update(
+                qtd_sentencas=qtd_sentencas,
+                qtd_tokens=qtd_tokens,
+                qtd_sentencas_com_expressao=qtd_sentencas_com_expressao,
+                expressoes_sentencas=[None if indice == SEM_EXPRESSAO else expressoes[indice]
+                                      for indice in array('q', indices)],
+            )
+            return texto_analisado
+
+        texto_analisado = TextoAnalisado(texto, trie_expressoes, id_texto)
+        self._guardar(chave, texto_analisado, hash_expressoes)
+        return texto_analisado
+
+    def _guardar(self, chave: tuple, texto_analisado: TextoAnalisado, hash_expressoes: str) -> None:
+        """Calcula as características de um texto e as grava no armazém."""
+        texto = texto_analisado.texto
+        spans = texto_analisado.spans_sentencas
+        indices = array('q', (SEM_EXPRESSAO if indice is None else indice
+                              for indice in texto_analisado.trie_expressoes.buscar_indices_spans(texto, spans)))
+        expressoes = texto_analisado.trie_expressoes.expressoes
+        tokens = tokenizar(texto)
+        frequencias = Counter(map(str.lower, tokens))
+
+        texto_analisado.__dict__.update(
+            qtd_tokens=len(tokens),
+            expressoes_sentencas=[None if indice == SEM_EXPRESSAO else expressoes[indice] for indice in indices],
+        )
+        linha = (*chave, hash_expressoes, len(spans), len(tokens), texto_analisado.qtd_sentencas_com_expressao,
+                 json.dumps(frequencias, ensure_ascii=False), indices.tobytes(),
+                 zlib.compress(texto.encode('utf-8', 'surrogatepass'), 1))
+
+        with self._trava:
+            self._conexao.execute('INSERT OR REPLACE INTO caracteristicas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', linha)
+            self._pendentes += 1
+            if self._pendentes >= self.gravacoes_por_transacao:
+                self._conexao.commit()
+                self._pendentes = 0
+
+    def textos(self) -> Iterator[Dict[str, Any]]:
+        """Textos guardados, no formato de entrada de `aplica_regras`.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Dicionários com 'id' e 'texto'.
+        """
+        ultimo = 0
+        while True:
+            # Leitura em páginas: o armazém pode ser maior que a memória disponível
+            with self._trava:
+                linhas = self._conexao.execute(
+                    'SELECT rowid, id, texto FROM caracteristicas WHERE rowid > ? ORDER BY rowid LIMIT 1000',
+                    (ultimo,)
+                ).fetchall()
+            if not linhas:
+                return
+            for ultimo, id_texto, texto in linhas:
+                yield {'id': json.loads(id_texto), 'texto': zlib.decompress(texto).decode('utf-8', 'surrogatepass')}
+
+    def caracteristicas(self, id_texto: Any) -> Optional[Dict[str, Any]]:
+        """Características guardadas para um id (a versão mais recente do texto).
+
+        Args:
+            id_texto (Any): Identificador do texto.
+
+        Returns:
+            Optional[Dict[str, Any]]: Dicionário com 'qtd_sentencas', 'qtd_tokens',
+            'qtd_sentencas_com_expressao', 'frequencias' ({token em minúsculas: ocorrências})
+            e 'expressoes' (índice da expressão de cada sentença, -1 se não houver), ou None.
+        """
+        with self._trava:
+            linha = self._conexao.execute(
+                'SELECT qtd_sentencas, qtd_tokens, qtd_sentencas_com_expressao, frequencias, expressoes'
+                ' FROM caracteristicas WHERE id = ? ORDER BY rowid DESC LIMIT 1', (json.dumps(id_texto),)
+            ).fetchone()
+        if linha is None:
+            return None
+        qtd_sentencas, qtd_tokens, qtd_sentencas_com_expressao, frequencias, indices = linha
+        return {
+            'qtd_sentencas': qtd_sentencas,
+            'qtd_tokens': qtd_tokens,
+            'qtd_sentencas_com_expressao': qtd_sentencas_com_expressao,
+            'frequencias': json.loads(frequencias),
+            'expressoes': array('q', indices).tolist(),
+        }
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Contadores do armazém.
+
+        Returns:
+            Dict[str, Any]: Textos guardados, acertos, faltas e taxa de acerto.
+        """
+        textos = len(self)
+        with self._trava:
+            consultas = self.acertos + self.faltas
+            return {
+                'textos': textos,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            }
@@ -0,0 +1,168 @@
+"""artefato_regras.py
+============================
+Artefato binário pré-compilado com as regras e as expressões prontas para uso.
+
+Na inicialização, cada processo lê o arquivo de regras, analisa cada regra com as
+expressões regulares de `ParserRegras`, gera e compila o avaliador e tokeniza as
+expressões para montar a árvore. Em workers de vida curta (funções serverless,
+contêineres por tarefa), esse custo se repete a cada invocação.
+
+O artefato guarda o resultado desse trabalho: as linhas originais, as regras
+estruturadas, o código-fonte do avaliador (e o seu código compilado, válido para
+a mesma versão do Python) e a árvore de expressões já construída. Ao carregar, nada
+é analisado por expressões regulares: o avaliador é recriado a partir do código
+compilado (ou, em outra versão do Python, da fonte gerada) e a árvore é reconstruída
+diretamente. O formato é versionado; um artefato de formato diferente é recusado.
+
+O conteúdo é serializado com `marshal`: carregue apenas artefatos de origem confiável,
+como os próprios arquivos de regras.
+
+Exemplo:
+    compilar_artefato("regras.bin")                             # no build
+    registro.instalar_artefato(carregar_artefato("regras.bin"))  # no worker
+    aplica_regras(textos)
+
+Classes e funções:
+- ArtefatoRegras: recursos carregados de um artefato
+- gerar_artefato: serializa as regras e expressões atuais em bytes
+- compilar_artefato: grava o artefato em um arquivo
+- ler_artefato: reconstrói os recursos a partir dos bytes de um artefato
+- carregar_artefato: lê um artefato de um arquivo
+"""
+from typing import Any, Callable, Dict, List, Set
+import marshal
+import os
+import struct
+import sys
+
+from analizador_de_texto.compilador_regras import compilar_fonte, criar_avaliador, gerar_fonte
+from analizador_de_texto.parser_regras import Condicao
+from analizador_de_texto.registro import registro
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+
+# Identificação do arquivo e versão do formato
+ASSINATURA = b'ADTREGRA'
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct('<8sH')
+
+
+class ArtefatoRegras:
+    """Regras e expressões reconstruídas de um artefato, prontas para `registro.instalar_artefato`."""
+
+    def __init__(self, conteudo: Dict[str, Any]):
+        """Reconstrói os recursos a partir do conteúdo desserializado.
+
+        Args:
+            conteudo (Dict[str, Any]): Conteúdo gravado por `gerar_artefato`.
+        """
+        self.arquivo_regras = conteudo['arquivo_regras']
+        self.arquivo_expressoes = conteudo['arquivo_expressoes']
+        self.regras: List[str] = conteudo['regras']
+        self.expressoes: List[str] = conteudo['expressoes']
+        self.regras_estruturadas = [
+            {'regra': regra, 'categoria': categoria,
+             'condicoes': [Condicao(*condicao) for condicao in condicoes]}
+            for regra, categoria, condicoes in conteudo['regras_estruturadas']
+        ]
+
+        # O código compilado só é compatível com a versão do Python que o gerou
+        self.codigo_reutilizado = conteudo['versao_python'] == sys.implementation.cache_tag
+        codigo = marshal.loads(conteudo['codigo']) if self.codigo_reutilizado else None
+        self.avaliador_regras: Callable[[TextoAnalisado], Set[str]] = criar_avaliador(conteudo['fonte'], codigo)
+        self.trie_expressoes = TrieExpressoes.de_estado(conteudo['trie'])
+
+
+def gerar_artefato(arquivo_regras: str = "regras_linguagem_natural.txt",
+                   arquivo_expressoes: str = "expressoes.txt") -> bytes:
+    """Serializa as regras e expressões atuais em um artefato.
+
+    Args:
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        bytes: Conteúdo do artefato.
+    """
+    regras_estruturadas = registro.regras_estruturadas(arquivo_regras)
+    fonte = gerar_fonte(regras_estruturadas)
+    conteudo = {
+        'arquivo_regras': arquivo_regras,
+        'arquivo_expressoes': arquivo_expressoes,
+        'regras': registro.regras(arquivo_regras),
+        'expressoes': registro.expressoes(arquivo_expressoes),
+        'regras_estruturadas': [
+            (regra['regra'], regra['categoria'], [tuple(condicao) for condicao in regra['condicoes']])
+            for regra in regras_estruturadas
+        ],
+        'versao_python': sys.implementation.cache_tag,
+        'fonte': fonte,
+        'codigo': marshal.dumps(compilar_fonte(fonte)),
+        'trie': registro.trie_expressoes(arquivo_expressoes).estado(),
+    }
+    return _CABECALHO.pack(ASSINATURA, VERSAO_FORMATO) + marshal.dumps(conteudo)
+
+
+def compilar_artefato(destino: str, arquivo_regras: str = "regras_linguagem_natural.txt",
+                      arquivo_expressoes: str = "expressoes.txt") -> int:
+    """Grava o artefato das regras e expressões em um arquivo.
+
+    O arquivo é escrito em um temporário e renomeado: workers que o leem ao mesmo
+    tempo veem o artefato anterior ou o novo, nunca um arquivo incompleto.
+
+    Args:
+        destino (str): Caminho do artefato.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        int: Tamanho do artefato, em bytes.
+    """
+    dados = gerar_artefato(arquivo_regras, arquivo_expressoes)
+    temporario = f'{destino}.{os.getpid()}.tmp'
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(dados)
+    os.replace(temporario, destino)
+    return len(dados)
+
+
+def ler_artefato(dados: bytes) -> ArtefatoRegras:
+    """Reconstrói os recursos a partir dos bytes de um artefato.
+
+    Args:
+        dados (bytes): Conteúdo gerado por `gerar_artefato`.
+
+    Returns:
+        ArtefatoRegras: Regras e expressões prontas para uso.
+
+    Raises:
+        ValueError: Se os dados não forem um artefato ou forem de outra versão do formato.
+    """
+    if len(dados) < _CABECALHO.size:
+        raise ValueError("Artefato de regras inválido: arquivo truncado")
+    assinatura, versao = _CABECALHO.unpack_from(dados)
+    if assinatura != ASSINATURA:
+        raise ValueError("Arquivo não é um artefato de regras")
+    if versao != VERSAO_FORMATO:
+        raise ValueError(f"Versão do artefato de regras não suportada: {versao} (esperada: {VERSAO_FORMATO})")
+    try:
+        conteudo = marshal.loads(memoryview(dados)[_CABECALHO.size:])
+    except (EOFError, TypeError, ValueError) as erro:
+        raise ValueError(f"Artefato de regras corrompido: {erro}") from erro
+    return ArtefatoRegras(conteudo)
+
+
+def carregar_artefato(caminho: str) -> ArtefatoRegras:
+    """Lê um artefato de um arquivo.
+
+    Args:
+        caminho (str): Caminho do artefato gravado por `compilar_artefato`.
+
+    Returns:
+        ArtefatoRegras: Regras e expressões prontas para uso.
+
+    Raises:
+        ValueError: Se o arquivo não for um artefato válido desta versão do formato.
+    """
+    with open(caminho, 'rb') as arquivo:
+        return ler_artefato(arquivo.read())
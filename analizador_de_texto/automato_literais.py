@@ -0,0 +1,136 @@
+"""automato_literais.py
+============================
+Contagem de todos os literais das regras em uma única passada pelo texto (Aho-Corasick).
+
+As condições `"X" aparece no texto` e `número de "X" ...` procuram cada literal no
+texto em minúsculas com `in` ou `str.count`: com K literais, são K passadas por
+texto. `AutomatoLiterais` reúne os literais em um autômato de Aho-Corasick e obtém
+a contagem de todos eles em uma única passada.
+
+A contagem é a mesma de `str.count` (e de `utils.contar_ocorrencias_token`): as
+ocorrências de um mesmo literal não se sobrepõem e são tomadas da esquerda para a
+direita, enquanto ocorrências de literais diferentes são independentes (ex.: em
+"aaaa", "aa" conta 2 e "a" conta 4). A presença de um literal equivale a uma
+contagem maior que zero.
+
+Cada passada de `str.count` é feita em C, enquanto o autômato percorre o texto
+caractere a caractere em Python: o autômato só compensa a partir de pouco mais de
+uma centena de literais (`LIMIAR_LITERAIS`, medido com `benchmarks.bench_automato_literais`).
+
+Classes:
+- AutomatoLiterais: autômato de Aho-Corasick que conta todos os literais em uma passada
+"""
+from collections import deque
+from typing import Dict, Iterable, List
+import threading
+
+# Número de literais a partir do qual o autômato é mais rápido que uma passada por literal
+LIMIAR_LITERAIS = 150
+
+
+class AutomatoLiterais:
+    """Autômato de Aho-Corasick sobre literais em minúsculas, construído no primeiro uso."""
+
+    def __init__(self, literais: Iterable[str]):
+        """Guarda os literais; o autômato é construído na primeira contagem.
+
+        Args:
+            literais (Iterable[str]): Literais em minúsculas (repetições são ignoradas).
+        """
+        self.literais: List[str] = list(dict.fromkeys(literais))
+        self._transicoes = None
+        self._trava = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.literais)
+
+    def _construir(self) -> None:
+        """Constrói a árvore de prefixos, as transições de falha e as saídas de cada estado."""
+        transicoes = [{}]
+        saidas = [[]]
+        for indice, literal in enumerate(self.literais):
+            if not literal:
+                continue
+            estado = 0
+            for caractere in literal:
+                proximo = transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = transicoes[estado][caractere] = len(transicoes)
+                    transicoes.append({})
+                    saidas.append([])
+                estado = proximo
+            saidas[estado].append(indice)
+
+        # Em largura: a falha de um estado é o maior sufixo próprio que também é um prefixo;
+        # as saídas incluem as dos estados de falha (literais que terminam na mesma posição)
+        falhas = [0] * len(transicoes)
+        fila = deque(transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, proximo in transicoes[estado].items():
+                fila.append(proximo)
+                falha = falhas[estado]
+                while falha and caractere not in transicoes[falha]:
+                    falha = falhas[falha]
+                falha = transicoes[falha].get(caractere, 0)
+                falhas[proximo] = falha if falha != proximo else 0
+                saidas[proximo] = saidas[proximo] + saidas[falhas[proximo]]
+
+        # Saídas de cada estado como (índice do literal, comprimento), ou None;
+        # `_transicoes` é atribuído por último, pois indica que o autômato está pronto
+        comprimentos = [len(literal) for literal in self.literais]
+        self._saidas = [[(indice, comprimentos[indice]) for indice in indices] or None for indices in saidas]
+        self._falhas = falhas
+        self._transicoes = transicoes
+
+    def _resolver(self, estado: int, caractere: str) -> int:
+        """Próximo estado seguindo as transições de falha, memorizado na transição do estado."""
+        transicoes, falhas = self._transicoes, self._falhas
+        atual = estado
+        proximo = transicoes[atual].get(caractere)
+        while proximo is None and atual:
+            atual = falhas[atual]
+            proximo = transicoes[atual].get(caractere)
+        if proximo is None:
+            proximo = 0
+        # Os caracteres já vistos passam a ter transição direta (o autômato vira um DFA aos poucos);
+        # entre threads, a escrita é idempotente: todas gravariam o mesmo estado
+        transicoes[estado][caractere] = proximo
+        return proximo
+
+    def contar(self, texto_lower: str) -> Dict[str, int]:
+        """Conta as ocorrências de todos os literais no texto, em uma única passada.
+
+        Args:
+            texto_lower (str): Texto em minúsculas.
+
+        Returns:
+            Dict[str, int]: Para cada literal, o mesmo valor de `texto_lower.count(literal)`.
+        """
+        if self._transicoes is None:
+            with self._trava:
+                if self._transicoes is None:
+                    self._construir()
+        transicoes, saidas, resolver = self._transicoes, self._saidas, self._resolver
+
+        contagens = [0] * len(self.literais)
+        # Fim da última ocorrência contada de cada literal (as de um mesmo literal não se sobrepõem)
+        fins = [0] * len(self.literais)
+        estado = 0
+        for posicao, caractere in enumerate(texto_lower, 1):
+            proximo = transicoes[estado].get(caractere)
+            if proximo is None:
+                proximo = resolver(estado, caractere)
+            estado = proximo
+            saida = saidas[estado]
+            if saida is not None:
+                for indice, comprimento in saida:
+                    if posicao - comprimento >= fins[indice]:
+                        contagens[indice] += 1
+                        fins[indice] = posicao
+
+        resultado = dict(zip(self.literais, contagens))
+        if '' in resultado:
+            # Mesmo valor de str.count para o literal vazio
+            resultado[''] = len(texto_lower) + 1
+        return resultado
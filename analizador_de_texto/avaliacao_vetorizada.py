@@ -0,0 +1,272 @@
+"""avaliacao_vetorizada.py
+============================
+Avaliação vetorizada das regras sobre uma matriz de características de um lote.
+
+Todas as condições do `ParserRegras` são comparações numéricas (ou testes de
+presença) sobre poucas características de cada texto: número de sentenças, de
+tokens, de sentenças com expressão e ocorrências de literais. Para lotes grandes,
+essas características são extraídas uma única vez para uma matriz NumPy
+(textos × características); cada regra passa a ser uma máscara booleana calculada
+sobre o lote inteiro, e as categorias de cada texto são montadas ao final.
+
+Comparações repetidas entre regras (mesma característica, operador e valor) são
+calculadas uma única vez por lote. O resultado é o mesmo de `aplica_regras`; a
+instrumentação e o cache de resultados não se aplicam a este caminho.
+
+Requer o NumPy (opcional): sem ele, apenas o planejamento das colunas
+(`AvaliadorVetorizado.colunas`) e a extração das características estão disponíveis.
+
+Classes e funções:
+- AvaliadorVetorizado: planeja as colunas, extrai a matriz e avalia as regras por máscaras
+- aplica_regras_vetorizado_iter: versão vetorizada (em lotes) de `aplica_regras_iter`
+- aplica_regras_vetorizado: versão vetorizada de `aplica_regras`
+"""
+from array import array
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from analizador_de_texto.registro import registro
+from analizador_de_texto.texto_analisado import TextoAnalisado
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional
+    numpy = None
+
+# Coluna da matriz de características: (característica, literal em minúsculas ou None)
+Coluna = Tuple[str, Optional[str]]
+
+# Comparação de uma condição: (posição da coluna, operador, valor)
+Comparacao = Tuple[int, str, int]
+
+# Operadores das regras em linguagem natural e as funções NumPy correspondentes
+COMPARADORES = {
+    'maior': 'greater',
+    'menor': 'less',
+    'igual': 'equal',
+    'maior ou igual': 'greater_equal',
+    'menor ou igual': 'less_equal',
+}
+
+# Características do texto lidas diretamente das propriedades de TextoAnalisado
+CARACTERISTICAS_TEXTO = {
+    'qtd_sentencas': 'qtd_sentencas',
+    'qtd_tokens': 'qtd_tokens',
+    'qtd_sentencas_expressao': 'qtd_sentencas_com_expressao',
+    'sem_expressoes': 'qtd_sentencas_com_expressao',
+}
+
+
+def _extrator(coluna: Coluna) -> Callable[[TextoAnalisado], int]:
+    """Função que calcula o valor de uma coluna para um texto."""
+    caracteristica, literal = coluna
+    if caracteristica == 'contagem':
+        return lambda texto_analisado: texto_analisado.texto_lower.count(literal)
+    if caracteristica == 'presenca':
+        return lambda texto_analisado: literal in texto_analisado.texto_lower
+    return attrgetter(caracteristica)
+
+
+class AvaliadorVetorizado:
+    """Avaliador de regras por máscaras booleanas sobre uma matriz de características."""
+
+    def __init__(self, regras_estruturadas: List[Dict[str, Any]]):
+        """Planeja as colunas da matriz e as comparações de cada regra.
+
+        Args:
+            regras_estruturadas (List[Dict[str, Any]]): Saída de `ParserRegras.estruturar_regras`.
+        """
+        self.regras = regras_estruturadas
+        self.categorias = sorted({regra['categoria'] for regra in regras_estruturadas})
+        self.colunas: List[Coluna] = []
+        self._posicoes = {}
+
+        # Um literal contado por alguma regra também responde às condições de presença
+        contados = {condicao.argumentos[0].lower() for regra in regras_estruturadas
+                    for condicao in regra['condicoes'] if condicao.tipo == 'qtd_token'}
+
+        # Comparações de cada regra (None: a regra nunca é atendida)
+        self.comparacoes: List[Optional[List[Comparacao]]] = []
+        for regra in regras_estruturadas:
+            comparacoes = []
+            for condicao in regra['condicoes']:
+                comparacao = self._comparacao(condicao.tipo, condicao.argumentos, contados)
+                if comparacao is None:
+                    comparacoes = None
+                    break
+                comparacoes.append(comparacao)
+            self.comparacoes.append(comparacoes)
+
+        self._extratores = [_extrator(coluna) for coluna in self.colunas]
+
+    def _coluna(self, coluna: Coluna) -> int:
+        """Posição de uma coluna na matriz, acrescentando-a se ainda não existir."""
+        posicao = self._posicoes.get(coluna)
+        if posicao is None:
+            posicao = self._posicoes[coluna] = len(self.colunas)
+            self.colunas.append(coluna)
+        return posicao
+
+    def _comparacao(self, tipo: str, argumentos: Tuple[str, ...], contados: set) -> Optional[Comparacao]:
+        """Traduz uma condição estruturada em uma comparação sobre uma coluna.
+
+        Args:
+            tipo (str): Tipo da condição.
+            argumentos (Tuple[str, ...]): Argumentos da condição.
+            contados (set): Literais contados por alguma regra.
+
+        Returns:
+            Optional[Comparacao]: Comparação equivalente, ou None para um operador desconhecido
+            (mesmo comportamento de `ParserRegras._comparar`).
+        """
+        if tipo == 'sem_expressoes':
+            return self._coluna((CARACTERISTICAS_TEXTO[tipo], None)), 'igual', 0
+        if tipo == 'presenca_token':
+            literal = argumentos[0].lower()
+            caracteristica = 'contagem' if literal in contados else 'presenca'
+            return self._coluna((caracteristica, literal)), 'maior', 0
+
+        if tipo == 'qtd_token':
+            literal, operador, _, valor = argumentos
+            coluna = ('contagem', literal.lower())
+        else:
+            operador, _, valor = argumentos
+            coluna = (CARACTERISTICAS_TEXTO[tipo], None)
+        if operador not in COMPARADORES:
+            return None
+        return self._coluna(coluna), operador, int(valor)
+
+    def extrair_caracteristicas(self, textos_analisados: Iterable[TextoAnalisado]) -> Any:
+        """Extrai a matriz de características de um lote.
+
+        Args:
+            textos_analisados (Iterable[TextoAnalisado]): Textos do lote.
+
+        Returns:
+            numpy.ndarray | array: Matriz (textos × colunas) de inteiros; sem o NumPy,
+            um `array.array` com as linhas concatenadas.
+        """
+        extratores = self._extratores
+        valores = array('q')
+        qtd_textos = 0
+        for texto_analisado in textos_analisados:
+            valores.extend([extrator(texto_analisado) for extrator in extratores])
+            qtd_textos += 1
+
+        if numpy is None:
+            return valores
+        return numpy.frombuffer(valores, dtype=numpy.int64).reshape(qtd_textos, len(self.colunas))
+
+    def mascaras(self, matriz: Any) -> Any:
+        """Máscara booleana de cada regra sobre o lote.
+
+        Args:
+            matriz (numpy.ndarray): Saída de `extrair_caracteristicas`.
+
+        Returns:
+            numpy.ndarray: Matriz booleana (textos × regras).
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        if numpy is None:
+            raise ImportError("O NumPy é necessário para a avaliação vetorizada (pip install numpy)")
+
+        # Colunas e máscaras contíguas: cada operação percorre um único bloco de memória
+        colunas = numpy.ascontiguousarray(matriz.T)
+        mascaras = numpy.ones((len(self.regras), matriz.shape[0]), dtype=bool)
+        resultados = {}
+        for mascara, comparacoes in zip(mascaras, self.comparacoes):
+            if comparacoes is None:
+                mascara[:] = False
+                continue
+            for comparacao in comparacoes:
+                resultado = resultados.get(comparacao)
+                if resultado is None:
+                    posicao, operador, valor = comparacao
+                    resultado = resultados[comparacao] = getattr(numpy, COMPARADORES[operador])(
+                        colunas[posicao], valor)
+                mascara &= resultado
+        return mascaras.T
+
+    def categorias_lote(self, matriz: Any) -> List[List[str]]:
+        """Categorias de cada texto do lote.
+
+        Args:
+            matriz (numpy.ndarray): Saída de `extrair_caracteristicas`.
+
+        Returns:
+            List[List[str]]: Categorias atendidas por texto, em ordem alfabética.
+        """
+        mascaras = self.mascaras(matriz).T
+        qtd_textos = matriz.shape[0]
+        atendidas = numpy.zeros((len(self.categorias), qtd_textos), dtype=bool)
+        posicao_categoria = {categoria: posicao for posicao, categoria in enumerate(self.categorias)}
+        for mascara, regra in zip(mascaras, self.regras):
+            atendidas[posicao_categoria[regra['categoria']]] |= mascara
+
+        # nonzero percorre a matriz por linha e, em cada linha, por categoria (já ordenadas)
+        categorias = [[] for _ in range(qtd_textos)]
+        linhas, posicoes = numpy.nonzero(atendidas.T)
+        for linha, posicao in zip(linhas.tolist(), posicoes.tolist()):
+            categorias[linha].append(self.categorias[posicao])
+        return categorias
+
+
+def aplica_regras_vetorizado_iter(informacoes_textos: Iterable[Dict[str, Any]],
+                                  arquivo_regras: str = "regras_linguagem_natural.txt",
+                                  arquivo_expressoes: str = "expressoes.txt",
+                                  textos_por_lote: int = 10_000) -> Iterator[Dict[str, Any]]:
+    """Versão vetorizada de `aplica_regras_iter`: avalia as regras lote a lote.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        textos_por_lote (int): Número de textos por matriz de características.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Dicionários com 'id' e 'categorias', na ordem da entrada.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+    if numpy is None:
+        raise ImportError("O NumPy é necessário para a avaliação vetorizada (pip install numpy)")
+
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    avaliador = AvaliadorVetorizado(registro.regras_estruturadas(arquivo_regras))
+
+    registros = iter(informacoes_textos)
+    while True:
+        lote = list(islice(registros, textos_por_lote))
+        if not lote:
+            return
+        matriz = avaliador.extrair_caracteristicas(
+            TextoAnalisado(info_texto["texto"], trie_expressoes, info_texto["id"]) for info_texto in lote
+        )
+        for info_texto, categorias in zip(lote, avaliador.categorias_lote(matriz)):
+            yield {
+                'id': info_texto["id"],
+                'categorias': categorias
+            }
+
+
+def aplica_regras_vetorizado(informacoes_textos: Iterable[Dict[str, Any]],
+                             arquivo_regras: str = "regras_linguagem_natural.txt",
+                             arquivo_expressoes: str = "expressoes.txt") -> List[Dict[str, Any]]:
+    """Versão vetorizada de `aplica_regras`, para lotes grandes.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        List[Dict[str, Any]]: Mesma saída de `aplica_regras`.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+    return list(aplica_regras_vetorizado_iter(informacoes_textos, arquivo_regras, arquivo_expressoes))
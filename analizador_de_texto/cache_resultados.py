@@ -0,0 +1,209 @@
+"""cache_resultados.py
+============================
+Cache de resultados por conteúdo, para textos reenviados e lotes reprocessados.
+
+A chave de cada resultado combina a tarefa ('expressoes' ou 'categorias'), a
+impressão digital dos recursos usados (hash do conteúdo dos arquivos de regras e
+expressões, fornecido pelo registro) e o hash do texto. O identificador do texto
+não faz parte da chave: o mesmo texto com outro 'id' reaproveita o resultado.
+
+Os resultados ficam em memória em uma lista LRU limitada pelo número de itens e
+pelo total aproximado de bytes. Opcionalmente, também são gravados em um arquivo
+SQLite, que sobrevive a reinícios e é consultado quando o resultado não está em
+memória. Quando o conteúdo de um arquivo de recursos muda (regras ou expressões
+editadas), as entradas produzidas com o conteúdo anterior são descartadas da
+memória e do disco.
+
+Classes:
+- CacheResultados: cache LRU de resultados com contadores e armazenamento opcional em disco
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+import hashlib
+import json
+import sqlite3
+import threading
+
+# Recursos usados por um resultado: pares (nome do arquivo, hash do conteúdo)
+Recursos = Sequence[Tuple[str, str]]
+
+
+class CacheResultados:
+    """Cache LRU de resultados indexado pelo hash do texto e pela impressão digital dos recursos."""
+
+    def __init__(self, max_itens: int = 10_000, max_bytes: int = 64 * 1024 * 1024,
+                 arquivo: Optional[str] = None):
+        """Inicializa o cache.
+
+        Args:
+            max_itens (int): Número máximo de resultados em memória.
+            max_bytes (int): Total aproximado de bytes dos resultados em memória.
+            arquivo (Optional[str]): Arquivo SQLite para armazenamento persistente. Padrão: apenas memória.
+        """
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        self.arquivo = arquivo
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        self.remocoes = 0
+        self.bytes = 0
+        self._trava = threading.Lock()
+        self._itens = OrderedDict()
+        self._hashes_recursos = {}
+        self._conexao = None
+        if arquivo is not None:
+            self._conexao = sqlite3.connect(arquivo, check_same_thread=False)
+            self._conexao.executescript(
+                'CREATE TABLE IF NOT EXISTS resultados ('
+                ' tarefa TEXT, impressao TEXT, hash_texto TEXT, valor TEXT,'
+                ' PRIMARY KEY (tarefa, impressao, hash_texto));'
+                'CREATE TABLE IF NOT EXISTS recursos (nome TEXT PRIMARY KEY, hash TEXT);'
+            )
+            self._hashes_recursos.update(self._conexao.execute('SELECT nome, hash FROM recursos'))
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def __enter__(self) -> 'CacheResultados':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Fecha o arquivo SQLite, se houver."""
+        with self._trava:
+            if self._conexao is not None:
+                self._conexao.close()
+                self._conexao = None
+
+    @staticmethod
+    def hash_texto(texto: str) -> str:
+        """Hash do conteúdo de um texto.
+
+        Args:
+            texto (str): Texto original.
+
+        Returns:
+            str: Hash hexadecimal do texto.
+        """
+        return hashlib.blake2b(texto.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    def _chave(self, tarefa: str, recursos: Recursos, texto: str) -> Tuple[str, str, str]:
+        """Chave de um resultado; descarta antes as entradas de recursos cujo conteúdo mudou (com a trava)."""
+        for nome, hash_recurso in recursos:
+            anterior = self._hashes_recursos.get(nome)
+            if anterior != hash_recurso:
+                self._hashes_recursos[nome] = hash_recurso
+                if anterior is not None and anterior not in self._hashes_recursos.values():
+                    self._descartar_recurso(anterior)
+                if self._conexao is not None:
+                    self._conexao.execute('INSERT OR REPLACE INTO recursos VALUES (?, ?)', (nome, hash_recurso))
+                    self._conexao.commit()
+
+        impressao = '|'.join(hash_recurso for _, hash_recurso in recursos)
+        return tarefa, impressao, self.hash_texto(texto)
+
+    def _descartar_recurso(self, hash_recurso: str) -> None:
+        """Descarta as entradas produzidas com um conteúdo de recurso obsoleto (com a trava)."""
+        for chave in [chave for chave in self._itens if hash_recurso in chave[1].split('|')]:
+            self.bytes -= self._itens.pop(chave)[1]
+            self.remocoes += 1
+        if self._conexao is not None:
+            self._conexao.execute("DELETE FROM resultados WHERE '|' || impressao || '|' LIKE ?",
+                                  (f'%|{hash_recurso}|%',))
+
+    def obter(self, tarefa: str, recursos: Recursos, texto: str) -> Optional[Any]:
+        """Resultado guardado para o texto, ou None.
+
+        Args:
+            tarefa (str): 'expressoes' ou 'categorias'.
+            recursos (Recursos): Pares (nome do arquivo, hash do conteúdo) dos recursos usados.
+            texto (str): Texto original.
+
+        Returns:
+            Optional[Any]: Cópia do resultado guardado, ou None se não houver.
+        """
+        with self._trava:
+            chave = self._chave(tarefa, recursos, texto)
+            item = self._itens.get(chave)
+            if item is not None:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return json.loads(item[0])
+
+            if self._conexao is not None:
+                linha = self._conexao.execute(
+                    'SELECT valor FROM resultados WHERE tarefa = ? AND impressao = ? AND hash_texto = ?',
+                    chave
+                ).fetchone()
+                if linha is not None:
+                    self.acertos_disco += 1
+                    self._guardar_memoria(chave, linha[0])
+                    return json.loads(linha[0])
+
+            self.faltas += 1
+            return None
+
+    def guardar(self, tarefa: str, recursos: Recursos, texto: str, valor: Any) -> None:
+        """Guarda o resultado de um texto.
+
+        Args:
+            tarefa (str): 'expressoes' ou 'categorias'.
+            recursos (Recursos): Pares (nome do arquivo, hash do conteúdo) dos recursos usados.
+            texto (str): Texto original.
+            valor (Any): Resultado serializável em JSON (sem o 'id' do texto).
+        """
+        serializado = json.dumps(valor, ensure_ascii=False)
+        with self._trava:
+            chave = self._chave(tarefa, recursos, texto)
+            self._guardar_memoria(chave, serializado)
+            if self._conexao is not None:
+                self._conexao.execute('INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?)',
+                                      (*chave, serializado))
+                self._conexao.commit()
+
+    def _guardar_memoria(self, chave: Tuple[str, str, str], serializado: str) -> None:
+        """Guarda um resultado serializado em memória, removendo os menos usados (com a trava)."""
+        tamanho = sum(map(len, chave)) + len(serializado)
+        anterior = self._itens.pop(chave, None)
+        if anterior is not None:
+            self.bytes -= anterior[1]
+        if tamanho > self.max_bytes:
+            return
+
+        self._itens[chave] = (serializado, tamanho)
+        self.bytes += tamanho
+        while len(self._itens) > self.max_itens or self.bytes > self.max_bytes:
+            _, (_, tamanho_removido) = self._itens.popitem(last=False)
+            self.bytes -= tamanho_removido
+            self.remocoes += 1
+
+    def limpar(self) -> None:
+        """Descarta todos os resultados, em memória e em disco."""
+        with self._trava:
+            self._itens.clear()
+            self.bytes = 0
+            if self._conexao is not None:
+                self._conexao.execute('DELETE FROM resultados')
+                self._conexao.commit()
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Contadores do cache.
+
+        Returns:
+            Dict[str, Any]: Itens e bytes em memória, acertos (memória e disco), faltas,
+            remoções e taxa de acerto.
+        """
+        with self._trava:
+            consultas = self.acertos + self.acertos_disco + self.faltas
+            return {
+                'itens': len(self._itens),
+                'bytes': self.bytes,
+                'acertos': self.acertos,
+                'acertos_disco': self.acertos_disco,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+                'taxa_acerto': (self.acertos + self.acertos_disco) / consultas if consultas else 0.0,
+            }
@@ -0,0 +1,408 @@
+"""cli.py
+============================
+Interface de linha de comando para processar corpora em fluxo.
+
+Os registros ({"id", "texto"}) são lidos um a um de um arquivo ou da entrada padrão,
+em formato JSONL ou como uma lista JSON, e os resultados são escritos em JSONL à
+medida que são produzidos. O uso de memória não depende do tamanho do corpus.
+
+Uso:
+    python -m analizador_de_texto expressoes corpus.jsonl -o saida.jsonl
+    cat corpus.json | python -m analizador_de_texto categorias > saida.jsonl
+    python -m analizador_de_texto servir --porta 8080
+    python -m analizador_de_texto categorias corpus.jsonl --estado estado.jsonl > categorias.jsonl
+    python -m analizador_de_texto recategorizar estado.jsonl --regras-anteriores antigas.txt \
+        --novo-estado estado2.jsonl > mudancas.jsonl
+    python -m analizador_de_texto compilar-regras -o regras.bin
+    python -m analizador_de_texto categorias corpus.jsonl --artefato regras.bin
+    python -m analizador_de_texto estatisticas corpus.jsonl > totais.json
+    python -m analizador_de_texto daemon &   # clientes: python -m analizador_de_texto.cliente_daemon
+
+Funções:
+- main: ponto de entrada da linha de comando
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TextIO
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import signal
+import sqlite3
+import sys
+
+from analizador_de_texto.artefato_regras import carregar_artefato, compilar_artefato
+from analizador_de_texto.armazem_caracteristicas import ArmazemCaracteristicas
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.daemon import DaemonClassificacao
+from analizador_de_texto.estatisticas_expressoes import estatisticas_expressoes
+from analizador_de_texto.instrumentacao import instrumentar
+from analizador_de_texto.problema1 import encontra_expressoes_iter
+from analizador_de_texto.problema2 import aplica_regras_iter
+from analizador_de_texto.recategorizacao import gerar_estado_iter, recategorizar_iter
+from analizador_de_texto.registro import ARQUIVO_EXPRESSOES, ARQUIVO_REGRAS, registro
+from analizador_de_texto.servico import ServicoClassificacao
+from analizador_de_texto.utils import ler_regras, ler_registros_json
+
+
+def _abrir(caminho: str, modo: str, padrao: TextIO) -> TextIO:
+    """Abre um arquivo em UTF-8 ('-' para a entrada ou saída padrão)."""
+    if caminho != '-':
+        return open(caminho, modo, encoding='utf-8')
+    if hasattr(padrao, 'reconfigure'):
+        padrao.reconfigure(encoding='utf-8')
+    return padrao
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser com os subcomandos disponíveis.
+    """
+    parser = argparse.ArgumentParser(
+        prog='analizador-de-texto',
+        description='Processa textos em fluxo (JSONL ou lista JSON) e escreve os resultados em JSONL.'
+    )
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    for comando, ajuda in (('expressoes', 'verifica expressões no início das sentenças (problema 1)'),
+                           ('categorias', 'categoriza os textos pelas regras (problema 2)')):
+        subparser = subparsers.add_parser(comando, help=ajuda)
+        subparser.add_argument('entrada', nargs='?', default='-',
+                               help="arquivo JSONL ou JSON de entrada ('-' para a entrada padrão)")
+        subparser.add_argument('-o', '--saida', default='-',
+                               help="arquivo JSONL de saída ('-' para a saída padrão)")
+        subparser.add_argument('--expressoes', default='expressoes.txt',
+                               help='arquivo de expressões (padrão: o do pacote)')
+        subparser.add_argument('--cache', metavar='ARQUIVO',
+                               help='arquivo SQLite com resultados já calculados (reutilizados entre execuções)')
+        subparser.add_argument('--instrumentar', action='store_true',
+                               help='escreve na saída de erro um relatório de tempo por etapa e por regra')
+        subparser.add_argument('--artefato', metavar='ARQUIVO',
+                               help='artefato pré-compilado (compilar-regras) usado no lugar da análise das regras')
+        if comando == 'categorias':
+            subparser.add_argument('--regras', default='regras_linguagem_natural.txt',
+                                   help='arquivo de regras (padrão: o do pacote)')
+            subparser.add_argument('--armazem', metavar='ARQUIVO',
+                                   help='arquivo SQLite com as características dos textos já analisados '
+                                        '(reaproveitadas mesmo com regras diferentes)')
+            subparser.add_argument('--estado', metavar='ARQUIVO',
+                                   help='grava em JSONL as características e categorias de cada texto '
+                                        '(usado pelo comando recategorizar)')
+
+    estatisticas = subparsers.add_parser(
+        'estatisticas', help='conta as expressões no início das sentenças, sem a saída por sentença')
+    estatisticas.add_argument('entrada', nargs='?', default='-',
+                              help="arquivo JSONL ou JSON de entrada ('-' para a entrada padrão)")
+    estatisticas.add_argument('-o', '--saida', default='-',
+                              help="arquivo JSON com os totais do corpus ('-' para a saída padrão)")
+    estatisticas.add_argument('--expressoes', default='expressoes.txt', help='arquivo de expressões (padrão: o do pacote)')
+    estatisticas.add_argument('--artefato', metavar='ARQUIVO',
+                              help='artefato pré-compilado (compilar-regras) usado no lugar da análise das regras')
+
+    recategorizar = subparsers.add_parser(
+        'recategorizar', help='reavalia apenas as categorias afetadas pela mudança das regras')
+    recategorizar.add_argument('estado', help='arquivo JSONL gravado por categorias --estado')
+    recategorizar.add_argument('--regras-anteriores', required=True,
+                               help='caminho de uma cópia do arquivo de regras usado para gravar o estado')
+    recategorizar.add_argument('--regras', default=ARQUIVO_REGRAS,
+                               help='caminho do arquivo de regras atual (padrão: o do pacote)')
+    recategorizar.add_argument('--textos', metavar='ARQUIVO',
+                               help='corpus original (JSONL ou JSON), necessário se uma regra nova citar '
+                                    'um literal não contado no estado')
+    recategorizar.add_argument('--expressoes', default='expressoes.txt', help='arquivo de expressões (padrão: o do pacote)')
+    recategorizar.add_argument('-o', '--saida', default='-',
+                               help="arquivo JSONL com os textos cujas categorias mudaram ('-' para a saída padrão)")
+    recategorizar.add_argument('--novo-estado', metavar='ARQUIVO', help='grava o estado atualizado')
+
+    compilar = subparsers.add_parser(
+        'compilar-regras', help='grava as regras e expressões em um artefato pré-compilado')
+    compilar.add_argument('-o', '--saida', required=True, help='arquivo do artefato')
+    compilar.add_argument('--regras', default='regras_linguagem_natural.txt', help='arquivo de regras (padrão: o do pacote)')
+    compilar.add_argument('--expressoes', default='expressoes.txt', help='arquivo de expressões (padrão: o do pacote)')
+
+    servir = subparsers.add_parser('servir', help='inicia o serviço HTTP com micro-lotes')
+    servir.add_argument('--host', default='127.0.0.1', help='endereço de escuta')
+    servir.add_argument('--porta', type=int, default=8080, help='porta de escuta')
+    servir.add_argument('--max-lote', type=int, default=64, help='número máximo de textos por micro-lote')
+    servir.add_argument('--max-espera-ms', type=float, default=5.0,
+                        help='tempo máximo de espera para completar um micro-lote, em milissegundos')
+    servir.add_argument('--expressoes', default='expressoes.txt', help='arquivo de expressões (padrão: o do pacote)')
+    servir.add_argument('--regras', default='regras_linguagem_natural.txt', help='arquivo de regras (padrão: o do pacote)')
+    servir.add_argument('--cache', metavar='ARQUIVO', nargs='?', const=':memory:',
+                        help='mantém um cache de resultados (em memória ou no arquivo SQLite indicado)')
+    servir.add_argument('--artefato', metavar='ARQUIVO',
+                        help='artefato pré-compilado (compilar-regras) usado no lugar da análise das regras')
+
+    daemon = subparsers.add_parser(
+        'daemon', help='mantém regras e expressões carregadas e atende clientes por um Unix socket')
+    daemon.add_argument('--socket', help='caminho do socket. Padrão: $ANALIZADOR_SOCKET ou um arquivo por usuário')
+    daemon.add_argument('--threads', type=int, default=4, help='número de requisições processadas ao mesmo tempo')
+    daemon.add_argument('--expressoes', default='expressoes.txt', help='arquivo de expressões (padrão: o do pacote)')
+    daemon.add_argument('--regras', default='regras_linguagem_natural.txt', help='arquivo de regras (padrão: o do pacote)')
+    daemon.add_argument('--artefato', metavar='ARQUIVO',
+                        help='artefato pré-compilado (compilar-regras) usado no lugar da análise das regras')
+
+    return parser
+
+
+def _criar_cache(arquivo: Optional[str]) -> Optional[CacheResultados]:
+    """Cria o cache de resultados pedido na linha de comando (ou None)."""
+    if arquivo is None:
+        return None
+    return CacheResultados(arquivo=None if arquivo == ':memory:' else arquivo)
+
+
+def _resolver_caminhos(argumentos: argparse.Namespace) -> None:
+    """Torna absolutos os arquivos de regras e expressões informados pelo usuário.
+
+    Os nomes padrão continuam apontando para a pasta de dados do pacote; os demais
+    caminhos são relativos ao diretório atual.
+    """
+    for atributo, padrao in (('regras', ARQUIVO_REGRAS), ('expressoes', ARQUIVO_EXPRESSOES)):
+        caminho = getattr(argumentos, atributo, None)
+        if caminho is not None and caminho != padrao:
+            setattr(argumentos, atributo, os.path.abspath(caminho))
+
+
+def _instalar_artefato(argumentos: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Instala no registro o artefato pedido na linha de comando, se houver."""
+    if argumentos.artefato is None:
+        return
+    try:
+        registro.instalar_artefato(carregar_artefato(argumentos.artefato))
+    except (OSError, ValueError) as erro:
+        parser.error(str(erro))
+
+
+def _compilar_regras(argumentos: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Grava o artefato pré-compilado das regras e expressões."""
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            tamanho = compilar_artefato(argumentos.saida, argumentos.regras, argumentos.expressoes)
+    except OSError as erro:
+        parser.error(str(erro))
+    print(f"Artefato gravado em {argumentos.saida} ({tamanho} bytes)", file=sys.stderr)
+    return 0
+
+
+def _servir(argumentos: argparse.Namespace) -> int:
+    """Executa o serviço HTTP até o processo ser interrompido."""
+    servico = ServicoClassificacao(
+        host=argumentos.host,
+        porta=argumentos.porta,
+        max_lote=argumentos.max_lote,
+        max_espera=argumentos.max_espera_ms / 1000,
+        arquivo_regras=argumentos.regras,
+        arquivo_expressoes=argumentos.expressoes,
+        cache=_criar_cache(argumentos.cache)
+    )
+
+    async def executar():
+        host, porta = await servico.iniciar()
+        print(f"Serviço disponível em http://{host}:{porta}", file=sys.stderr)
+        try:
+            await servico.servir_para_sempre()
+        finally:
+            await servico.encerrar()
+
+    try:
+        asyncio.run(executar())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _daemon(argumentos: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Executa o daemon até o processo ser interrompido (SIGINT ou SIGTERM)."""
+    daemon = DaemonClassificacao(
+        caminho_socket=argumentos.socket,
+        arquivo_regras=argumentos.regras,
+        arquivo_expressoes=argumentos.expressoes,
+        executor=ThreadPoolExecutor(max_workers=argumentos.threads)
+    )
+
+    async def executar():
+        try:
+            caminho = await daemon.iniciar()
+        except (OSError, RuntimeError) as erro:
+            parser.error(str(erro))
+        print(f"Daemon disponível em {caminho}", file=sys.stderr)
+        servir = asyncio.ensure_future(daemon.servir_para_sempre())
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, servir.cancel)
+        try:
+            await servir
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await daemon.encerrar()
+            daemon.executor.shutdown(wait=False)
+
+    try:
+        asyncio.run(executar())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _escrever(saida: TextIO, registro_json: Dict[str, Any]) -> None:
+    """Escreve um registro JSONL."""
+    saida.write(json.dumps(registro_json, ensure_ascii=False))
+    saida.write('\n')
+
+
+def _estatisticas(argumentos: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Escreve os totais do corpus (contagem de cada expressão e proporção de sentenças com expressão)."""
+    try:
+        entrada = _abrir(argumentos.entrada, 'r', sys.stdin)
+        saida = _abrir(argumentos.saida, 'w', sys.stdout)
+    except OSError as erro:
+        parser.error(str(erro))
+
+    try:
+        estatisticas = estatisticas_expressoes(ler_registros_json(entrada), argumentos.expressoes, por_texto=False)
+        _escrever(saida, estatisticas.resumo())
+    except ValueError as erro:
+        print(f"ERRO: {erro}", file=sys.stderr)
+        return 1
+    finally:
+        saida.flush()
+        if argumentos.entrada != '-':
+            entrada.close()
+        if argumentos.saida != '-':
+            saida.close()
+    return 0
+
+
+def _recategorizar(argumentos: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    """Recategoriza o estado gravado, escrevendo apenas os textos cujas categorias mudaram."""
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            # A cópia das regras anteriores é um arquivo do usuário, fora da pasta de dados
+            regras_antigas = ler_regras(os.path.abspath(argumentos.regras_anteriores))
+            regras_novas = ler_regras(argumentos.regras)
+        textos = None
+        if argumentos.textos is not None:
+            with open(argumentos.textos, encoding='utf-8') as arquivo_textos:
+                textos = {info_texto['id']: info_texto['texto'] for info_texto in ler_registros_json(arquivo_textos)}
+        with open(argumentos.estado, encoding='utf-8') as arquivo_estado:
+            estados = list(ler_registros_json(arquivo_estado))
+        saida = _abrir(argumentos.saida, 'w', sys.stdout)
+    except (OSError, ValueError) as erro:
+        parser.error(str(erro))
+
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            mudancas = list(recategorizar_iter(estados, regras_antigas, regras_novas, textos,
+                                               argumentos.expressoes))
+        for mudanca in mudancas:
+            _escrever(saida, mudanca)
+        if argumentos.novo_estado is not None:
+            with open(argumentos.novo_estado, 'w', encoding='utf-8') as novo_estado:
+                for estado in estados:
+                    _escrever(novo_estado, estado)
+    except ValueError as erro:
+        print(f"ERRO: {erro}", file=sys.stderr)
+        return 1
+    finally:
+        saida.flush()
+        if argumentos.saida != '-':
+            saida.close()
+
+    print(f"{len(mudancas)} de {len(estados)} textos mudaram de categorias", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Executa a linha de comando.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (sem o nome do programa). Padrão: sys.argv.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    parser = criar_parser()
+    argumentos = parser.parse_args(argv)
+    _resolver_caminhos(argumentos)
+
+    if argumentos.comando == 'compilar-regras':
+        return _compilar_regras(argumentos, parser)
+    if argumentos.comando == 'recategorizar':
+        return _recategorizar(argumentos, parser)
+    _instalar_artefato(argumentos, parser)
+
+    # Avisos do parser de regras não podem se misturar à saída JSONL
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            if argumentos.comando in ('expressoes', 'estatisticas'):
+                registro.trie_expressoes(argumentos.expressoes)
+            else:
+                registro.precarregar(argumentos.regras, argumentos.expressoes)
+    except FileNotFoundError as erro:
+        parser.error(str(erro))
+
+    if argumentos.comando == 'servir':
+        return _servir(argumentos)
+    if argumentos.comando == 'daemon':
+        with contextlib.redirect_stdout(sys.stderr):
+            return _daemon(argumentos, parser)
+    if argumentos.comando == 'estatisticas':
+        return _estatisticas(argumentos, parser)
+
+    if getattr(argumentos, 'estado', None) is not None and (
+            argumentos.cache is not None or argumentos.armazem is not None):
+        # O estado precisa das contagens de cada texto, que o cache e o armazém não guardam
+        parser.error('--estado não pode ser combinado com --cache ou --armazem')
+
+    estado = None
+    armazem = None
+    try:
+        entrada = _abrir(argumentos.entrada, 'r', sys.stdin)
+        saida = _abrir(argumentos.saida, 'w', sys.stdout)
+        if getattr(argumentos, 'estado', None) is not None:
+            estado = open(argumentos.estado, 'w', encoding='utf-8')
+        if getattr(argumentos, 'armazem', None) is not None:
+            armazem = ArmazemCaracteristicas(argumentos.armazem)
+    except (OSError, sqlite3.Error) as erro:
+        parser.error(str(erro))
+
+    contexto = instrumentar() if argumentos.instrumentar else contextlib.nullcontext()
+    cache = _criar_cache(argumentos.cache)
+    try:
+        with contexto as instrumentacao:
+            registros = ler_registros_json(entrada)
+            if argumentos.comando == 'expressoes':
+                resultados = encontra_expressoes_iter(registros, argumentos.expressoes, cache)
+            elif estado is not None:
+                resultados = gerar_estado_iter(registros, argumentos.regras, argumentos.expressoes)
+            else:
+                resultados = aplica_regras_iter(registros, argumentos.regras, argumentos.expressoes, cache, armazem)
+
+            for resultado in resultados:
+                if estado is not None:
+                    _escrever(estado, resultado)
+                    resultado = {'id': resultado['id'], 'categorias': resultado['categorias']}
+                _escrever(saida, resultado)
+
+        if instrumentacao is not None:
+            print(instrumentacao.relatorio(), file=sys.stderr)
+    except ValueError as erro:
+        print(f"ERRO: {erro}", file=sys.stderr)
+        return 1
+    finally:
+        saida.flush()
+        if cache is not None:
+            cache.fechar()
+        if estado is not None:
+            estado.close()
+        if armazem is not None:
+            armazem.fechar()
+        if argumentos.entrada != '-':
+            entrada.close()
+        if argumentos.saida != '-':
+            saida.close()
+
+    return 0
\ No newline at end of file
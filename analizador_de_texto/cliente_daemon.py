@@ -0,0 +1,176 @@
+"""cliente_daemon.py
+============================
+Cliente leve do daemon local (Unix socket) de verificação de expressões e categorização.
+
+Este módulo usa apenas a biblioteca padrão e não importa o restante do pacote: uma
+chamada pela linha de comando paga apenas a inicialização do interpretador e uma
+ida e volta pelo socket, em vez de importar o pacote e carregar as regras.
+
+A entrada e a saída são as mesmas dos blocos `__main__` de `problema1` e `problema2`
+(lista de registros lida de um arquivo JSON e resultado impresso como lista Python).
+Se o daemon não estiver em execução, o processamento é feito no próprio processo,
+com a mesma saída.
+
+Protocolo: uma requisição JSON por linha ({"comando": ..., "entrada": ..., "textos": ...})
+e uma resposta JSON por linha ({"resultado": ...} ou {"erro": ...}).
+
+Uso:
+    python -m analizador_de_texto daemon &
+    python -m analizador_de_texto.cliente_daemon categorias corpus.json
+    python -m analizador_de_texto.cliente_daemon expressoes
+
+Classes e funções:
+- caminho_socket_padrao: caminho do socket compartilhado pelo daemon e pelos clientes
+- ClienteDaemon: cliente síncrono do daemon
+- main: ponto de entrada do cliente pela linha de comando
+"""
+# Apenas módulos leves: a importação do cliente faz parte da latência de cada chamada
+from typing import Any, Dict, List, Optional
+import json
+import os
+import socket
+import sys
+
+# Comandos atendidos pelo daemon
+COMANDOS = ('expressoes', 'categorias', 'saude', 'recarregar')
+
+USO = ('uso: python -m analizador_de_texto.cliente_daemon {expressoes,categorias} [entrada.json] '
+       '[--socket CAMINHO]')
+
+
+def caminho_socket_padrao() -> str:
+    """Caminho do socket: $ANALIZADOR_SOCKET ou um arquivo por usuário no diretório de execução.
+
+    Returns:
+        str: Caminho do Unix socket.
+    """
+    caminho = os.environ.get('ANALIZADOR_SOCKET')
+    if caminho:
+        return caminho
+    diretorio = os.environ.get('XDG_RUNTIME_DIR') or os.environ.get('TMPDIR') or '/tmp'
+    return os.path.join(diretorio, f'analizador_de_texto-{os.getuid()}.sock')
+
+
+class ClienteDaemon:
+    """Cliente síncrono do daemon, com uma conexão reutilizada entre requisições."""
+
+    def __init__(self, caminho_socket: Optional[str] = None, timeout: Optional[float] = 300.0):
+        """Conecta ao daemon.
+
+        Args:
+            caminho_socket (Optional[str]): Caminho do socket. Padrão: `caminho_socket_padrao()`.
+            timeout (Optional[float]): Tempo máximo, em segundos, de cada requisição.
+
+        Raises:
+            OSError: Se o daemon não estiver em execução.
+        """
+        self.caminho_socket = caminho_socket or caminho_socket_padrao()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(self.caminho_socket)
+        except OSError:
+            self._socket.close()
+            raise
+        self._leitor = self._socket.makefile('rb')
+
+    def __enter__(self) -> 'ClienteDaemon':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o daemon."""
+        self._leitor.close()
+        self._socket.close()
+
+    def requisitar(self, comando: str, **dados: Any) -> Any:
+        """Envia uma requisição e devolve o resultado.
+
+        Args:
+            comando (str): Um dos `COMANDOS`.
+            **dados (Any): Demais campos da requisição ('entrada' ou 'textos').
+
+        Returns:
+            Any: Resultado devolvido pelo daemon.
+
+        Raises:
+            RuntimeError: Se o daemon responder com erro.
+            ConnectionError: Se a conexão for encerrada sem resposta.
+        """
+        requisicao = json.dumps({'comando': comando, **dados}, ensure_ascii=False).encode('utf-8')
+        self._socket.sendall(requisicao + b'\n')
+        linha = self._leitor.readline()
+        if not linha:
+            raise ConnectionError('Conexão encerrada pelo daemon')
+        resposta = json.loads(linha)
+        if 'erro' in resposta:
+            raise RuntimeError(resposta['erro'])
+        return resposta['resultado']
+
+    def encontra_expressoes(self, informacoes_textos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Equivalente remoto de `encontra_expressoes`."""
+        return self.requisitar('expressoes', textos=list(informacoes_textos))
+
+    def aplica_regras(self, informacoes_textos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Equivalente remoto de `aplica_regras`."""
+        return self.requisitar('categorias', textos=list(informacoes_textos))
+
+    def saude(self) -> Dict[str, Any]:
+        """Estado do daemon: requisições atendidas e arquivos de recursos."""
+        return self.requisitar('saude')
+
+    def recarregar(self) -> None:
+        """Descarta as regras e expressões em memória do daemon (relidas na próxima requisição)."""
+        self.requisitar('recarregar')
+
+
+def _processar_localmente(comando: str, entrada: str) -> List[Dict[str, Any]]:
+    """Processa a entrada no próprio processo, como os blocos `__main__` (daemon indisponível)."""
+    from analizador_de_texto.problema1 import encontra_expressoes
+    from analizador_de_texto.problema2 import aplica_regras
+    from analizador_de_texto.utils import ler_entrada_json
+
+    dados_entrada = ler_entrada_json(entrada)
+    return encontra_expressoes(dados_entrada) if comando == 'expressoes' else aplica_regras(dados_entrada)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Executa o cliente pela linha de comando.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (sem o nome do programa). Padrão: sys.argv.
+
+    Returns:
+        int: Código de saída do processo.
+    """
+    argumentos = list(sys.argv[1:] if argv is None else argv)
+    caminho_socket = None
+    if '--socket' in argumentos[:-1]:
+        posicao = argumentos.index('--socket')
+        caminho_socket = argumentos.pop(posicao + 1)
+        del argumentos[posicao]
+    if not 1 <= len(argumentos) <= 2 or argumentos[0] not in ('expressoes', 'categorias') \
+            or argumentos[-1].startswith('-'):
+        print(USO, file=sys.stderr)
+        return 2
+    comando = argumentos[0]
+
+    # Caminhos relativos ao diretório atual (o daemon roda em outro diretório)
+    entrada = os.path.abspath(argumentos[1]) if len(argumentos) > 1 else 'entrada.json'
+    try:
+        with ClienteDaemon(caminho_socket) as cliente:
+            resultado = cliente.requisitar(comando, entrada=entrada)
+    except (FileNotFoundError, ConnectionRefusedError):
+        resultado = _processar_localmente(comando, entrada)
+    except RuntimeError as erro:
+        print(f"ERRO: {erro}", file=sys.stderr)
+        return 1
+
+    print(resultado)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""compilador_regras.py
+============================
+Compilação de um conjunto de regras em uma única função Python especializada.
+
+Em vez de avaliar uma lista de closures aninhadas para cada texto, as regras
+estruturadas por `ParserRegras.estruturar_regras` são traduzidas em código-fonte
+de uma função que:
+- resolve os operadores de comparação em tempo de compilação;
+- encadeia as sub-condições das regras compostas com `and` (curto-circuito);
+- avalia primeiro as condições mais baratas de cada regra;
+- deixa de avaliar uma regra cuja categoria já foi atribuída ao texto;
+- agrupa as regras pelo literal que exigem no texto (`IndiceRegras`): o literal é
+  procurado uma única vez, e as regras do grupo só são avaliadas se ele ocorrer;
+- com muitos literais (`LIMIAR_LITERAIS`), conta todos eles em uma única passada
+  pelo texto (`AutomatoLiterais`) em vez de uma passada por literal;
+- retorna diretamente o conjunto de categorias.
+
+Funções:
+- gerar_fonte: gera o código-fonte da função avaliadora
+- compilar_fonte, criar_avaliador: compilam o código-fonte e criam a função
+- compilar_regras: gera a função avaliadora a partir das regras estruturadas
+"""
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from analizador_de_texto.automato_literais import LIMIAR_LITERAIS
+from analizador_de_texto.parser_regras import Condicao, ParserRegras
+from analizador_de_texto.texto_analisado import TextoAnalisado
+
+# Operadores das regras em linguagem natural e seus equivalentes em Python
+OPERADORES = {
+    'maior': '>',
+    'menor': '<',
+    'igual': '==',
+    'maior ou igual': '>=',
+    'menor ou igual': '<=',
+}
+
+# Custo relativo de cada tipo de condição (quanto maior, mais cara a característica)
+CUSTOS = {
+    'presenca_token': 1,
+    'qtd_token': 1,
+    'qtd_sentencas': 2,
+    'qtd_tokens': 3,
+    'qtd_sentencas_expressao': 4,
+    'sem_expressoes': 4,
+}
+
+NOME_FUNCAO = 'avaliar_regras'
+
+
+def _comparacao(caracteristica: str, operador: str, valor: str) -> str:
+    """Gera o código de uma comparação numérica.
+
+    Args:
+        caracteristica (str): Expressão Python com o valor da característica.
+        operador (str): Operador em linguagem natural (maior, menor, igual, etc.).
+        valor (str): Valor numérico para comparação.
+
+    Returns:
+        str: Código da comparação.
+    """
+    operador_python = OPERADORES.get(operador)
+    if operador_python is None:
+        # Mesmo comportamento de ParserRegras._comparar para operadores desconhecidos
+        return 'False'
+    return f'{caracteristica} {operador_python} {int(valor)}'
+
+
+def _codigo_condicao(condicao: Condicao, automato: bool = False) -> str:
+    """Gera o código Python de uma condição estruturada.
+
+    Args:
+        condicao (Condicao): Condição estruturada.
+        automato (bool): Se as condições sobre literais leem as contagens de `ocorrencias`
+            (obtidas pelo autômato) em vez de procurar o literal em `texto_lower`.
+
+    Returns:
+        str: Expressão Python que avalia a condição sobre `t` (um `TextoAnalisado`)
+        e `texto_lower` (o texto em minúsculas) ou `ocorrencias`.
+    """
+    tipo, argumentos = condicao.tipo, condicao.argumentos
+
+    if tipo == 'qtd_sentencas':
+        operador, _, valor = argumentos
+        return _comparacao('t.qtd_sentencas', operador, valor)
+    if tipo == 'qtd_tokens':
+        operador, _, valor = argumentos
+        return _comparacao('t.qtd_tokens', operador, valor)
+    if tipo == 'presenca_token':
+        token, = argumentos
+        if automato:
+            return f'ocorrencias[{token.lower()!r}] > 0'
+        return f'{token.lower()!r} in texto_lower'
+    if tipo == 'qtd_token':
+        token, operador, _, valor = argumentos
+        if automato:
+            return _comparacao(f'ocorrencias[{token.lower()!r}]', operador, valor)
+        return _comparacao(f't.contar_ocorrencias({token.lower()!r})', operador, valor)
+    if tipo == 'qtd_sentencas_expressao':
+        operador, _, valor = argumentos
+        return _comparacao('t.qtd_sentencas_com_expressao', operador, valor)
+    if tipo == 'sem_expressoes':
+        return 't.qtd_sentencas_com_expressao == 0'
+
+    raise ValueError(f"Tipo de condição desconhecido: {tipo}")
+
+
+def _custo_regra(regra: Dict[str, Any]) -> Tuple[int, int]:
+    """Custo de uma regra: o da condição mais cara e o número de condições."""
+    custos = [CUSTOS[condicao.tipo] for condicao in regra['condicoes']]
+    return max(custos, default=0), len(custos)
+
+
+def _adicionar_regra(linhas: List[str], regra: Dict[str, Any], condicoes: List[Condicao], recuo: str,
+                     automato: bool = False) -> None:
+    """Acrescenta ao código-fonte o teste de uma regra.
+
+    Args:
+        linhas (List[str]): Linhas do código-fonte em construção.
+        regra (Dict[str, Any]): Regra estruturada.
+        condicoes (List[Condicao]): Condições a verificar (todas obrigatórias).
+        recuo (str): Recuo das linhas geradas.
+        automato (bool): Se as condições sobre literais leem as contagens do autômato.
+    """
+    categoria = repr(regra['categoria'])
+    testes = [f'{categoria} not in categorias']
+    testes.extend(f'({_codigo_condicao(condicao, automato)})'
+                  for condicao in sorted(condicoes, key=lambda condicao: CUSTOS[condicao.tipo]))
+
+    # repr: quebras de linha no texto da regra não podem encerrar o comentário
+    linhas.append(f'{recuo}# {regra["regra"]!r}')
+    linhas.append(f'{recuo}if {" and ".join(testes)}:')
+    linhas.append(f'{recuo}    categorias.add({categoria})')
+
+
+def _literais_condicoes(regras_estruturadas: List[Dict[str, Any]]) -> List[str]:
+    """Literais (em minúsculas e sem repetição) consultados pelas condições das regras."""
+    literais = {}
+    for regra in regras_estruturadas:
+        for condicao in regra['condicoes']:
+            if condicao.tipo in ('presenca_token', 'qtd_token'):
+                literais[condicao.argumentos[0].lower()] = None
+    return list(literais)
+
+
+def gerar_fonte(regras_estruturadas: List[Dict[str, Any]], limiar_literais: Optional[int] = None) -> str:
+    """Gera o código-fonte da função avaliadora.
+
+    Args:
+        regras_estruturadas (List[Dict[str, Any]]): Saída de `ParserRegras.estruturar_regras`.
+        limiar_literais (Optional[int]): Número de literais a partir do qual as condições leem
+            as contagens de um `AutomatoLiterais`. Se None, usa `LIMIAR_LITERAIS`.
+
+    Returns:
+        str: Código-fonte da função `avaliar_regras(t)` (e, com o autômato, da sua construção).
+    """
+    if limiar_literais is None:
+        limiar_literais = LIMIAR_LITERAIS
+    literais = _literais_condicoes(regras_estruturadas)
+    automato = bool(literais) and len(literais) >= limiar_literais
+
+    indice = ParserRegras().indexar_regras(regras_estruturadas)
+    linhas = []
+    if automato:
+        # O autômato faz parte do código gerado, para que a fonte baste para recriar o avaliador
+        linhas.append('from analizador_de_texto.automato_literais import AutomatoLiterais')
+        linhas.append(f'AUTOMATO = AutomatoLiterais({literais!r})')
+    linhas.extend([f'def {NOME_FUNCAO}(t):', '    categorias = set()'])
+    if automato:
+        linhas.append('    ocorrencias = t.contagens_literais(AUTOMATO)')
+    else:
+        linhas.append('    texto_lower = t.texto_lower')
+
+    # Regras com literal obrigatório: o literal é procurado uma única vez por grupo
+    for literal, indices in indice.por_literal.items():
+        if automato:
+            linhas.append(f'    if ocorrencias[{literal!r}]:')
+        else:
+            linhas.append(f'    if {literal!r} in texto_lower:')
+        for indice_regra in sorted(indices, key=lambda i: _custo_regra(regras_estruturadas[i])):
+            regra = regras_estruturadas[indice_regra]
+            # A presença do próprio literal já foi verificada pelo grupo
+            condicoes = [condicao for condicao in regra['condicoes']
+                         if not (condicao.tipo == 'presenca_token' and condicao.argumentos[0].lower() == literal)]
+            _adicionar_regra(linhas, regra, condicoes, ' ' * 8, automato)
+
+    # Regras mais baratas primeiro: se já atribuírem a categoria, as mais caras são puladas
+    for indice_regra in sorted(indice.sem_literal, key=lambda i: _custo_regra(regras_estruturadas[i])):
+        regra = regras_estruturadas[indice_regra]
+        _adicionar_regra(linhas, regra, regra['condicoes'], ' ' * 4, automato)
+
+    linhas.append('    return categorias')
+    return '\n'.join(linhas) + '\n'
+
+
+def compilar_fonte(fonte: str) -> Any:
+    """Compila o código-fonte gerado por `gerar_fonte` em um objeto de código.
+
+    Args:
+        fonte (str): Código-fonte da função avaliadora.
+
+    Returns:
+        CodeType: Objeto de código do módulo que define a função.
+    """
+    return compile(fonte, f'<{NOME_FUNCAO}>', 'exec')
+
+
+def criar_avaliador(fonte: str, codigo: Any = None) -> Callable[[TextoAnalisado], Set[str]]:
+    """Cria a função avaliadora a partir do código-fonte (ou do código já compilado).
+
+    Args:
+        fonte (str): Código-fonte gerado por `gerar_fonte`.
+        codigo (CodeType, optional): Saída de `compilar_fonte` para a mesma fonte. Se None,
+            a fonte é compilada.
+
+    Returns:
+        Callable[[TextoAnalisado], Set[str]]: Função avaliadora, com o código em `.fonte`.
+    """
+    namespace = {}
+    exec(codigo if codigo is not None else compilar_fonte(fonte), namespace)
+
+    avaliar = namespace[NOME_FUNCAO]
+    avaliar.fonte = fonte
+    return avaliar
+
+
+def compilar_regras(regras_estruturadas: List[Dict[str, Any]],
+                    limiar_literais: Optional[int] = None) -> Callable[[TextoAnalisado], Set[str]]:
+    """Compila as regras em uma única função avaliadora.
+
+    Args:
+        regras_estruturadas (List[Dict[str, Any]]): Saída de `ParserRegras.estruturar_regras`.
+        limiar_literais (Optional[int]): Número de literais a partir do qual o autômato é usado
+            (ver `gerar_fonte`).
+
+    Returns:
+        Callable[[TextoAnalisado], Set[str]]: Função que recebe um `TextoAnalisado` e retorna
+        o conjunto de categorias atendidas. O código gerado fica disponível em `.fonte`.
+    """
+    return criar_avaliador(gerar_fonte(regras_estruturadas, limiar_literais))
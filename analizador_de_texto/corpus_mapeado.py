@@ -0,0 +1,296 @@
+"""corpus_mapeado.py
+============================
+Leitura de corpora JSONL ou JSON (lista) por mapeamento em memória e índice de posições.
+
+`ler_entrada_json` decodifica o arquivo inteiro, e o `ExecutorProcessos` precisa
+serializar (pickle) cada registro para enviá-lo aos workers. `CorpusMapeado` mapeia o
+arquivo (mmap, somente leitura) e guarda apenas a posição de início e de fim de cada
+registro em dois `array('q')` (16 bytes por registro). Os registros são decodificados
+um a um, sob demanda, diretamente do mapeamento.
+
+Uma fatia do corpus (`fatia`, `fatias`) é serializada apenas como o caminho do arquivo
+e as posições dos seus registros: cada worker mapeia o mesmo arquivo (as páginas são
+compartilhadas pelo sistema operacional) e decodifica somente os seus registros. A
+memória residente fica proporcional aos registros em processamento, e o processo
+principal deixa de decodificar e serializar os textos.
+
+O formato é detectado como em `ler_registros_json`: '[' como primeiro caractere não
+branco indica uma lista JSON; caso contrário, cada linha não vazia é um registro. O
+índice separa os registros sem decodificá-los; um registro inválido só é detectado ao
+ser decodificado. O arquivo não deve ser modificado enquanto estiver mapeado. No mesmo
+processo, os corpora abertos sobre o mesmo arquivo compartilham um único mapeamento,
+fechado quando o último deles é fechado.
+
+Exemplo:
+    with CorpusMapeado("corpus.jsonl") as corpus:
+        corpus.por_id(42)                       # acesso direto por id
+        with ExecutorProcessos() as executor:
+            categorias = executor.aplica_regras(corpus)
+
+Classes:
+- CorpusMapeado: corpus mapeado em memória, com acesso por posição e por id
+"""
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import mmap
+import os
+import re
+import threading
+
+# Conteúdo de cada linha não vazia de um arquivo JSONL
+_LINHA = re.compile(rb'\S[^\n]*')
+
+# Elementos léxicos que delimitam os elementos de uma lista JSON (strings são puladas inteiras)
+_DELIMITADORES = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},]')
+
+# 'id' no início do registro (caso comum), lido sem decodificar o registro inteiro
+_ID = re.compile(rb'\{\s*"id"\s*:\s*(-?\d+|"[^"\\]*")\s*[,}]')
+
+_BRANCOS = b' \t\r\n'
+
+# Mapeamentos abertos no processo, por caminho, tamanho e data de modificação do arquivo:
+# cada entrada é [mapeamento, número de corpora que o usam]
+_mapeamentos = {}
+_trava_mapeamentos = threading.Lock()
+
+
+def _mapear(caminho: str) -> List[Any]:
+    """Mapeia o arquivo (somente leitura), reutilizando o mapeamento já aberto no processo.
+
+    Returns:
+        List[Any]: Entrada [mapeamento, referências] do arquivo, já com a referência do chamador.
+    """
+    estado = os.stat(caminho)
+    chave = (caminho, estado.st_size, estado.st_mtime_ns)
+    with _trava_mapeamentos:
+        entrada = _mapeamentos.get(chave)
+        if entrada is None:
+            # Versões anteriores do arquivo não são mais reutilizadas: os seus mapeamentos
+            # saem do registro e são fechados com o último corpus que ainda os usa
+            for anterior in [anterior for anterior in _mapeamentos if anterior[0] == caminho]:
+                del _mapeamentos[anterior]
+            if estado.st_size == 0:
+                mapa = b''
+            else:
+                with open(caminho, 'rb') as arquivo:
+                    mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            entrada = _mapeamentos[chave] = [mapa, 0]
+        entrada[1] += 1
+        return entrada
+
+
+def _liberar(entrada: List[Any]) -> None:
+    """Libera uma referência ao mapeamento, fechando-o quando nenhum corpus o usar mais."""
+    with _trava_mapeamentos:
+        entrada[1] -= 1
+        if entrada[1] > 0:
+            return
+        for chave in [chave for chave, registrada in _mapeamentos.items() if registrada is entrada]:
+            del _mapeamentos[chave]
+        if isinstance(entrada[0], mmap.mmap):
+            entrada[0].close()
+
+
+class CorpusMapeado:
+    """Corpus JSONL ou JSON mapeado em memória, com o índice de posições dos registros."""
+
+    def __init__(self, caminho: str, _indice: Optional[tuple] = None):
+        """Mapeia o arquivo e indexa os registros.
+
+        Args:
+            caminho (str): Caminho do arquivo JSONL ou JSON (lista de registros).
+
+        Raises:
+            ValueError: Se a lista JSON estiver malformada (colchetes ou chaves sem par).
+        """
+        self.caminho = os.path.abspath(caminho)
+        self._entrada = _mapear(self.caminho)
+        self._mapa = self._entrada[0]
+        self._ids = None
+        if _indice is not None:
+            self._inicios, self._fins = _indice
+        else:
+            self._inicios, self._fins = array('q'), array('q')
+            self._indexar()
+
+    def _indexar(self) -> None:
+        """Localiza o início e o fim de cada registro, sem decodificá-los."""
+        mapa = self._mapa
+        tamanho = len(mapa)
+        posicao = 0
+        while posicao < tamanho and mapa[posicao] in _BRANCOS:
+            posicao += 1
+        if posicao == tamanho:
+            return
+
+        if mapa[posicao] != ord('['):
+            for linha in _LINHA.finditer(mapa, posicao):
+                self._inicios.append(linha.start())
+                self._fins.append(linha.end())
+            return
+
+        profundidade = 0
+        inicio = None
+        for delimitador in _DELIMITADORES.finditer(mapa, posicao):
+            simbolo = delimitador.group()
+            if simbolo in (b'[', b'{'):
+                profundidade += 1
+                if profundidade == 2 and inicio is None:
+                    inicio = delimitador.start()
+            elif simbolo in (b']', b'}'):
+                profundidade -= 1
+                if profundidade == 0:
+                    if inicio is not None:
+                        self._adicionar(inicio, delimitador.start())
+                    return
+                if profundidade < 0:
+                    break
+            elif simbolo == b',' and profundidade == 1:
+                if inicio is None:
+                    raise ValueError(f"Formato JSON inválido na lista de registros: {self.caminho}")
+                self._adicionar(inicio, delimitador.start())
+                inicio = None
+            elif profundidade == 1 and inicio is None:
+                # Elemento string no nível da lista
+                inicio = delimitador.start()
+        raise ValueError(f"Formato JSON inválido na lista de registros: {self.caminho}")
+
+    def _adicionar(self, inicio: int, fim: int) -> None:
+        """Acrescenta um registro da lista JSON, sem os espaços finais."""
+        while fim > inicio and self._mapa[fim - 1] in _BRANCOS:
+            fim -= 1
+        self._inicios.append(inicio)
+        self._fins.append(fim)
+
+    def __len__(self) -> int:
+        return len(self._inicios)
+
+    def __getitem__(self, posicao: int) -> Dict[str, Any]:
+        """Decodifica o registro na posição indicada."""
+        return json.loads(self._mapa[self._inicios[posicao]:self._fins[posicao]])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.registros()
+
+    def __enter__(self) -> 'CorpusMapeado':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Apenas o caminho e o índice: o worker mapeia o arquivo por conta própria
+        return {'caminho': self.caminho, 'inicios': self._inicios, 'fins': self._fins}
+
+    def __setstate__(self, estado: Dict[str, Any]) -> None:
+        self.__init__(estado['caminho'], (estado['inicios'], estado['fins']))
+
+    def __del__(self) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Libera a referência deste corpus ao mapeamento.
+
+        O mapeamento é compartilhado pelos corpora (e fatias) abertos sobre o mesmo arquivo
+        e só é fechado quando o último deles for fechado ou coletado.
+        """
+        entrada = getattr(self, '_entrada', None)
+        if entrada is not None:
+            self._entrada = None
+            _liberar(entrada)
+
+    def fatia(self, inicio: int, fim: int) -> 'CorpusMapeado':
+        """Corpus com os registros nas posições [inicio, fim), sobre o mesmo mapeamento.
+
+        Args:
+            inicio (int): Posição do primeiro registro.
+            fim (int): Posição após o último registro.
+
+        Returns:
+            CorpusMapeado: Fatia do corpus (serializável com pickle sem os textos).
+        """
+        return CorpusMapeado(self.caminho, (self._inicios[inicio:fim], self._fins[inicio:fim]))
+
+    def fatias(self, bytes_por_fatia: int = 100_000, max_registros: int = 1_000) -> Iterator['CorpusMapeado']:
+        """Divide o corpus em fatias limitadas pelo total de bytes e pelo número de registros.
+
+        Um registro maior que `bytes_por_fatia` forma uma fatia sozinho.
+
+        Args:
+            bytes_por_fatia (int): Total aproximado de bytes por fatia.
+            max_registros (int): Número máximo de registros por fatia.
+
+        Returns:
+            Iterator[CorpusMapeado]: Fatias, na ordem do corpus.
+        """
+        inicio = 0
+        tamanho = 0
+        for posicao, (inicio_registro, fim_registro) in enumerate(zip(self._inicios, self._fins)):
+            tamanho_registro = fim_registro - inicio_registro
+            if posicao > inicio and (tamanho + tamanho_registro > bytes_por_fatia
+                                     or posicao - inicio >= max_registros):
+                yield self.fatia(inicio, posicao)
+                inicio, tamanho = posicao, 0
+            tamanho += tamanho_registro
+        if inicio < len(self):
+            yield self.fatia(inicio, len(self))
+
+    def _id(self, posicao: int) -> Any:
+        """Id do registro, lido do início do registro quando possível."""
+        inicio, fim = self._inicios[posicao], self._fins[posicao]
+        encontrado = _ID.match(self._mapa, inicio, fim)
+        if encontrado is not None:
+            valor = encontrado.group(1)
+            return json.loads(valor) if valor[:1] == b'"' else int(valor)
+        return self[posicao].get('id')
+
+    def posicao_id(self, id_texto: Any) -> int:
+        """Posição do registro com o id indicado.
+
+        O índice de ids é construído no primeiro uso (apenas o id de cada registro é lido).
+        Se houver ids repetidos, vale o primeiro registro.
+
+        Args:
+            id_texto (Any): Id do registro.
+
+        Returns:
+            int: Posição do registro no corpus.
+
+        Raises:
+            KeyError: Se nenhum registro tiver esse id.
+        """
+        if self._ids is None:
+            ids = {}
+            for posicao in range(len(self)):
+                ids.setdefault(self._id(posicao), posicao)
+            self._ids = ids
+        return self._ids[id_texto]
+
+    def por_id(self, id_texto: Any) -> Dict[str, Any]:
+        """Registro com o id indicado (ver `posicao_id`).
+
+        Args:
+            id_texto (Any): Id do registro.
+
+        Returns:
+            Dict[str, Any]: Registro decodificado.
+
+        Raises:
+            KeyError: Se nenhum registro tiver esse id.
+        """
+        return self[self.posicao_id(id_texto)]
+
+    def registros(self, inicio: int = 0, fim: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Decodifica os registros nas posições [inicio, fim), um a um.
+
+        Args:
+            inicio (int): Posição do primeiro registro.
+            fim (Optional[int]): Posição após o último registro. Padrão: fim do corpus.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Registros, na ordem do corpus.
+        """
+        mapa = self._mapa
+        for inicio_registro, fim_registro in zip(self._inicios[inicio:fim], self._fins[inicio:fim]):
+            yield json.loads(mapa[inicio_registro:fim_registro])
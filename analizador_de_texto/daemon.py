@@ -0,0 +1,188 @@
+"""daemon.py
+============================
+Daemon local (Unix socket) que mantém as regras e expressões carregadas entre chamadas.
+
+Processos de curta duração (ex.: uma chamada por arquivo em jobs de ETL em shell)
+pagam a inicialização do interpretador, a importação do pacote e a carga das regras
+a cada chamada. O daemon faz esse trabalho uma única vez e atende as requisições de
+`cliente_daemon` por um Unix socket local. Clientes concorrentes são atendidos ao
+mesmo tempo (o processamento é feito em um executor, fora do laço de eventos).
+
+As regras e expressões ficam no registro de recursos, que compara a data de
+modificação dos arquivos a cada requisição: edições são percebidas sem reiniciar o
+daemon. O comando 'recarregar' descarta os recursos explicitamente.
+
+Requisições (uma por linha, JSON):
+- {"comando": "expressoes" | "categorias", "entrada": "arquivo.json"}: lê os registros
+  do arquivo (como `ler_entrada_json`) e devolve a saída de encontra_expressoes/aplica_regras
+- {"comando": "expressoes" | "categorias", "textos": [{"id", "texto"}, ...]}
+- {"comando": "saude"}: requisições atendidas e arquivos de recursos
+- {"comando": "recarregar"}: descarta as regras e expressões em memória
+
+Classes:
+- DaemonClassificacao: servidor asyncio em um Unix socket
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import os
+import socket
+
+from analizador_de_texto.cliente_daemon import COMANDOS, caminho_socket_padrao
+from analizador_de_texto.problema1 import encontra_expressoes
+from analizador_de_texto.problema2 import aplica_regras
+from analizador_de_texto.registro import registro
+from analizador_de_texto.utils import ler_entrada_json
+
+# Tamanho máximo de uma linha de requisição
+MAX_TAMANHO_REQUISICAO = 256 * 1024 * 1024
+
+
+class DaemonClassificacao:
+    """Servidor asyncio em um Unix socket que mantém regras e expressões em memória."""
+
+    def __init__(self, caminho_socket: Optional[str] = None,
+                 arquivo_regras: str = "regras_linguagem_natural.txt",
+                 arquivo_expressoes: str = "expressoes.txt",
+                 executor: Optional[Executor] = None):
+        """Inicializa o daemon.
+
+        Args:
+            caminho_socket (Optional[str]): Caminho do socket. Padrão: `caminho_socket_padrao()`.
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+            executor (Optional[Executor]): Executor das requisições. Padrão: 4 threads.
+        """
+        self.caminho_socket = caminho_socket or caminho_socket_padrao()
+        self.arquivo_regras = arquivo_regras
+        self.arquivo_expressoes = arquivo_expressoes
+        self._executor_proprio = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=4)
+        self.requisicoes_atendidas = 0
+        self._servidor = None
+
+    def _em_uso(self) -> bool:
+        """Se outro daemon já atende no caminho do socket."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as teste:
+            try:
+                teste.connect(self.caminho_socket)
+            except OSError:
+                return False
+        return True
+
+    async def iniciar(self) -> str:
+        """Carrega os recursos e começa a aceitar conexões.
+
+        Returns:
+            str: Caminho do socket.
+
+        Raises:
+            RuntimeError: Se outro daemon já estiver em execução no mesmo caminho.
+        """
+        if os.path.exists(self.caminho_socket):
+            if self._em_uso():
+                raise RuntimeError(f"Já existe um daemon em execução em {self.caminho_socket}")
+            # Socket deixado por um daemon encerrado sem limpeza
+            os.unlink(self.caminho_socket)
+
+        registro.precarregar(self.arquivo_regras, self.arquivo_expressoes)
+        # Apenas o próprio usuário pode enviar requisições (o daemon lê arquivos em seu nome):
+        # o socket já é criado com permissão 0600, sem intervalo com outra permissão
+        umask_anterior = os.umask(0o177)
+        try:
+            self._servidor = await asyncio.start_unix_server(self._atender, self.caminho_socket,
+                                                             limit=MAX_TAMANHO_REQUISICAO)
+        finally:
+            os.umask(umask_anterior)
+        return self.caminho_socket
+
+    async def servir_para_sempre(self) -> None:
+        """Inicia o daemon (se necessário) e atende até ser cancelado."""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def encerrar(self) -> None:
+        """Para de aceitar conexões, remove o socket e libera os recursos."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+            try:
+                os.unlink(self.caminho_socket)
+            except FileNotFoundError:
+                pass
+        if self._executor_proprio:
+            self.executor.shutdown(wait=False)
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atende as requisições de uma conexão, uma por linha."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                try:
+                    requisicao = json.loads(linha)
+                    resposta = {'resultado': await loop.run_in_executor(self.executor, self.processar, requisicao)}
+                except Exception as erro:
+                    # Qualquer falha da requisição (inclusive de uma regra) é respondida ao cliente
+                    resposta = {'erro': str(erro) or type(erro).__name__}
+                self.requisicoes_atendidas += 1
+                escritor.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b'\n')
+                await escritor.drain()
+        except (ConnectionError, ValueError):
+            # ValueError: linha maior que MAX_TAMANHO_REQUISICAO
+            pass
+        finally:
+            escritor.close()
+
+    def processar(self, requisicao: Dict[str, Any]) -> Any:
+        """Executa uma requisição (fora do laço de eventos).
+
+        Args:
+            requisicao (Dict[str, Any]): Requisição com 'comando' e, para expressoes e
+                categorias, 'entrada' (arquivo JSON) ou 'textos' (lista de registros).
+
+        Returns:
+            Any: Resultado da requisição.
+
+        Raises:
+            ValueError: Se a requisição for inválida.
+        """
+        if not isinstance(requisicao, dict) or requisicao.get('comando') not in COMANDOS:
+            raise ValueError(f"Comando inválido; esperado um de: {', '.join(COMANDOS)}")
+        comando = requisicao['comando']
+
+        if comando == 'saude':
+            return {
+                'status': 'ok',
+                'pid': os.getpid(),
+                'requisicoes_atendidas': self.requisicoes_atendidas,
+                'hash_regras': registro.hash_regras(self.arquivo_regras),
+                'hash_expressoes': registro.hash_expressoes(self.arquivo_expressoes),
+            }
+        if comando == 'recarregar':
+            registro.recarregar()
+            registro.precarregar(self.arquivo_regras, self.arquivo_expressoes)
+            return None
+
+        textos = self._textos(requisicao)
+        if comando == 'expressoes':
+            return encontra_expressoes(textos, self.arquivo_expressoes)
+        return aplica_regras(textos, self.arquivo_regras, self.arquivo_expressoes)
+
+    @staticmethod
+    def _textos(requisicao: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Registros da requisição, lidos do arquivo indicado ou enviados diretamente."""
+        if requisicao.get('entrada') is not None:
+            return ler_entrada_json(requisicao['entrada'])
+        textos = requisicao.get('textos')
+        if not isinstance(textos, list) or not all(
+                isinstance(registro_texto, dict) and 'id' in registro_texto
+                and isinstance(registro_texto.get('texto'), str) for registro_texto in textos):
+            raise ValueError("Informe 'entrada' ou 'textos' (lista de registros com 'id' e 'texto')")
+        return textos
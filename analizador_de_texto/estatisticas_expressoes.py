@@ -0,0 +1,263 @@
+"""estatisticas_expressoes.py
+============================
+Estatísticas agregadas das expressões no início das sentenças, sem a saída por sentença.
+
+Painéis que precisam apenas de contagens (quantas sentenças cada expressão inicia,
+por texto e no corpus, e a proporção de sentenças iniciadas por um conectivo) não
+precisam da saída de `encontra_expressoes`. Aqui os textos são lidos em fluxo e
+apenas contadores são acumulados: as sentenças são tratadas pelas suas posições no
+texto, sem que nenhuma string de sentença ou dicionário de resultado seja criado.
+
+Os contadores por texto ficam em colunas (`array.array`), como em `ResultadoColunar`:
+- ids, sentencas_texto, com_expressao_texto: um elemento por texto;
+- inicio_contagens_texto: posição, nas colunas de contagens, das contagens de cada
+  texto (com um elemento final igual ao total);
+- expressao_texto / qtd_texto: índice da expressão e número de sentenças que ela inicia.
+
+Estatísticas de partes do corpus (ex.: fatias processadas em paralelo ou em máquinas
+diferentes) são combinadas com `mesclar`; `estado` e `de_estado` as convertem de/para JSON.
+
+Classes e funções:
+- EstatisticasExpressoes: contadores por expressão e por texto, combináveis entre partes
+- estatisticas_expressoes: acumula as estatísticas de um fluxo de textos
+"""
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from analizador_de_texto.registro import registro
+from analizador_de_texto.utils import separar_sentencas_spans
+
+
+class EstatisticasExpressoes:
+    """Contadores das expressões no início das sentenças, por expressão e por texto."""
+
+    def __init__(self, expressoes: List[str], por_texto: bool = True):
+        """Inicializa estatísticas vazias.
+
+        Args:
+            expressoes (List[str]): Tabela de expressões referenciada pelos contadores.
+            por_texto (bool): Se os contadores de cada texto devem ser guardados (além dos do corpus).
+        """
+        self.expressoes = expressoes
+        self.por_texto = por_texto
+        self.qtd_textos = 0
+        self.qtd_sentencas = 0
+        self.qtd_sentencas_com_expressao = 0
+        self.contagens = array('q', bytes(8 * len(expressoes)))
+        self.ids = []
+        self.sentencas_texto = array('q')
+        self.com_expressao_texto = array('q')
+        self.inicio_contagens_texto = array('q', [0])
+        self.expressao_texto = array('q')
+        self.qtd_texto = array('q')
+
+    def __len__(self) -> int:
+        return self.qtd_textos
+
+    @property
+    def proporcao_com_expressao(self) -> float:
+        """Proporção das sentenças iniciadas por uma expressão (0.0 se não houver sentenças)."""
+        return self.qtd_sentencas_com_expressao / self.qtd_sentencas if self.qtd_sentencas else 0.0
+
+    def adicionar(self, id_texto: Any, indices_expressoes: Iterable[Optional[int]]) -> None:
+        """Acrescenta as sentenças de um texto.
+
+        Args:
+            id_texto (Any): Identificador do texto.
+            indices_expressoes (Iterable[Optional[int]]): Índice da expressão de cada sentença, ou None.
+        """
+        qtd_sentencas = 0
+        contagens_texto = {}
+        for indice in indices_expressoes:
+            qtd_sentencas += 1
+            if indice is not None:
+                contagens_texto[indice] = contagens_texto.get(indice, 0) + 1
+
+        com_expressao = sum(contagens_texto.values())
+        self.qtd_textos += 1
+        self.qtd_sentencas += qtd_sentencas
+        self.qtd_sentencas_com_expressao += com_expressao
+        contagens = self.contagens
+        for indice, qtd in contagens_texto.items():
+            contagens[indice] += qtd
+
+        if self.por_texto:
+            self.ids.append(id_texto)
+            self.sentencas_texto.append(qtd_sentencas)
+            self.com_expressao_texto.append(com_expressao)
+            self.expressao_texto.extend(contagens_texto)
+            self.qtd_texto.extend(contagens_texto.values())
+            self.inicio_contagens_texto.append(len(self.expressao_texto))
+
+    def mesclar(self, outra: 'EstatisticasExpressoes') -> 'EstatisticasExpressoes':
+        """Acrescenta as estatísticas de outra parte do corpus (os textos dela vêm depois destes).
+
+        Args:
+            outra (EstatisticasExpressoes): Estatísticas com a mesma tabela de expressões.
+
+        Returns:
+            EstatisticasExpressoes: As próprias estatísticas, atualizadas.
+
+        Raises:
+            ValueError: Se as tabelas de expressões ou o modo `por_texto` forem diferentes.
+        """
+        if outra.expressoes != self.expressoes:
+            raise ValueError("As estatísticas usam tabelas de expressões diferentes")
+        if outra.por_texto != self.por_texto:
+            raise ValueError("As estatísticas devem ter o mesmo modo por_texto")
+
+        self.qtd_textos += outra.qtd_textos
+        self.qtd_sentencas += outra.qtd_sentencas
+        self.qtd_sentencas_com_expressao += outra.qtd_sentencas_com_expressao
+        for indice, qtd in enumerate(outra.contagens):
+            if qtd:
+                self.contagens[indice] += qtd
+
+        if self.por_texto:
+            deslocamento = len(self.expressao_texto)
+            self.ids.extend(outra.ids)
+            self.sentencas_texto.extend(outra.sentencas_texto)
+            self.com_expressao_texto.extend(outra.com_expressao_texto)
+            self.expressao_texto.extend(outra.expressao_texto)
+            self.qtd_texto.extend(outra.qtd_texto)
+            self.inicio_contagens_texto.extend(inicio + deslocamento
+                                               for inicio in outra.inicio_contagens_texto[1:])
+        return self
+
+    def contagem_expressoes(self) -> Dict[str, int]:
+        """Número de sentenças iniciadas por cada expressão no corpus.
+
+        Returns:
+            Dict[str, int]: Contagem por expressão (apenas as que ocorreram).
+        """
+        return {self.expressoes[indice]: qtd for indice, qtd in enumerate(self.contagens) if qtd}
+
+    def texto(self, posicao: int) -> Dict[str, Any]:
+        """Contadores de um texto.
+
+        Args:
+            posicao (int): Posição do texto (ordem em que foi acrescentado).
+
+        Returns:
+            Dict[str, Any]: 'id', 'qtd_sentencas', 'qtd_sentencas_com_expressao' e 'expressoes'
+            (número de sentenças iniciadas por cada expressão do texto).
+
+        Raises:
+            ValueError: Se as estatísticas não guardam os contadores por texto.
+        """
+        if not self.por_texto:
+            raise ValueError("Estatísticas criadas com por_texto=False")
+        inicio, fim = self.inicio_contagens_texto[posicao], self.inicio_contagens_texto[posicao + 1]
+        return {
+            'id': self.ids[posicao],
+            'qtd_sentencas': self.sentencas_texto[posicao],
+            'qtd_sentencas_com_expressao': self.com_expressao_texto[posicao],
+            'expressoes': {self.expressoes[indice]: qtd
+                           for indice, qtd in zip(self.expressao_texto[inicio:fim], self.qtd_texto[inicio:fim])},
+        }
+
+    def iter_textos(self) -> Iterator[Dict[str, Any]]:
+        """Produz os contadores de cada texto (ver `texto`), na ordem em que foram acrescentados.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Contadores de cada texto.
+        """
+        for posicao in range(len(self.ids)):
+            yield self.texto(posicao)
+
+    def resumo(self) -> Dict[str, Any]:
+        """Totais do corpus.
+
+        Returns:
+            Dict[str, Any]: 'qtd_textos', 'qtd_sentencas', 'qtd_sentencas_com_expressao',
+            'proporcao_com_expressao' e 'expressoes' (contagens, da mais frequente para a menos).
+        """
+        contagens = self.contagem_expressoes()
+        return {
+            'qtd_textos': self.qtd_textos,
+            'qtd_sentencas': self.qtd_sentencas,
+            'qtd_sentencas_com_expressao': self.qtd_sentencas_com_expressao,
+            'proporcao_com_expressao': self.proporcao_com_expressao,
+            'expressoes': dict(sorted(contagens.items(), key=lambda item: -item[1])),
+        }
+
+    def estado(self) -> Dict[str, Any]:
+        """Estatísticas como um dicionário serializável em JSON (ver `de_estado`).
+
+        Returns:
+            Dict[str, Any]: Tabela de expressões, totais e colunas (como listas).
+        """
+        estado = {
+            'expressoes': self.expressoes,
+            'por_texto': self.por_texto,
+            'qtd_textos': self.qtd_textos,
+            'qtd_sentencas': self.qtd_sentencas,
+            'qtd_sentencas_com_expressao': self.qtd_sentencas_com_expressao,
+            'contagens': self.contagens.tolist(),
+        }
+        if self.por_texto:
+            for coluna in ('ids', 'sentencas_texto', 'com_expressao_texto', 'inicio_contagens_texto',
+                           'expressao_texto', 'qtd_texto'):
+                valor = getattr(self, coluna)
+                estado[coluna] = valor if isinstance(valor, list) else valor.tolist()
+        return estado
+
+    @classmethod
+    def de_estado(cls, estado: Dict[str, Any]) -> 'EstatisticasExpressoes':
+        """Reconstrói as estatísticas a partir de `estado()`.
+
+        Args:
+            estado (Dict[str, Any]): Saída de `EstatisticasExpressoes.estado` (ex.: lida de um JSON).
+
+        Returns:
+            EstatisticasExpressoes: Estatísticas equivalentes às originais.
+        """
+        estatisticas = cls(list(estado['expressoes']), estado['por_texto'])
+        estatisticas.qtd_textos = estado['qtd_textos']
+        estatisticas.qtd_sentencas = estado['qtd_sentencas']
+        estatisticas.qtd_sentencas_com_expressao = estado['qtd_sentencas_com_expressao']
+        estatisticas.contagens = array('q', estado['contagens'])
+        if estatisticas.por_texto:
+            estatisticas.ids = list(estado['ids'])
+            for coluna in ('sentencas_texto', 'com_expressao_texto', 'inicio_contagens_texto',
+                           'expressao_texto', 'qtd_texto'):
+                valor = getattr(estatisticas, coluna)
+                setattr(estatisticas, coluna, array(valor.typecode, estado[coluna]))
+        return estatisticas
+
+
+def estatisticas_expressoes(informacoes_textos: Iterable[Dict[str, Any]],
+                            arquivo_expressoes: str = "expressoes.txt",
+                            estatisticas: Optional[EstatisticasExpressoes] = None,
+                            por_texto: bool = True) -> EstatisticasExpressoes:
+    """Acumula as estatísticas das expressões no início das sentenças de um fluxo de textos.
+
+    As contagens são as mesmas obtidas a partir da saída de `encontra_expressoes`.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        estatisticas (Optional[EstatisticasExpressoes]): Estatísticas às quais os textos são
+            acrescentados. Padrão: novas estatísticas.
+        por_texto (bool): Se os contadores de cada texto devem ser guardados (apenas para
+            novas estatísticas).
+
+    Returns:
+        EstatisticasExpressoes: Estatísticas acumuladas.
+
+    Raises:
+        ValueError: Se `estatisticas` usar uma tabela de expressões diferente da do arquivo.
+    """
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    if estatisticas is None:
+        estatisticas = EstatisticasExpressoes(trie_expressoes.expressoes, por_texto)
+    elif estatisticas.expressoes != trie_expressoes.expressoes:
+        raise ValueError("As estatísticas usam uma tabela de expressões diferente da do arquivo")
+
+    buscar = trie_expressoes.buscar_indices_spans
+    for info_texto in informacoes_textos:
+        texto = info_texto["texto"]
+        # Uma cópia em minúsculas por texto, em vez de uma por sentença com candidatos
+        estatisticas.adicionar(info_texto["id"], buscar(texto, separar_sentencas_spans(texto), texto.lower()))
+
+    return estatisticas
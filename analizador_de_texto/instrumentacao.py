@@ -0,0 +1,273 @@
+"""instrumentacao.py
+============================
+Instrumentação opcional das etapas de processamento e das regras.
+
+Quando ativada, `encontra_expressoes` e `aplica_regras` registram o tempo e o
+número de chamadas de cada etapa (separação de sentenças, tokenização, busca de
+expressões e avaliação das regras), além do tempo de avaliação e da taxa de
+disparo de cada regra, identificada pelo seu texto original. Os eventos podem ser
+repassados a ganchos (callbacks) e resumidos em um relatório.
+
+Quando desativada, o único custo é uma consulta a uma variável global no início
+de cada chamada: o caminho normal (avaliador compilado) não é alterado. Com a
+instrumentação ativa, as regras são avaliadas uma a uma pelas funções de condição
+do `ParserRegras`, para que o tempo de cada uma possa ser medido.
+
+A instrumentação vale para o processo atual; lotes processados em outros
+processos (ExecutorProcessos) não são registrados.
+
+Exemplo:
+    with instrumentar() as instrumentacao:
+        aplica_regras(textos)
+    print(instrumentacao.relatorio())
+
+Classes e funções:
+- Instrumentacao: coleta os tempos, repassa os eventos aos ganchos e gera o resumo
+- instrumentar: ativa uma instrumentação dentro de um bloco `with`
+- ativar, desativar, instrumentacao_ativa: controle da instrumentação global
+"""
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+import threading
+
+# Etapas (propriedades de TextoAnalisado) usadas por cada tipo de condição
+ETAPAS_CONDICAO = {
+    'qtd_sentencas': ('separar_sentencas',),
+    'qtd_tokens': ('tokenize',),
+    'presenca_token': (),
+    'qtd_token': (),
+    'qtd_sentencas_expressao': ('separar_sentencas', 'buscar_expressoes'),
+    'sem_expressoes': ('separar_sentencas', 'buscar_expressoes'),
+}
+
+# Propriedade de TextoAnalisado calculada em cada etapa
+PROPRIEDADES_ETAPAS = {
+    'separar_sentencas': 'spans_sentencas',
+    'tokenize': 'qtd_tokens',
+    'buscar_expressoes': 'expressoes_sentencas',
+}
+
+# Assinatura dos ganchos: (tipo do evento, nome, duração em ns, disparou)
+# O tipo é 'etapa' ou 'regra'; `disparou` é None para etapas.
+Gancho = Callable[[str, str, int, Optional[bool]], None]
+
+
+class Instrumentacao:
+    """Coleta tempos e contagens por etapa e por regra."""
+
+    def __init__(self, ganchos: Iterable[Gancho] = ()):
+        """Inicializa a instrumentação vazia.
+
+        Args:
+            ganchos (Iterable[Gancho]): Funções chamadas a cada evento registrado.
+        """
+        self.ganchos = list(ganchos)
+        self._trava = threading.Lock()
+        self.etapas = {}
+        self.regras = {}
+
+    def adicionar_gancho(self, gancho: Gancho) -> None:
+        """Adiciona uma função chamada a cada evento registrado.
+
+        Args:
+            gancho (Gancho): Função que recebe (tipo, nome, duração em ns, disparou).
+        """
+        self.ganchos.append(gancho)
+
+    def zerar(self) -> None:
+        """Descarta os tempos e contagens coletados."""
+        with self._trava:
+            self.etapas.clear()
+            self.regras.clear()
+
+    def registrar_etapa(self, etapa: str, duracao_ns: int) -> None:
+        """Registra uma execução de uma etapa.
+
+        Args:
+            etapa (str): Nome da etapa.
+            duracao_ns (int): Duração, em nanossegundos.
+        """
+        with self._trava:
+            estatisticas = self.etapas.get(etapa)
+            if estatisticas is None:
+                estatisticas = self.etapas[etapa] = [0, 0]
+            estatisticas[0] += 1
+            estatisticas[1] += duracao_ns
+        for gancho in self.ganchos:
+            gancho('etapa', etapa, duracao_ns, None)
+
+    def registrar_regra(self, regra: str, categoria: str, duracao_ns: int, disparou: bool) -> None:
+        """Registra uma avaliação de uma regra.
+
+        Args:
+            regra (str): Texto original da regra.
+            categoria (str): Categoria atribuída pela regra.
+            duracao_ns (int): Duração da avaliação, em nanossegundos.
+            disparou (bool): Se a condição da regra foi atendida.
+        """
+        with self._trava:
+            estatisticas = self.regras.get(regra)
+            if estatisticas is None:
+                estatisticas = self.regras[regra] = [categoria, 0, 0, 0]
+            estatisticas[1] += 1
+            estatisticas[2] += int(disparou)
+            estatisticas[3] += duracao_ns
+        for gancho in self.ganchos:
+            gancho('regra', regra, duracao_ns, disparou)
+
+    def medir_etapas(self, texto_analisado: Any, etapas: Iterable[str]) -> None:
+        """Calcula (e mede) as propriedades do texto correspondentes às etapas.
+
+        Args:
+            texto_analisado (TextoAnalisado): Texto analisado.
+            etapas (Iterable[str]): Etapas, na ordem de execução.
+        """
+        for etapa in etapas:
+            inicio = perf_counter_ns()
+            getattr(texto_analisado, PROPRIEDADES_ETAPAS[etapa])
+            self.registrar_etapa(etapa, perf_counter_ns() - inicio)
+
+    def avaliar_regras(self, texto_analisado: Any, regras: List[Dict[str, Any]]) -> Set[str]:
+        """Avalia as regras uma a uma, medindo cada avaliação.
+
+        Args:
+            texto_analisado (TextoAnalisado): Texto a ser categorizado.
+            regras (List[Dict[str, Any]]): Regras processadas por `ParserRegras.analisar_regras`.
+
+        Returns:
+            Set[str]: Categorias atendidas.
+        """
+        categorias = set()
+        inicio_etapa = perf_counter_ns()
+        for regra in regras:
+            inicio = perf_counter_ns()
+            disparou = bool(regra['condicao'](texto_analisado))
+            self.registrar_regra(regra['regra'], regra['categoria'], perf_counter_ns() - inicio, disparou)
+            if disparou:
+                categorias.add(regra['categoria'])
+        self.registrar_etapa('avaliar_regras', perf_counter_ns() - inicio_etapa)
+        return categorias
+
+    def resumo(self) -> Dict[str, Any]:
+        """Resumo dos tempos coletados.
+
+        Returns:
+            Dict[str, Any]: Dicionário com 'etapas' ({etapa: estatísticas}) e 'regras'
+            (lista ordenada pelo tempo total, da regra mais cara para a mais barata).
+        """
+        with self._trava:
+            etapas = {
+                etapa: {
+                    'chamadas': chamadas,
+                    'tempo_total_ms': total / 1e6,
+                    'tempo_medio_us': total / chamadas / 1e3,
+                }
+                for etapa, (chamadas, total) in self.etapas.items()
+            }
+            regras = [
+                {
+                    'regra': regra,
+                    'categoria': categoria,
+                    'avaliacoes': avaliacoes,
+                    'disparos': disparos,
+                    'taxa_disparo': disparos / avaliacoes,
+                    'tempo_total_ms': total / 1e6,
+                    'tempo_medio_us': total / avaliacoes / 1e3,
+                }
+                for regra, (categoria, avaliacoes, disparos, total) in self.regras.items()
+            ]
+        regras.sort(key=lambda estatisticas: estatisticas['tempo_total_ms'], reverse=True)
+        return {'etapas': etapas, 'regras': regras}
+
+    def relatorio(self, limite: int = 20) -> str:
+        """Relatório em texto com as etapas, as regras mais caras e as que nunca dispararam.
+
+        Args:
+            limite (int): Número máximo de regras listadas em cada seção.
+
+        Returns:
+            str: Relatório formatado.
+        """
+        resumo = self.resumo()
+        linhas = ['Etapas:']
+        for etapa, estatisticas in sorted(resumo['etapas'].items(),
+                                          key=lambda item: item[1]['tempo_total_ms'], reverse=True):
+            linhas.append(f"  {etapa:20} {estatisticas['chamadas']:10} chamadas "
+                          f"{estatisticas['tempo_total_ms']:12.3f} ms "
+                          f"{estatisticas['tempo_medio_us']:10.2f} µs/chamada")
+
+        if resumo['regras']:
+            linhas.append('Regras mais caras:')
+            for estatisticas in resumo['regras'][:limite]:
+                linhas.append(f"  {estatisticas['tempo_total_ms']:12.3f} ms "
+                              f"{estatisticas['taxa_disparo']:7.1%} disparos  {estatisticas['regra']}")
+
+            nunca_disparadas = [estatisticas['regra'] for estatisticas in resumo['regras']
+                                if estatisticas['disparos'] == 0]
+            if nunca_disparadas:
+                linhas.append(f'Regras que nunca dispararam ({len(nunca_disparadas)}):')
+                linhas.extend(f'  {regra}' for regra in nunca_disparadas[:limite])
+
+        return '\n'.join(linhas)
+
+
+def etapas_regras(regras_estruturadas: List[Dict[str, Any]]) -> List[str]:
+    """Etapas necessárias para avaliar as regras, na ordem de execução.
+
+    Args:
+        regras_estruturadas (List[Dict[str, Any]]): Saída de `ParserRegras.estruturar_regras`.
+
+    Returns:
+        List[str]: Etapas usadas por alguma condição das regras.
+    """
+    necessarias = {etapa for regra in regras_estruturadas for condicao in regra['condicoes']
+                   for etapa in ETAPAS_CONDICAO[condicao.tipo]}
+    return [etapa for etapa in PROPRIEDADES_ETAPAS if etapa in necessarias]
+
+
+# Instrumentação ativa no processo (None quando desativada)
+_ativa = None
+
+
+def instrumentacao_ativa() -> Optional[Instrumentacao]:
+    """Instrumentação ativa no processo, ou None."""
+    return _ativa
+
+
+def ativar(instrumentacao: Optional[Instrumentacao] = None) -> Instrumentacao:
+    """Ativa a instrumentação no processo.
+
+    Args:
+        instrumentacao (Optional[Instrumentacao]): Instrumentação a ativar. Padrão: uma nova.
+
+    Returns:
+        Instrumentacao: Instrumentação ativada.
+    """
+    global _ativa
+    _ativa = instrumentacao if instrumentacao is not None else Instrumentacao()
+    return _ativa
+
+
+def desativar() -> None:
+    """Desativa a instrumentação no processo."""
+    global _ativa
+    _ativa = None
+
+
+@contextmanager
+def instrumentar(instrumentacao: Optional[Instrumentacao] = None) -> Iterator[Instrumentacao]:
+    """Ativa a instrumentação dentro de um bloco `with`, restaurando a anterior ao sair.
+
+    Args:
+        instrumentacao (Optional[Instrumentacao]): Instrumentação a ativar. Padrão: uma nova.
+
+    Returns:
+        Iterator[Instrumentacao]: Instrumentação ativa no bloco.
+    """
+    global _ativa
+    anterior = _ativa
+    try:
+        yield ativar(instrumentacao)
+    finally:
+        _ativa = anterior
@@ -0,0 +1,249 @@
+"""paralelo.py
+============================
+Execução em lotes com múltiplos processos (ou threads) para os problemas 1 e 2.
+
+Cada processo do pool carrega as regras e expressões uma única vez, no seu
+inicializador (opcionalmente de um artefato pré-compilado), e passa a receber
+lotes de textos. Os lotes são montados pelo tamanho dos textos (número de
+caracteres), de forma que redações longas não se concentrem em um único lote,
+e os resultados são devolvidos na ordem da entrada. Um `CorpusMapeado` é enviado
+aos workers como fatias (caminho do arquivo e posições dos registros).
+
+`ExecutorThreads` distribui os mesmos lotes entre threads de um único processo, que
+compartilham as regras compiladas e as expressões, sem serializar textos nem resultados.
+Com o GIL, as threads não ganham vazão; no CPython sem GIL (3.13t ou posterior) elas
+usam vários núcleos. O estado compartilhado entre as threads é:
+- o `registro` de recursos, protegido por trava (as regras são analisadas, e os avisos
+  de condições não reconhecidas impressos, uma única vez, antes de as threads começarem);
+- o avaliador compilado, a `TrieExpressoes` e as closures do `ParserRegras`, apenas lidos;
+- o `AutomatoLiterais`, construído sob trava e cujas transições memorizadas são idempotentes;
+- os mapeamentos de `corpus_mapeado`, registrados de forma atômica;
+- o cache de resultados, o armazém, a instrumentação e o cache de prefixos da
+  `TrieExpressoes`, que têm as suas próprias travas.
+Cada `TextoAnalisado` (e as suas propriedades memorizadas) pertence a uma única thread.
+
+Classes e funções:
+- dividir_em_lotes: agrupa registros em lotes limitados pelo total de caracteres
+- ExecutorProcessos: executor com pool de processos para encontra_expressoes, aplica_regras
+  e estatisticas_expressoes
+- ExecutorThreads: mesma interface, com pool de threads
+"""
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import os
+
+from analizador_de_texto.artefato_regras import carregar_artefato
+from analizador_de_texto.corpus_mapeado import CorpusMapeado
+from analizador_de_texto.estatisticas_expressoes import EstatisticasExpressoes, estatisticas_expressoes
+from analizador_de_texto.problema1 import encontra_expressoes_iter
+from analizador_de_texto.problema2 import aplica_regras_iter
+from analizador_de_texto.registro import registro
+
+# Arquivos de recursos usados pelo processo worker (definidos no inicializador)
+_configuracao_worker = {}
+
+
+def _inicializar_worker(arquivo_regras: str, arquivo_expressoes: str, artefato: Optional[str] = None) -> None:
+    """Carrega as regras e expressões (ou o artefato pré-compilado) no processo worker."""
+    _configuracao_worker['arquivo_regras'] = arquivo_regras
+    _configuracao_worker['arquivo_expressoes'] = arquivo_expressoes
+    if artefato is not None:
+        registro.instalar_artefato(carregar_artefato(artefato))
+    registro.precarregar(arquivo_regras, arquivo_expressoes)
+
+
+def _executar_tarefa(tarefa: str, lote: Iterable[Dict[str, Any]], arquivo_regras: str,
+                     arquivo_expressoes: str) -> List[Any]:
+    """Processa um lote de registros com os recursos dos arquivos indicados.
+
+    Args:
+        tarefa (str): 'expressoes' (problema 1), 'categorias' (problema 2), ou 'estatisticas'
+            e 'estatisticas_corpus' (estatísticas das expressões com e sem os contadores por texto).
+        lote (Iterable[Dict[str, Any]]): Registros com 'id' e 'texto' (lista ou fatia de `CorpusMapeado`).
+        arquivo_regras (str): Nome do arquivo com regras.
+        arquivo_expressoes (str): Nome do arquivo com expressões.
+
+    Returns:
+        List[Any]: Resultados do lote, na mesma ordem (para as estatísticas, uma lista com
+        as estatísticas do lote).
+    """
+    if tarefa == 'expressoes':
+        return list(encontra_expressoes_iter(lote, arquivo_expressoes))
+    if tarefa.startswith('estatisticas'):
+        return [estatisticas_expressoes(lote, arquivo_expressoes, por_texto=tarefa == 'estatisticas')]
+    return list(aplica_regras_iter(lote, arquivo_regras, arquivo_expressoes))
+
+
+def _processar_lote(tarefa: str, lote: Iterable[Dict[str, Any]]) -> List[Any]:
+    """Processa um lote de registros no processo worker (ver `_executar_tarefa`)."""
+    return _executar_tarefa(tarefa, lote, _configuracao_worker['arquivo_regras'],
+                            _configuracao_worker['arquivo_expressoes'])
+
+
+def dividir_em_lotes(informacoes_textos: Iterable[Dict[str, Any]], caracteres_por_lote: int = 100_000,
+                     max_textos_por_lote: int = 1_000) -> Iterator[List[Dict[str, Any]]]:
+    """Agrupa registros em lotes limitados pelo total de caracteres e pelo número de textos.
+
+    Um texto maior que `caracteres_por_lote` forma um lote sozinho.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Registros com 'id' e 'texto'.
+        caracteres_por_lote (int): Total aproximado de caracteres por lote.
+        max_textos_por_lote (int): Número máximo de textos por lote.
+
+    Returns:
+        Iterator[List[Dict[str, Any]]]: Lotes de registros, na ordem da entrada.
+    """
+    lote = []
+    caracteres = 0
+
+    for info_texto in informacoes_textos:
+        tamanho = len(info_texto["texto"])
+        if lote and (caracteres + tamanho > caracteres_por_lote or len(lote) >= max_textos_por_lote):
+            yield lote
+            lote, caracteres = [], 0
+        lote.append(info_texto)
+        caracteres += tamanho
+
+    if lote:
+        yield lote
+
+
+class ExecutorProcessos:
+    """Executor com pool de processos para encontra_expressoes, aplica_regras e estatisticas_expressoes.
+
+    Exemplo:
+        with ExecutorProcessos(workers=8) as executor:
+            categorias = executor.aplica_regras(textos)
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 arquivo_regras: str = "regras_linguagem_natural.txt",
+                 arquivo_expressoes: str = "expressoes.txt",
+                 caracteres_por_lote: int = 100_000,
+                 max_textos_por_lote: int = 1_000,
+                 artefato: Optional[str] = None):
+        """Inicializa o pool de workers (criado por `_criar_pool`).
+
+        Args:
+            workers (Optional[int]): Número de workers (processos ou threads). Padrão: número de CPUs.
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+            caracteres_por_lote (int): Total aproximado de caracteres enviados por lote.
+            max_textos_por_lote (int): Número máximo de textos por lote.
+            artefato (Optional[str]): Artefato pré-compilado (`artefato_regras.compilar_artefato`)
+                usado no lugar da análise das regras.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.caracteres_por_lote = caracteres_por_lote
+        self.max_textos_por_lote = max_textos_por_lote
+        self.arquivo_regras = arquivo_regras
+        self.arquivo_expressoes = arquivo_expressoes
+        self._pool = self._criar_pool(artefato)
+
+    def _criar_pool(self, artefato: Optional[str]) -> Executor:
+        """Cria o pool de processos, cada um com os recursos carregados na inicialização."""
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_inicializar_worker,
+            initargs=(self.arquivo_regras, self.arquivo_expressoes, artefato)
+        )
+
+    def __enter__(self) -> 'ExecutorProcessos':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.encerrar()
+
+    def encerrar(self) -> None:
+        """Encerra o pool de workers."""
+        self._pool.shutdown()
+
+    def _submeter(self, tarefa: str, lote: Iterable[Dict[str, Any]]) -> Future:
+        """Envia um lote para ser processado por um worker."""
+        return self._pool.submit(_processar_lote, tarefa, lote)
+
+    def _mapear(self, tarefa: str, informacoes_textos: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Distribui os lotes entre os processos e produz os resultados na ordem da entrada.
+
+        No máximo duas vezes o número de workers em lotes ficam pendentes ao mesmo tempo,
+        de forma que a entrada pode ser um fluxo arbitrariamente grande.
+
+        Args:
+            tarefa (str): Tarefa de `_executar_tarefa`.
+            informacoes_textos (Iterable[Dict[str, Any]]): Registros com 'id' e 'texto', ou um
+                `CorpusMapeado` (os lotes são fatias do arquivo, sem serializar os textos).
+
+        Returns:
+            Iterator[Dict[str, Any]]: Resultados na ordem da entrada.
+        """
+        pendentes = deque()
+        if isinstance(informacoes_textos, CorpusMapeado):
+            # Cada worker recebe apenas as posições dos registros e os decodifica do arquivo mapeado
+            lotes = informacoes_textos.fatias(self.caracteres_por_lote, self.max_textos_por_lote)
+        else:
+            lotes = dividir_em_lotes(informacoes_textos, self.caracteres_por_lote, self.max_textos_por_lote)
+
+        for lote in lotes:
+            pendentes.append(self._submeter(tarefa, lote))
+            if len(pendentes) >= 2 * self.workers:
+                yield from pendentes.popleft().result()
+
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+    def encontra_expressoes_iter(self, informacoes_textos: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Versão paralela de `problema1.encontra_expressoes_iter`."""
+        return self._mapear('expressoes', informacoes_textos)
+
+    def aplica_regras_iter(self, informacoes_textos: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Versão paralela de `problema2.aplica_regras_iter`."""
+        return self._mapear('categorias', informacoes_textos)
+
+    def encontra_expressoes(self, informacoes_textos: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Versão paralela de `problema1.encontra_expressoes`."""
+        return list(self.encontra_expressoes_iter(informacoes_textos))
+
+    def aplica_regras(self, informacoes_textos: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Versão paralela de `problema2.aplica_regras`."""
+        return list(self.aplica_regras_iter(informacoes_textos))
+
+    def estatisticas_expressoes(self, informacoes_textos: Iterable[Dict[str, Any]],
+                                por_texto: bool = True) -> EstatisticasExpressoes:
+        """Versão paralela de `estatisticas_expressoes.estatisticas_expressoes`.
+
+        Cada worker devolve as estatísticas do seu lote, que são mescladas na ordem da entrada.
+        """
+        estatisticas = None
+        for parcial in self._mapear('estatisticas' if por_texto else 'estatisticas_corpus', informacoes_textos):
+            estatisticas = parcial if estatisticas is None else estatisticas.mesclar(parcial)
+        if estatisticas is None:
+            estatisticas = EstatisticasExpressoes(registro.trie_expressoes(self.arquivo_expressoes).expressoes,
+                                                  por_texto)
+        return estatisticas
+
+
+class ExecutorThreads(ExecutorProcessos):
+    """Executor com pool de threads, com a mesma interface de `ExecutorProcessos`.
+
+    As regras e expressões (ou o artefato pré-compilado, instalado no registro) são
+    carregadas uma única vez, na thread que cria o executor, e compartilhadas (somente
+    leitura) por todas as threads.
+
+    Exemplo:
+        with ExecutorThreads(workers=8) as executor:
+            categorias = executor.aplica_regras(textos)
+    """
+
+    def _criar_pool(self, artefato: Optional[str]) -> Executor:
+        """Carrega os recursos e cria o pool de threads."""
+        # Análise das regras (e seus avisos) antes das threads: elas só leem os recursos prontos
+        if artefato is not None:
+            registro.instalar_artefato(carregar_artefato(artefato))
+        registro.precarregar(self.arquivo_regras, self.arquivo_expressoes)
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _submeter(self, tarefa: str, lote: Iterable[Dict[str, Any]]) -> Future:
+        """Envia um lote para ser processado por uma thread."""
+        return self._pool.submit(_executar_tarefa, tarefa, lote, self.arquivo_regras, self.arquivo_expressoes)
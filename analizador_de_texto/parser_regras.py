@@ -0,0 +1,415 @@
+"""parser_regras.py
+============================
+Análise das regras de categorização escritas em linguagem natural.
+
+Este módulo converte as regras (uma por linha) em condições estruturadas e em
+funções de condição aplicáveis a um `TextoAnalisado`.
+
+Classes:
+- Condicao: condição de uma regra na forma estruturada (tipo, argumentos e texto)
+- IndiceRegras: índice das regras pelo literal que cada uma exige no texto
+- ParserRegras: classe para analisar e processar regras em linguagem natural
+"""
+from typing import List, Dict, Optional, Callable, Any
+from collections import namedtuple
+import re
+
+from analizador_de_texto.texto_analisado import TextoAnalisado
+
+# Condição estruturada extraída do texto de uma regra
+Condicao = namedtuple('Condicao', ['tipo', 'argumentos', 'texto'])
+
+# Menor valor a partir do qual `número de "x" é <operador> que <valor>` exige ao menos uma ocorrência
+MINIMO_CONTAGEM_POSITIVA = {
+    'maior': 0,
+    'maior ou igual': 1,
+    'igual': 1,
+}
+
+
+class IndiceRegras:
+    """Índice das regras pelo literal que cada uma exige no texto.
+
+    Uma regra que exige um literal (por `"x" aparece no texto` ou por uma contagem
+    que só é atendida com ao menos uma ocorrência) nunca é atendida por um texto sem
+    esse literal. Cada regra é indexada por um único literal obrigatório (o mais
+    longo, em geral o mais raro); as regras sem literal obrigatório são sempre avaliadas.
+    """
+
+    def __init__(self, regras_estruturadas: List[Dict[str, Any]], literais: List[Optional[str]]):
+        """Monta o índice.
+
+        Args:
+            regras_estruturadas (List[Dict[str, Any]]): Regras estruturadas.
+            literais (List[Optional[str]]): Literal (em minúsculas) que indexa cada regra, ou None.
+        """
+        self.regras = regras_estruturadas
+        self.literais = literais
+        self.por_literal = {}
+        self.sem_literal = []
+        for indice, literal in enumerate(literais):
+            if literal is None:
+                self.sem_literal.append(indice)
+            else:
+                self.por_literal.setdefault(literal, []).append(indice)
+
+    def __len__(self) -> int:
+        return len(self.regras)
+
+    def candidatas(self, texto_lower: str) -> List[int]:
+        """Índices das regras que podem ser atendidas pelo texto.
+
+        Args:
+            texto_lower (str): Texto em minúsculas.
+
+        Returns:
+            List[int]: Índices das regras candidatas, em ordem crescente.
+        """
+        indices = list(self.sem_literal)
+        for literal, regras in self.por_literal.items():
+            if literal in texto_lower:
+                indices.extend(regras)
+        return sorted(indices)
+
+
+class ParserRegras:
+    """Classe para analisar e processar regras em linguagem natural."""
+
+    def __init__(self):
+        """Inicializa o parser de regras."""
+        # Padrões para identificar condições nas regras
+        self.padroes_condicoes = {
+            r'número de sentenças é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': 'qtd_sentencas',
+            r'número de tokens é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': 'qtd_tokens',
+            r'"([^"]+)" aparece no texto': 'presenca_token',
+            r'número de "([^"]+)" é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': 'qtd_token',
+            r'número de sentenças com expressão é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': 'qtd_sentencas_expressao',
+            r'não tem expressões': 'sem_expressoes'
+        }
+        # Funções que convertem cada tipo de condição em uma função
+        self.processadores = {
+            'qtd_sentencas': self._processar_qtd_sentencas,
+            'qtd_tokens': self._processar_qtd_tokens,
+            'presenca_token': self._processar_presenca_token,
+            'qtd_token': self._processar_qtd_token,
+            'qtd_sentencas_expressao': self._processar_qtd_sentencas_expressao,
+            'sem_expressoes': self._processar_sem_expressoes
+        }
+
+    def estruturar_regras(self, regras_texto: List[str]) -> List[Dict[str, Any]]:
+        """Analisa regras em texto e extrai suas condições de forma estruturada.
+
+        Condições não reconhecidas são descartadas: uma regra simples com condição
+        não reconhecida é ignorada, e em uma regra composta apenas a sub-condição
+        não reconhecida deixa de ser verificada.
+
+        Args:
+            regras_texto (List[str]): Lista de regras em linguagem natural.
+
+        Returns:
+            List[Dict[str, Any]]: Lista de dicionários com 'regra' (texto original),
+            'categoria' e 'condicoes' (lista de `Condicao`, todas obrigatórias).
+        """
+        regras_estruturadas = []
+
+        for regra_texto in regras_texto:
+            # Extrai a condição e a categoria da regra
+            match = re.match(r'Se (.*), então a categoria é ([A-Za-z0-9]+)\.?', regra_texto)
+            if match:
+                condicao_texto = match.group(1)
+                categoria = match.group(2)
+
+                # Processa condições compostas (com E)
+                if ' E ' in condicao_texto:
+                    condicoes = [
+                        self._estruturar_condicao(cond.strip())
+                        for cond in condicao_texto.split(' E ')
+                    ]
+                    condicoes = [cond for cond in condicoes if cond is not None]
+                else:
+                    # Processa condição simples
+                    condicao = self._estruturar_condicao(condicao_texto)
+                    if condicao is None:
+                        continue
+                    condicoes = [condicao]
+
+                regras_estruturadas.append({
+                    'regra': regra_texto,
+                    'categoria': categoria,
+                    'condicoes': condicoes
+                })
+
+        return regras_estruturadas
+
+    def analisar_regras(self, regras_texto: List[str]) -> List[Dict[str, Any]]:
+        """Analisa regras em texto e as converte em funções de condição.
+
+        Args:
+            regras_texto (List[str]): Lista de regras em linguagem natural.
+
+        Returns:
+            List[Dict[str, Any]]: Lista de dicionários com funções de condição, categorias
+            e o texto original da regra. As funções de condição recebem um `TextoAnalisado`
+            (ou o dicionário `dados_texto`).
+        """
+        return self.converter_regras(self.estruturar_regras(regras_texto))
+
+    def literais_necessarios(self, regra_estruturada: Dict[str, Any]) -> List[str]:
+        """Literais (em minúsculas) que precisam ocorrer no texto para a regra ser atendida.
+
+        Args:
+            regra_estruturada (Dict[str, Any]): Regra com suas condições estruturadas.
+
+        Returns:
+            List[str]: Literais obrigatórios, sem repetição, na ordem das condições.
+        """
+        literais = []
+        for condicao in regra_estruturada['condicoes']:
+            if condicao.tipo == 'presenca_token':
+                literal = condicao.argumentos[0]
+            elif condicao.tipo == 'qtd_token':
+                literal, operador, _, valor = condicao.argumentos
+                minimo = MINIMO_CONTAGEM_POSITIVA.get(operador)
+                if minimo is None or int(valor) < minimo:
+                    continue
+            else:
+                continue
+            literal = literal.lower()
+            if literal not in literais:
+                literais.append(literal)
+        return literais
+
+    def indexar_regras(self, regras_estruturadas: List[Dict[str, Any]]) -> IndiceRegras:
+        """Indexa as regras pelo literal obrigatório mais longo de cada uma.
+
+        Args:
+            regras_estruturadas (List[Dict[str, Any]]): Saída de `estruturar_regras`.
+
+        Returns:
+            IndiceRegras: Índice de literal para regras.
+        """
+        literais = [
+            max(self.literais_necessarios(regra), key=len, default=None)
+            for regra in regras_estruturadas
+        ]
+        return IndiceRegras(regras_estruturadas, literais)
+
+    def converter_regras(self, regras_estruturadas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Converte regras estruturadas (saída de `estruturar_regras`) em funções de condição.
+
+        Args:
+            regras_estruturadas (List[Dict[str, Any]]): Regras com suas condições estruturadas.
+
+        Returns:
+            List[Dict[str, Any]]: Lista de dicionários com funções de condição, categorias
+            e o texto original da regra.
+        """
+        regras_processadas = []
+
+        for regra in regras_estruturadas:
+            funcoes_condicao = [self._converter_condicao(cond) for cond in regra['condicoes']]
+
+            if len(funcoes_condicao) == 1:
+                funcao_condicao = funcoes_condicao[0]
+            else:
+                # Cria uma função composta que verifica todas as sub-condições
+                def condicao_composta(texto_analisado, funcs=funcoes_condicao):
+                    return all(func(texto_analisado) for func in funcs)
+
+                funcao_condicao = condicao_composta
+
+            # Adiciona a regra processada à lista
+            regras_processadas.append({
+                'condicao': self._aceitar_dados_texto(funcao_condicao),
+                'categoria': regra['categoria'],
+                'regra': regra['regra']
+            })
+
+        return regras_processadas
+
+    @staticmethod
+    def _aceitar_dados_texto(funcao_condicao: Callable) -> Callable:
+        """Permite que a condição também seja chamada com o dicionário `dados_texto`.
+
+        Args:
+            funcao_condicao (Callable): Função que recebe um `TextoAnalisado`.
+
+        Returns:
+            Callable: Função que aceita `TextoAnalisado` ou dicionário.
+        """
+
+        def condicao(texto_analisado):
+            if not isinstance(texto_analisado, TextoAnalisado):
+                texto_analisado = TextoAnalisado.de_dados(texto_analisado)
+            return funcao_condicao(texto_analisado)
+
+        return condicao
+
+    def _estruturar_condicao(self, condicao_texto: str) -> Optional[Condicao]:
+        """Identifica o tipo e os argumentos de uma condição em texto.
+
+        Args:
+            condicao_texto (str): Condição em texto.
+
+        Returns:
+            Optional[Condicao]: Condição estruturada ou None se a condição não for reconhecida.
+        """
+        # Tenta cada padrão de condição
+        for padrao, tipo in self.padroes_condicoes.items():
+            match = re.match(padrao, condicao_texto)
+            if match:
+                return Condicao(tipo, match.groups(), condicao_texto)
+
+        # Se nenhum padrão corresponder
+        print(f"AVISO: Condição não reconhecida: {condicao_texto}")
+        return None
+
+    def _converter_condicao(self, condicao: Condicao) -> Callable:
+        """Converte uma condição estruturada em uma função.
+
+        Args:
+            condicao (Condicao): Condição estruturada.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+        return self.processadores[condicao.tipo](*condicao.argumentos)
+
+    def _analisar_condicao(self, condicao_texto: str) -> Optional[Callable]:
+        """Analisa uma condição em texto e a converte em uma função.
+
+        Args:
+            condicao_texto (str): Condição em texto.
+
+        Returns:
+            Optional[Callable]: Função que implementa a condição ou None se a condição não for reconhecida.
+        """
+        condicao = self._estruturar_condicao(condicao_texto)
+        if condicao is None:
+            return None
+        return self._converter_condicao(condicao)
+
+    def _processar_qtd_sentencas(self, operador: str, preposicao: str, valor: str) -> Callable:
+        """Processa condição sobre quantidade de sentenças.
+
+        Args:
+            operador (str): Operador de comparação (maior, menor, igual, etc.).
+            preposicao (str): Preposição ('a' ou 'que').
+            valor (str): Valor numérico para comparação.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+        valor_int = int(valor)
+
+        def verificar_qtd_sentencas(texto_analisado):
+            return self._comparar(texto_analisado.qtd_sentencas, operador, valor_int)
+
+        return verificar_qtd_sentencas
+
+    def _processar_qtd_tokens(self, operador: str, preposicao: str, valor: str) -> Callable:
+        """Processa condição sobre quantidade de tokens.
+
+        Args:
+            operador (str): Operador de comparação (maior, menor, igual, etc.).
+            preposicao (str): Preposição ('a' ou 'que').
+            valor (str): Valor numérico para comparação.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+        valor_int = int(valor)
+
+        def verificar_qtd_tokens(texto_analisado):
+            return self._comparar(texto_analisado.qtd_tokens, operador, valor_int)
+
+        return verificar_qtd_tokens
+
+    def _processar_presenca_token(self, token: str) -> Callable:
+        """Processa condição sobre presença de token específico.
+
+        Args:
+            token (str): Token a ser verificado.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+
+        def verificar_presenca_token_a(texto_analisado):
+            return texto_analisado.contem(token)
+
+        return verificar_presenca_token_a
+
+    def _processar_qtd_token(self, token: str, operador: str, preposicao: str, valor: str) -> Callable:
+        """Processa condição sobre quantidade de ocorrências de um token.
+
+        Args:
+            token (str): Token a ser contado.
+            operador (str): Operador de comparação (maior, menor, igual, etc.).
+            preposicao (str): Preposição ('a' ou 'que').
+            valor (str): Valor numérico para comparação.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+        valor_int = int(valor)
+
+        def verificar_qtd_token(texto_analisado):
+            qtd = texto_analisado.contar_ocorrencias(token)
+            return self._comparar(qtd, operador, valor_int)
+
+        return verificar_qtd_token
+
+    def _processar_qtd_sentencas_expressao(self, operador: str, preposicao: str, valor: str) -> Callable:
+        """Processa condição sobre quantidade de sentenças com expressões.
+
+        Args:
+            operador (str): Operador de comparação (maior, menor, igual, etc.).
+            preposicao (str): Preposição ('a' ou 'que').
+            valor (str): Valor numérico para comparação.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+        valor_int = int(valor)
+
+        def verificar_qtd_sentencas_expressao(texto_analisado):
+            return self._comparar(texto_analisado.qtd_sentencas_com_expressao, operador, valor_int)
+
+        return verificar_qtd_sentencas_expressao
+
+    def _processar_sem_expressoes(self) -> Callable:
+        """Processa condição sobre ausência de expressões.
+
+        Returns:
+            Callable: Função que implementa a condição.
+        """
+
+        def verificar_sem_expressoes(texto_analisado):
+            return texto_analisado.qtd_sentencas_com_expressao == 0
+
+        return verificar_sem_expressoes
+
+    def _comparar(self, valor1: int, operador: str, valor2: int) -> bool:
+        """Realiza comparação entre dois valores com base no operador.
+
+        Args:
+            valor1 (int): Primeiro valor.
+            operador (str): Operador de comparação (maior, menor, igual, etc.).
+            valor2 (int): Segundo valor.
+
+        Returns:
+            bool: Resultado da comparação.
+        """
+        if operador == 'maior':
+            return valor1 > valor2
+        elif operador == 'menor':
+            return valor1 < valor2
+        elif operador == 'igual':
+            return valor1 == valor2
+        elif operador == 'maior ou igual':
+            return valor1 >= valor2
+        elif operador == 'menor ou igual':
+            return valor1 <= valor2
+        else:
+            return False
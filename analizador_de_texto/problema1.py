@@ -6,57 +6,93 @@ Este módulo contém as funções para identificar a presença de expressões pr
 no início das sentenças de um texto.
 
 Funções:
+- sentencas_analisadas: monta a lista de sentenças e expressões de um texto já analisado
+- encontra_expressoes_iter: versão em fluxo (gerador) de encontra_expressoes
 - encontra_expressoes: processa textos e identifica expressões no início de cada sentença
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
-from analizador_de_texto.utils import ler_expressoes, separar_sentencas, verificar_expressao_inicio
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.registro import registro
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.instrumentacao import instrumentacao_ativa
+
+def sentencas_analisadas(texto_analisado: TextoAnalisado) -> List[Dict[str, Any]]:
+    """Monta a lista de sentenças de um texto com a expressão encontrada em cada uma.
+
+    Args:
+        texto_analisado (TextoAnalisado): Texto a ser analisado.
+
+    Returns:
+        List[Dict[str, Any]]: Lista de dicionários com 'sentenca' e 'expressao'.
+    """
+    return [
+        {
+            "sentenca": sentenca,
+            "expressao": expressao_encontrada
+        }
+        for sentenca, expressao_encontrada in zip(texto_analisado.sentencas,
+                                                  texto_analisado.expressoes_sentencas)
+    ]
+
+def encontra_expressoes_iter(
+    informacoes_textos: Iterable[Dict[str, Any]],
+    arquivo_expressoes: str = "expressoes.txt",
+    cache: Optional[CacheResultados] = None
+) -> Iterator[Dict[str, Any]]:
+    """Versão em fluxo de `encontra_expressoes`: produz o resultado de cada texto à medida que é lido.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto. Padrão: sem cache.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Dicionários com 'id' e 'sentenças', na ordem da entrada.
+    """
+    # Obtém a árvore de expressões mantida em memória pelo registro
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    instrumentacao = instrumentacao_ativa()
+    if cache is not None:
+        recursos = ((arquivo_expressoes, registro.hash_expressoes(arquivo_expressoes)),)
+
+    for info_texto in informacoes_textos:
+        id_texto = info_texto["id"]
+        sentencas = None
+        if cache is not None:
+            sentencas = cache.obter('expressoes', recursos, info_texto["texto"])
+
+        if sentencas is None:
+            # Divide o texto em sentenças e procura expressões no início de cada uma
+            texto_analisado = TextoAnalisado(info_texto["texto"], trie_expressoes, id_texto)
+            if instrumentacao is not None:
+                instrumentacao.medir_etapas(texto_analisado, ('separar_sentencas', 'buscar_expressoes'))
+            sentencas = sentencas_analisadas(texto_analisado)
+            if cache is not None:
+                cache.guardar('expressoes', recursos, info_texto["texto"], sentencas)
+
+        yield {
+            "id": id_texto,
+            "sentencas": sentencas
+        }
 
 def encontra_expressoes(
-    informacoes_textos: List[Dict[str, Any]]
+    informacoes_textos: List[Dict[str, Any]],
+    arquivo_expressoes: str = "expressoes.txt",
+    cache: Optional[CacheResultados] = None
 ) -> List[Dict[str, Any]]:
     """Analisa textos, identifica sentenças e verifica a presença de expressões em seus inícios.
 
     Args:
         informacoes_textos (List[Dict[str, Any]]): Lista de dicionários com 'id' e 'texto'.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto. Padrão: sem cache.
 
     Returns:
         List[Dict[str, Any]]: Lista de dicionários com 'id' e 'sentenças', onde 'sentenças'
         é uma lista de dicionários com 'sentença' e 'expressão'.
     """
-    # Carrega as expressões
-    expressoes = ler_expressoes()
-    resultado = []
-
-    for info_texto in informacoes_textos:
-        id_texto = info_texto["id"]
-        texto = info_texto["texto"]
-        # Divide o texto em sentenças
-        sentencas = separar_sentencas(texto)
-
-        # Lista para armazenar as sentenças analisadas
-        sentencas_analisadas = []
-
-        # Analisa cada sentença
-        for sentenca in sentencas:
-            # Procura expressões no início da sentença
-            expressao_encontrada = verificar_expressao_inicio(
-                sentenca, expressoes
-            )
-
-            # Adiciona o resultado para esta sentença
-            sentencas_analisadas.append({
-                "sentenca": sentenca,
-                "expressao": expressao_encontrada
-            })
-
-        # Adiciona o resultado para este texto
-        resultado.append({
-            "id": id_texto,
-            "sentencas": sentencas_analisadas
-        })
-
-    return resultado
+    return list(encontra_expressoes_iter(informacoes_textos, arquivo_expressoes, cache))
 
 if __name__ == '__main__':
     from analizador_de_texto.utils import ler_entrada_json
@@ -6,276 +6,115 @@ Este módulo contém as funções para categorizar textos com base em regras pre
 
 Classes e funções:
 - ParserRegras: classe para analisar e processar regras em linguagem natural
+  (definida em parser_regras.py e reexportada aqui)
+- categorizar: determina as categorias de um texto já analisado
+- aplica_regras_iter: versão em fluxo (gerador) de aplica_regras
 - aplica_regras: aplica as regras processadas aos textos e determina suas categorias
 """
-from typing import List, Dict, Optional, Callable, Any
-import re
-from analizador_de_texto.utils import (verificar_presenca_token, contar_tokens, contar_ocorrencias_token, ler_regras,
-                                       ler_expressoes, separar_sentencas, verificar_expressao_inicio)
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
-class ParserRegras:
-    """Classe para analisar e processar regras em linguagem natural."""
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.registro import registro
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.armazem_caracteristicas import ArmazemCaracteristicas
+from analizador_de_texto.instrumentacao import etapas_regras, instrumentacao_ativa
 
-    def __init__(self):
-        """Inicializa o parser de regras."""
-        # Padrões para identificar condições nas regras
-        self.padroes_condicoes = {
-            r'número de sentenças é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': self._processar_qtd_sentencas,
-            r'número de tokens é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': self._processar_qtd_tokens,
-            r'"([^"]+)" aparece no texto': self._processar_presenca_token,
-            r'número de "([^"]+)" é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': self._processar_qtd_token,
-            r'número de sentenças com expressão é (maior|menor|igual|maior ou igual|menor ou igual) (a|que) (\d+)': self._processar_qtd_sentencas_expressao,
-            r'não tem expressões': self._processar_sem_expressoes
-        }
-
-    def analisar_regras(self, regras_texto: List[str]) -> List[Dict[str, Any]]:
-        """Analisa regras em texto e as converte em funções de condição.
-
-        Args:
-            regras_texto (List[str]): Lista de regras em linguagem natural.
-
-        Returns:
-            List[Dict[str, Any]]: Lista de dicionários com funções de condição e categorias.
-        """
-        regras_processadas = []
-
-        for regra_texto in regras_texto:
-            # Extrai a condição e a categoria da regra
-            match = re.match(r'Se (.*), então a categoria é ([A-Za-z0-9]+)\.?', regra_texto)
-            if match:
-                condicao_texto = match.group(1)
-                categoria = match.group(2)
-
-                # Processa condições compostas (com E)
-                if ' E ' in condicao_texto:
-                    sub_condicoes = condicao_texto.split(' E ')
-                    funcoes_condicao = [
-                        self._analisar_condicao(cond.strip())
-                        for cond in sub_condicoes
-                    ]
-
-                    # Cria uma função composta que verifica todas as sub-condições
-                    def condicao_composta(dados_texto, funcs=funcoes_condicao):
-                        return all(func(dados_texto) for func in funcs if func is not None)
-
-                    funcao_condicao = condicao_composta
-                else:
-                    # Processa condição simples
-                    funcao_condicao = self._analisar_condicao(condicao_texto)
-
-                # Adiciona a regra processada à lista
-                if funcao_condicao:
-                    regras_processadas.append({
-                        'condicao': funcao_condicao,
-                        'categoria': categoria
-                    })
-
-        return regras_processadas
-
-    def _analisar_condicao(self, condicao_texto: str) -> Optional[Callable]:
-        """Analisa uma condição em texto e a converte em uma função.
-
-        Args:
-            condicao_texto (str): Condição em texto.
-
-        Returns:
-            Optional[Callable]: Função que implementa a condição ou None se a condição não for reconhecida.
-        """
-        # Tenta cada padrão de condição
-        for padrao, processador in self.padroes_condicoes.items():
-            match = re.match(padrao, condicao_texto)
-            if match:
-                return processador(*match.groups())
-
-        # Se nenhum padrão corresponder
-        print(f"AVISO: Condição não reconhecida: {condicao_texto}")
-        return None
-
-    def _processar_qtd_sentencas(self, operador: str, preposicao: str, valor: str) -> Callable:
-        """Processa condição sobre quantidade de sentenças.
-
-        Args:
-            operador (str): Operador de comparação (maior, menor, igual, etc.).
-            preposicao (str): Preposição ('a' ou 'que').
-            valor (str): Valor numérico para comparação.
-
-        Returns:
-            Callable: Função que implementa a condição.
-        """
-        valor_int = int(valor)
-
-        def verificar_qtd_sentencas(dados_texto):
-            qtd_sentencas = len(dados_texto['sentencas'])
-            return self._comparar(qtd_sentencas, operador, valor_int)
-
-        return verificar_qtd_sentencas
-
-    def _processar_qtd_tokens(self, operador: str, preposicao: str, valor: str) -> Callable:
-        """Processa condição sobre quantidade de tokens.
-
-        Args:
-            operador (str): Operador de comparação (maior, menor, igual, etc.).
-            preposicao (str): Preposição ('a' ou 'que').
-            valor (str): Valor numérico para comparação.
-
-        Returns:
-            Callable: Função que implementa a condição.
-        """
-        valor_int = int(valor)
-
-        def verificar_qtd_tokens(dados_texto):
-            qtd_tokens = contar_tokens(dados_texto['texto'])
-            return self._comparar(qtd_tokens, operador, valor_int)
-
-        return verificar_qtd_tokens
-
-    def _processar_presenca_token(self, token: str) -> Callable:
-        """Processa condição sobre presença de token específico.
-
-        Args:
-            token (str): Token a ser verificado.
-
-        Returns:
-            Callable: Função que implementa a condição.
-        """
-
-        def verificar_presenca_token_a(dados_texto):
-            return verificar_presenca_token(dados_texto['texto'], token)
-
-        return verificar_presenca_token_a
+def categorizar(texto_analisado: TextoAnalisado, regras: List[Dict[str, Any]]) -> List[str]:
+    """Determina as categorias de um texto já analisado.
 
-    def _processar_qtd_token(self, token: str, operador: str, preposicao: str, valor: str) -> Callable:
-        """Processa condição sobre quantidade de ocorrências de um token.
-
-        Args:
-            token (str): Token a ser contado.
-            operador (str): Operador de comparação (maior, menor, igual, etc.).
-            preposicao (str): Preposição ('a' ou 'que').
-            valor (str): Valor numérico para comparação.
-
-        Returns:
-            Callable: Função que implementa a condição.
-        """
-        valor_int = int(valor)
-
-        def verificar_qtd_token(dados_texto):
-            qtd = contar_ocorrencias_token(dados_texto['texto'], token)
-            return self._comparar(qtd, operador, valor_int)
-
-        return verificar_qtd_token
-
-    def _processar_qtd_sentencas_expressao(self, operador: str, preposicao: str, valor: str) -> Callable:
-        """Processa condição sobre quantidade de sentenças com expressões.
-
-        Args:
-            operador (str): Operador de comparação (maior, menor, igual, etc.).
-            preposicao (str): Preposição ('a' ou 'que').
-            valor (str): Valor numérico para comparação.
-
-        Returns:
-            Callable: Função que implementa a condição.
-        """
-        valor_int = int(valor)
-
-        def verificar_qtd_sentencas_expressao(dados_texto):
-            qtd = sum(1 for expr in dados_texto['expressoes_sentencas'] if expr is not None)
-            return self._comparar(qtd, operador, valor_int)
+    Args:
+        texto_analisado (TextoAnalisado): Texto a ser categorizado.
+        regras (List[Dict[str, Any]]): Regras processadas por `ParserRegras.analisar_regras`.
 
-        return verificar_qtd_sentencas_expressao
+    Returns:
+        List[str]: Categorias atendidas, em ordem alfabética.
+    """
+    categorias = set()
+    for regra in regras:
+        if regra['condicao'](texto_analisado):
+            categorias.add(regra['categoria'])
+    return sorted(categorias)
+
+def aplica_regras_iter(informacoes_textos: Iterable[Dict[str, Any]],
+                       arquivo_regras: str = "regras_linguagem_natural.txt",
+                       arquivo_expressoes: str = "expressoes.txt",
+                       cache: Optional[CacheResultados] = None,
+                       armazem: Optional[ArmazemCaracteristicas] = None) -> Iterator[Dict[str, Any]]:
+    """Versão em fluxo de `aplica_regras`: produz as categorias de cada texto à medida que é lido.
 
-    def _processar_sem_expressoes(self) -> Callable:
-        """Processa condição sobre ausência de expressões.
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto. Padrão: sem cache.
+        armazem (Optional[ArmazemCaracteristicas]): Armazém de onde as características dos textos
+            são lidas (e onde as dos textos novos são guardadas). Padrão: sem armazém.
 
-        Returns:
-            Callable: Função que implementa a condição.
-        """
+    Returns:
+        Iterator[Dict[str, Any]]: Dicionários com 'id' e 'categorias', na ordem da entrada.
+    """
+    # Obtém as regras compiladas e as expressões mantidas em memória pelo registro
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
 
-        def verificar_sem_expressoes(dados_texto):
-            return all(expr is None for expr in dados_texto['expressoes_sentencas'])
+    instrumentacao = instrumentacao_ativa()
+    if instrumentacao is None:
+        avaliar_regras = registro.avaliador_regras(arquivo_regras)
+    else:
+        # Avalia regra a regra para medir o custo e a taxa de disparo de cada uma
+        regras = registro.regras_processadas(arquivo_regras)
+        etapas = etapas_regras(registro.regras_estruturadas(arquivo_regras))
 
-        return verificar_sem_expressoes
+        def avaliar_regras(texto_analisado):
+            instrumentacao.medir_etapas(texto_analisado, etapas)
+            return instrumentacao.avaliar_regras(texto_analisado, regras)
 
-    def _comparar(self, valor1: int, operador: str, valor2: int) -> bool:
-        """Realiza comparação entre dois valores com base no operador.
+    if armazem is not None:
+        hash_expressoes = registro.hash_expressoes(arquivo_expressoes)
 
-        Args:
-            valor1 (int): Primeiro valor.
-            operador (str): Operador de comparação (maior, menor, igual, etc.).
-            valor2 (int): Segundo valor.
+    if cache is not None:
+        recursos = ((arquivo_regras, registro.hash_regras(arquivo_regras)),
+                    (arquivo_expressoes, registro.hash_expressoes(arquivo_expressoes)))
 
-        Returns:
-            bool: Resultado da comparação.
-        """
-        if operador == 'maior':
-            return valor1 > valor2
-        elif operador == 'menor':
-            return valor1 < valor2
-        elif operador == 'igual':
-            return valor1 == valor2
-        elif operador == 'maior ou igual':
-            return valor1 >= valor2
-        elif operador == 'menor ou igual':
-            return valor1 <= valor2
-        else:
-            return False
+    for info_texto in informacoes_textos:
+        categorias = None
+        if cache is not None:
+            categorias = cache.obter('categorias', recursos, info_texto["texto"])
+
+        if categorias is None:
+            if armazem is not None:
+                texto_analisado = armazem.texto_analisado(info_texto["texto"], info_texto["id"],
+                                                          trie_expressoes, hash_expressoes)
+            else:
+                # Sentenças, tokens e expressões são calculados sob demanda pelas regras
+                texto_analisado = TextoAnalisado(info_texto["texto"], trie_expressoes, info_texto["id"])
+            categorias = sorted(avaliar_regras(texto_analisado))
+            if cache is not None:
+                cache.guardar('categorias', recursos, info_texto["texto"], categorias)
+
+        yield {
+            'id': info_texto["id"],
+            'categorias': categorias
+        }
 
 def aplica_regras(informacoes_textos: List[Dict[str, Any]],
                   arquivo_regras: str = "regras_linguagem_natural.txt",
-                  arquivo_expressoes: str = "expressoes.txt") -> List[Dict[str, Any]]:
+                  arquivo_expressoes: str = "expressoes.txt",
+                  cache: Optional[CacheResultados] = None,
+                  armazem: Optional[ArmazemCaracteristicas] = None) -> List[Dict[str, Any]]:
     """Categoriza textos com base em regras predefinidas.
 
     Args:
         informacoes_textos (List[Dict[str, Any]]): Lista de dicionários com 'id' e 'texto'.
         arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
         arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto. Padrão: sem cache.
+        armazem (Optional[ArmazemCaracteristicas]): Armazém de características dos textos. Padrão: sem armazém.
 
     Returns:
         List[Dict[str, Any]]: Lista de dicionários com 'id' e 'categorias'.
     """
-    # Carrega as regras e expressões
-    regras_texto = ler_regras(arquivo_regras)
-    expressoes = ler_expressoes(arquivo_expressoes)
-
-    # Analisa as regras
-    parser = ParserRegras()
-    regras = parser.analisar_regras(regras_texto)
-
-    resultado = []
-    # Processa cada texto
-    for info_texto in informacoes_textos:
-        id_texto = info_texto["id"]
-        texto = info_texto["texto"]
-
-        # Divide o texto em sentenças
-        sentencas = separar_sentencas(texto)
-
-        # Identifica expressões nas sentenças
-        expressoes_encontradas = [
-            verificar_expressao_inicio(sentenca, expressoes)
-            for sentenca in sentencas
-        ]
-
-        # Prepara os dados para aplicação das regras verificar_presenca_token
-        dados_texto = {
-            'id': id_texto,
-            'texto': texto,
-            'sentencas': sentencas,
-            'expressoes_sentencas': expressoes_encontradas
-        }
-
-        # Aplica as regras para determinar categorias
-        categorias = set()
-        for regra in regras:
-            if regra['condicao'](dados_texto):
-                categorias.add(regra['categoria'])
-
-        # Adiciona o resultado para este texto
-        resultado.append({
-            'id': id_texto,
-            'categorias': sorted(list(categorias))
-        })
-
-    return resultado
+    return list(aplica_regras_iter(informacoes_textos, arquivo_regras, arquivo_expressoes, cache, armazem))
 
 if __name__ == '__main__':
     from analizador_de_texto.utils import ler_entrada_json
@@ -0,0 +1,223 @@
+"""recategorizacao.py
+============================
+Recategorização incremental de um corpus quando o arquivo de regras muda.
+
+Na categorização inicial, cada texto gera um registro de estado com as
+características usadas pelas regras (número de sentenças, de tokens, de sentenças
+com expressão e contagens dos literais citados nas regras) e as categorias obtidas.
+
+Quando as regras são editadas, os conjuntos de regras antigo e novo são comparados
+(`diferenca_regras`). Apenas as categorias de regras adicionadas, removidas ou
+modificadas são reavaliadas, e somente com as regras dessas categorias, sobre as
+características guardadas; as demais categorias de cada texto são mantidas. São
+emitidos apenas os textos cujo conjunto de categorias mudou.
+
+O texto original só é necessário quando uma regra nova cita um literal que não foi
+contado na categorização anterior. O estado supõe o mesmo arquivo de expressões da
+categorização que o gerou.
+
+Exemplo:
+    estados = list(gerar_estado_iter(textos))
+    mudancas = list(recategorizar_iter(estados, regras_antigas, regras_novas))
+
+Classes e funções:
+- DiferencaRegras: regras adicionadas e removidas e as categorias afetadas
+- chave_regra: forma normalizada de uma regra, usada na comparação
+- diferenca_regras: compara dois conjuntos de regras estruturadas
+- gerar_estado_iter: categoriza os textos e produz os registros de estado
+- recategorizar_iter: reavalia as categorias afetadas e produz as mudanças
+"""
+from collections import Counter, namedtuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.registro import registro
+from analizador_de_texto.texto_analisado import TextoAnalisado
+
+# Regras adicionadas e removidas (uma regra modificada aparece nas duas listas)
+DiferencaRegras = namedtuple('DiferencaRegras', ['adicionadas', 'removidas', 'categorias_afetadas'])
+
+# Características de TextoAnalisado guardadas no estado de cada texto
+CARACTERISTICAS = ('qtd_sentencas', 'qtd_tokens', 'qtd_sentencas_com_expressao')
+
+
+def chave_regra(regra_estruturada: Dict[str, Any]) -> Tuple[str, FrozenSet[Tuple[str, Tuple[str, ...]]]]:
+    """Forma normalizada de uma regra: a categoria e o conjunto das suas condições.
+
+    A ordem das sub-condições, a preposição ('a' ou 'que') e as maiúsculas dos
+    literais não alteram o resultado da regra e, portanto, não a diferenciam.
+
+    Args:
+        regra_estruturada (Dict[str, Any]): Regra estruturada por `ParserRegras.estruturar_regras`.
+
+    Returns:
+        Tuple[str, FrozenSet]: Categoria e condições normalizadas.
+    """
+    condicoes = set()
+    for condicao in regra_estruturada['condicoes']:
+        argumentos = condicao.argumentos
+        if condicao.tipo == 'presenca_token':
+            argumentos = (argumentos[0].lower(),)
+        elif condicao.tipo == 'qtd_token':
+            argumentos = (argumentos[0].lower(), argumentos[1], str(int(argumentos[3])))
+        elif argumentos:
+            argumentos = (argumentos[0], str(int(argumentos[2])))
+        condicoes.add((condicao.tipo, argumentos))
+    return regra_estruturada['categoria'], frozenset(condicoes)
+
+
+def diferenca_regras(regras_antigas: List[Dict[str, Any]],
+                     regras_novas: List[Dict[str, Any]]) -> DiferencaRegras:
+    """Compara dois conjuntos de regras estruturadas.
+
+    Args:
+        regras_antigas (List[Dict[str, Any]]): Regras usadas na categorização anterior.
+        regras_novas (List[Dict[str, Any]]): Regras atuais.
+
+    Returns:
+        DiferencaRegras: Regras adicionadas, regras removidas e o conjunto das categorias
+        atribuídas por alguma delas (as únicas que podem mudar).
+    """
+    antigas = Counter(chave_regra(regra) for regra in regras_antigas)
+    novas = Counter(chave_regra(regra) for regra in regras_novas)
+
+    adicionadas = [regra for regra in regras_novas if antigas[chave_regra(regra)] < novas[chave_regra(regra)]]
+    removidas = [regra for regra in regras_antigas if novas[chave_regra(regra)] < antigas[chave_regra(regra)]]
+    categorias_afetadas = {regra['categoria'] for regra in adicionadas + removidas}
+    return DiferencaRegras(adicionadas, removidas, categorias_afetadas)
+
+
+def _literais(regras_estruturadas: List[Dict[str, Any]]) -> List[str]:
+    """Literais (em minúsculas) citados pelas regras, sem repetição."""
+    literais = {}
+    for regra in regras_estruturadas:
+        for condicao in regra['condicoes']:
+            if condicao.tipo in ('presenca_token', 'qtd_token'):
+                literais[condicao.argumentos[0].lower()] = None
+    return list(literais)
+
+
+def _estado_texto(texto_analisado: TextoAnalisado, literais: List[str], categorias: List[str]) -> Dict[str, Any]:
+    """Registro de estado de um texto já analisado."""
+    estado = {'id': texto_analisado.id, 'hash_texto': CacheResultados.hash_texto(texto_analisado.texto)}
+    for caracteristica in CARACTERISTICAS:
+        estado[caracteristica] = getattr(texto_analisado, caracteristica)
+    estado['contagens'] = {literal: texto_analisado.contar_ocorrencias(literal) for literal in literais}
+    estado['categorias'] = categorias
+    return estado
+
+
+def _texto_do_estado(estado: Dict[str, Any], texto: Optional[str]) -> TextoAnalisado:
+    """Texto analisado com as características guardadas no estado já memorizadas.
+
+    Sem o texto original, apenas os literais contados no estado podem ser consultados.
+    """
+    texto_analisado = TextoAnalisado(texto if texto is not None else '', id_texto=estado['id'])
+    for caracteristica in CARACTERISTICAS:
+        texto_analisado.__dict__[caracteristica] = estado[caracteristica]
+    texto_analisado._contagens.update(estado['contagens'])
+    return texto_analisado
+
+
+def gerar_estado_iter(informacoes_textos: Iterable[Dict[str, Any]],
+                      arquivo_regras: str = "regras_linguagem_natural.txt",
+                      arquivo_expressoes: str = "expressoes.txt") -> Iterator[Dict[str, Any]]:
+    """Categoriza os textos e produz o registro de estado de cada um.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras. Padrão: "regras_linguagem_natural.txt".
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        Iterator[Dict[str, Any]]: Registros serializáveis em JSON com 'id', 'hash_texto', as
+        características ('qtd_sentencas', 'qtd_tokens', 'qtd_sentencas_com_expressao'),
+        'contagens' ({literal: ocorrências}) e 'categorias' (mesma saída de `aplica_regras`).
+    """
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    avaliar_regras = registro.avaliador_regras(arquivo_regras)
+    literais = _literais(registro.regras_estruturadas(arquivo_regras))
+
+    for info_texto in informacoes_textos:
+        texto_analisado = TextoAnalisado(info_texto["texto"], trie_expressoes, info_texto["id"])
+        categorias = sorted(avaliar_regras(texto_analisado))
+        yield _estado_texto(texto_analisado, literais, categorias)
+
+
+def recategorizar_iter(estados: Iterable[Dict[str, Any]], regras_antigas: List[str], regras_novas: List[str],
+                       textos: Optional[Mapping[Any, str]] = None,
+                       arquivo_expressoes: str = "expressoes.txt") -> Iterator[Dict[str, Any]]:
+    """Reavalia apenas as categorias afetadas pela mudança das regras.
+
+    Os registros de estado são atualizados no próprio dicionário (categorias e novas
+    contagens), de forma que possam ser gravados novamente para a próxima mudança.
+    Um texto presente em `textos` com conteúdo diferente do registrado é reanalisado
+    por completo.
+
+    Args:
+        estados (Iterable[Dict[str, Any]]): Registros produzidos por `gerar_estado_iter`.
+        regras_antigas (List[str]): Regras em linguagem natural usadas para gerar os registros.
+        regras_novas (List[str]): Regras em linguagem natural atuais.
+        textos (Optional[Mapping[Any, str]]): Texto original de cada id. Necessário apenas se
+            uma regra nova citar um literal não contado nos registros.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+
+    Returns:
+        Iterator[Dict[str, Any]]: Dicionários com 'id', 'categorias' (novas) e 'anteriores',
+        apenas para os textos cujo conjunto de categorias mudou.
+
+    Raises:
+        ValueError: Se uma regra nova precisar de um literal não contado e o texto não for fornecido.
+    """
+    parser = ParserRegras()
+    estruturadas_novas = parser.estruturar_regras(regras_novas)
+    diferenca = diferenca_regras(parser.estruturar_regras(regras_antigas), estruturadas_novas)
+    afetadas = diferenca.categorias_afetadas
+
+    # Só as regras novas das categorias afetadas precisam ser avaliadas
+    regras_afetadas = parser.converter_regras(
+        [regra for regra in estruturadas_novas if regra['categoria'] in afetadas])
+    literais_afetados = _literais([regra for regra in estruturadas_novas if regra['categoria'] in afetadas])
+    literais_novos = _literais(estruturadas_novas)
+    trie_expressoes = None
+    avaliar_regras = None
+
+    for estado in estados:
+        anteriores = estado['categorias']
+        texto = textos.get(estado['id']) if textos is not None else None
+
+        if texto is not None and CacheResultados.hash_texto(texto) != estado['hash_texto']:
+            # Texto alterado desde a categorização anterior: reanalisa com as regras novas
+            if avaliar_regras is None:
+                trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+                avaliar_regras = parser.converter_regras(estruturadas_novas)
+            texto_analisado = TextoAnalisado(texto, trie_expressoes, estado['id'])
+            categorias = sorted({regra['categoria'] for regra in avaliar_regras
+                                 if regra['condicao'](texto_analisado)})
+            estado.update(_estado_texto(texto_analisado, literais_novos, categorias))
+        else:
+            if not afetadas:
+                continue
+            faltantes = [literal for literal in literais_afetados if literal not in estado['contagens']]
+            if faltantes and texto is None:
+                raise ValueError(f"Texto {estado['id']!r} necessário para contar os literais: "
+                                 + ', '.join(repr(literal) for literal in faltantes))
+
+            texto_analisado = _texto_do_estado(estado, texto)
+            # Os literais novos são contados no texto e passam a fazer parte do estado
+            for literal in faltantes:
+                estado['contagens'][literal] = texto_analisado.contar_ocorrencias(literal)
+
+            categorias_afetadas: Set[str] = {regra['categoria'] for regra in regras_afetadas
+                                             if regra['condicao'](texto_analisado)}
+            categorias = sorted({categoria for categoria in anteriores if categoria not in afetadas}
+                                | categorias_afetadas)
+            estado['categorias'] = categorias
+
+        if categorias != anteriores:
+            yield {
+                'id': estado['id'],
+                'categorias': categorias,
+                'anteriores': anteriores
+            }
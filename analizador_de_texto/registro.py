@@ -0,0 +1,291 @@
+"""registro.py
+============================
+Registro de recursos (expressões e regras) mantidos em memória durante o processo.
+
+Os arquivos de expressões e regras são lidos e processados uma única vez; as
+chamadas seguintes reutilizam a árvore de expressões e o avaliador de regras já
+compilados. A cada acesso o registro compara a data de modificação e o tamanho
+do arquivo com os da última leitura: se mudaram, o arquivo é relido e, caso o
+conteúdo (hash) também tenha mudado, os recursos derivados são reconstruídos.
+Assim, edições nas regras são percebidas sem reiniciar o processo.
+
+Classes e objetos:
+- RegistroRecursos: cache de recursos com invalidação por data de modificação e hash
+- registro: instância compartilhada pelo processo
+
+Recursos pré-compilados (`artefato_regras`) podem ser instalados com
+`instalar_artefato`, evitando a análise das regras na inicialização de workers.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
+
+from analizador_de_texto.utils import caminho_amostras, ler_expressoes, ler_regras
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.compilador_regras import compilar_regras
+
+ARQUIVO_EXPRESSOES = "expressoes.txt"
+ARQUIVO_REGRAS = "regras_linguagem_natural.txt"
+
+
+class _Arquivo:
+    """Conteúdo lido de um arquivo de recursos e a assinatura usada para invalidá-lo."""
+
+    def __init__(self, assinatura: Optional[Tuple[int, int]], linhas: List[str]):
+        self.assinatura = assinatura
+        self.linhas = linhas
+        self.hash = hashlib.sha256('\n'.join(linhas).encode('utf-8')).hexdigest()
+        self.verificado_em = time.monotonic()
+        self.do_artefato = False
+
+
+class RegistroRecursos:
+    """Cache de expressões e regras processadas, invalidado por data de modificação e hash."""
+
+    def __init__(self, intervalo_verificacao: float = 0.0, max_prefixos: int = 0):
+        """Inicializa o registro vazio.
+
+        Args:
+            intervalo_verificacao (float): Intervalo mínimo, em segundos, entre duas verificações
+                da data de modificação de um mesmo arquivo. Padrão: 0 (verifica a cada acesso).
+            max_prefixos (int): Tamanho do cache de prefixos de sentença de cada árvore de
+                expressões. Padrão: 0 (sem cache).
+        """
+        self.intervalo_verificacao = intervalo_verificacao
+        self.max_prefixos = max_prefixos
+        self._trava = threading.RLock()
+        self._caminhos = {}
+        self._arquivos = {}
+        self._derivados = {}
+
+    def _assinatura(self, nome_arquivo: str) -> Optional[Tuple[int, int]]:
+        """Data de modificação e tamanho do arquivo (ou None se não puder ser consultado)."""
+        caminho = self._caminhos.get(nome_arquivo)
+        if caminho is None:
+            caminho = self._caminhos[nome_arquivo] = caminho_amostras(nome_arquivo)
+        try:
+            estado = os.stat(caminho)
+        except OSError:
+            return None
+        return estado.st_mtime_ns, estado.st_size
+
+    def _arquivo(self, nome_arquivo: str, ler: Callable[[str], List[str]]) -> _Arquivo:
+        """Retorna o conteúdo do arquivo, relendo-o se tiver sido modificado.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo de recursos.
+            ler (Callable[[str], List[str]]): Função de leitura (`ler_expressoes` ou `ler_regras`).
+
+        Returns:
+            _Arquivo: Conteúdo atual do arquivo.
+        """
+        with self._trava:
+            arquivo = self._arquivos.get(nome_arquivo)
+            agora = time.monotonic()
+            if arquivo is not None and agora - arquivo.verificado_em < self.intervalo_verificacao:
+                return arquivo
+
+            assinatura = self._assinatura(nome_arquivo)
+            if arquivo is not None and assinatura == arquivo.assinatura and (
+                    assinatura is not None or arquivo.do_artefato):
+                # Sem arquivo em disco, o conteúdo instalado de um artefato continua valendo
+                arquivo.verificado_em = agora
+                return arquivo
+
+            novo = _Arquivo(assinatura, ler(nome_arquivo))
+            if arquivo is None or novo.hash != arquivo.hash:
+                self._arquivos[nome_arquivo] = novo
+                return novo
+
+            # Arquivo tocado sem mudança de conteúdo: mantém os recursos derivados
+            arquivo.assinatura = assinatura
+            arquivo.verificado_em = agora
+            return arquivo
+
+    def _derivado(self, tipo: str, nome_arquivo: str, ler: Callable[[str], List[str]],
+                  construir: Callable[[List[str]], Any]) -> Any:
+        """Retorna um recurso derivado do arquivo, reconstruindo-o se o conteúdo mudou.
+
+        Args:
+            tipo (str): Tipo do recurso derivado.
+            nome_arquivo (str): Nome do arquivo de origem.
+            ler (Callable[[str], List[str]]): Função de leitura do arquivo.
+            construir (Callable[[List[str]], Any]): Função que constrói o recurso a partir das linhas.
+
+        Returns:
+            Any: Recurso derivado.
+        """
+        with self._trava:
+            arquivo = self._arquivo(nome_arquivo, ler)
+            chave = (tipo, nome_arquivo)
+            derivado = self._derivados.get(chave)
+            if derivado is None or derivado[0] != arquivo.hash:
+                derivado = self._derivados[chave] = (arquivo.hash, construir(arquivo.linhas))
+            return derivado[1]
+
+    def expressoes(self, nome_arquivo: str = ARQUIVO_EXPRESSOES) -> List[str]:
+        """Lista de expressões do arquivo.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com expressões.
+
+        Returns:
+            List[str]: Lista de expressões.
+        """
+        return self._arquivo(nome_arquivo, ler_expressoes).linhas
+
+    def hash_expressoes(self, nome_arquivo: str = ARQUIVO_EXPRESSOES) -> str:
+        """Hash do conteúdo atual do arquivo de expressões.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com expressões.
+
+        Returns:
+            str: Hash SHA-256 (hexadecimal) das expressões.
+        """
+        return self._arquivo(nome_arquivo, ler_expressoes).hash
+
+    def trie_expressoes(self, nome_arquivo: str = ARQUIVO_EXPRESSOES) -> TrieExpressoes:
+        """Árvore de prefixos construída a partir do arquivo de expressões.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com expressões.
+
+        Returns:
+            TrieExpressoes: Árvore de expressões.
+        """
+        return self._derivado('trie_expressoes', nome_arquivo, ler_expressoes,
+                              lambda expressoes: TrieExpressoes(expressoes, max_prefixos=self.max_prefixos))
+
+    def regras(self, nome_arquivo: str = ARQUIVO_REGRAS) -> List[str]:
+        """Lista de regras em linguagem natural do arquivo.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com regras.
+
+        Returns:
+            List[str]: Lista de regras.
+        """
+        return self._arquivo(nome_arquivo, ler_regras).linhas
+
+    def hash_regras(self, nome_arquivo: str = ARQUIVO_REGRAS) -> str:
+        """Hash do conteúdo atual do arquivo de regras.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com regras.
+
+        Returns:
+            str: Hash SHA-256 (hexadecimal) das regras.
+        """
+        return self._arquivo(nome_arquivo, ler_regras).hash
+
+    def regras_estruturadas(self, nome_arquivo: str = ARQUIVO_REGRAS) -> List[Dict[str, Any]]:
+        """Regras do arquivo na forma estruturada (saída de `ParserRegras.estruturar_regras`).
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com regras.
+
+        Returns:
+            List[Dict[str, Any]]: Regras estruturadas.
+        """
+        return self._derivado('regras_estruturadas', nome_arquivo, ler_regras,
+                              ParserRegras().estruturar_regras)
+
+    def regras_processadas(self, nome_arquivo: str = ARQUIVO_REGRAS) -> List[Dict[str, Any]]:
+        """Regras do arquivo convertidas em funções de condição (saída de `ParserRegras.analisar_regras`).
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com regras.
+
+        Returns:
+            List[Dict[str, Any]]: Regras processadas.
+        """
+        return self._derivado('regras_processadas', nome_arquivo, ler_regras,
+                              lambda _: ParserRegras().converter_regras(self.regras_estruturadas(nome_arquivo)))
+
+    def avaliador_regras(self, nome_arquivo: str = ARQUIVO_REGRAS) -> Callable:
+        """Função avaliadora compilada a partir do arquivo de regras.
+
+        Args:
+            nome_arquivo (str): Nome do arquivo com regras.
+
+        Returns:
+            Callable: Função gerada por `compilar_regras`.
+        """
+        return self._derivado('avaliador_regras', nome_arquivo, ler_regras,
+                              lambda _: compilar_regras(self.regras_estruturadas(nome_arquivo)))
+
+    def precarregar(self, arquivo_regras: str = ARQUIVO_REGRAS,
+                    arquivo_expressoes: str = ARQUIVO_EXPRESSOES) -> None:
+        """Carrega e compila antecipadamente as regras e expressões.
+
+        Útil na inicialização de workers, para que a primeira requisição não pague o custo da leitura.
+
+        Args:
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+        """
+        self.trie_expressoes(arquivo_expressoes)
+        self.avaliador_regras(arquivo_regras)
+
+    def instalar_artefato(self, artefato: Any) -> List[str]:
+        """Instala os recursos já construídos de um artefato pré-compilado.
+
+        As regras estruturadas, o avaliador compilado e a árvore de expressões do artefato
+        passam a ser usados sem leitura nem análise dos arquivos. Um arquivo presente em
+        disco com conteúdo diferente do artefato prevalece: a parte correspondente do
+        artefato é ignorada. Sem o arquivo em disco, o conteúdo do artefato é mantido.
+
+        Args:
+            artefato (ArtefatoRegras): Saída de `artefato_regras.carregar_artefato`.
+
+        Returns:
+            List[str]: Nomes dos arquivos cujos recursos foram instalados.
+        """
+        recursos = (
+            (artefato.arquivo_regras, ler_regras, artefato.regras,
+             {'regras_estruturadas': artefato.regras_estruturadas,
+              'avaliador_regras': artefato.avaliador_regras}),
+            (artefato.arquivo_expressoes, ler_expressoes, artefato.expressoes,
+             {'trie_expressoes': artefato.trie_expressoes}),
+        )
+        instalados = []
+        with self._trava:
+            for nome_arquivo, ler, linhas, derivados in recursos:
+                assinatura = self._assinatura(nome_arquivo)
+                arquivo = _Arquivo(assinatura, linhas)
+                if assinatura is not None and _Arquivo(assinatura, ler(nome_arquivo)).hash != arquivo.hash:
+                    continue
+                arquivo.do_artefato = True
+                if 'trie_expressoes' in derivados:
+                    derivados['trie_expressoes'].configurar_cache(self.max_prefixos)
+                self._arquivos[nome_arquivo] = arquivo
+                for tipo, derivado in derivados.items():
+                    self._derivados[(tipo, nome_arquivo)] = (arquivo.hash, derivado)
+                instalados.append(nome_arquivo)
+        return instalados
+
+    def recarregar(self, nome_arquivo: Optional[str] = None) -> None:
+        """Descarta os recursos em cache, forçando a releitura no próximo acesso.
+
+        Args:
+            nome_arquivo (Optional[str]): Arquivo a ser descartado. Se None, descarta todos.
+        """
+        with self._trava:
+            if nome_arquivo is None:
+                self._caminhos.clear()
+                self._arquivos.clear()
+                self._derivados.clear()
+                return
+
+            self._caminhos.pop(nome_arquivo, None)
+            self._arquivos.pop(nome_arquivo, None)
+            for chave in [chave for chave in self._derivados if chave[1] == nome_arquivo]:
+                del self._derivados[chave]
+
+
+# Instância compartilhada pelo processo
+registro = RegistroRecursos()
@@ -0,0 +1,193 @@
+"""resultado_colunar.py
+============================
+Formato colunar para os resultados de `encontra_expressoes` em lotes grandes.
+
+Em vez de uma lista de dicionários com uma cópia de cada sentença, o resultado
+é guardado em colunas paralelas (`array.array`):
+- ids: identificador de cada texto;
+- inicio_sentencas: posição, nas colunas de sentenças, da primeira sentença de
+  cada texto (com um elemento final igual ao total de sentenças);
+- sentenca_inicio / sentenca_fim: posição da sentença dentro do seu texto;
+- expressao: índice da expressão na tabela de expressões (-1 se não houver).
+
+As sentenças não são copiadas: são recuperadas dos textos originais quando o
+resultado é convertido para o formato JSON atual. Com NumPy instalado, as
+colunas podem ser vistas como arrays NumPy sem cópia, para agregações vetorizadas.
+
+Classes e funções:
+- ResultadoColunar: resultado em colunas, conversível sem perdas para o formato JSON
+- encontra_expressoes_colunar: versão colunar de `encontra_expressoes`
+"""
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from analizador_de_texto.registro import registro
+from analizador_de_texto.utils import separar_sentencas_spans
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional
+    numpy = None
+
+# Valor da coluna `expressao` para sentenças sem expressão
+SEM_EXPRESSAO = -1
+
+
+class ResultadoColunar:
+    """Resultado de `encontra_expressoes` em colunas paralelas."""
+
+    def __init__(self, expressoes: List[str]):
+        """Inicializa um resultado vazio.
+
+        Args:
+            expressoes (List[str]): Tabela de expressões referenciada pela coluna `expressao`.
+        """
+        self.expressoes = expressoes
+        self.ids = []
+        self.textos = []
+        self.inicio_sentencas = array('q', [0])
+        self.sentenca_inicio = array('q')
+        self.sentenca_fim = array('q')
+        self.expressao = array('q')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def qtd_sentencas(self) -> int:
+        """Número total de sentenças."""
+        return len(self.expressao)
+
+    def adicionar(self, id_texto: Any, texto: str, spans: Iterable, indices_expressoes: Iterable[int]) -> None:
+        """Acrescenta o resultado de um texto.
+
+        Args:
+            id_texto (Any): Identificador do texto.
+            texto (str): Texto original.
+            spans (Iterable): Pares (início, fim) das sentenças no texto.
+            indices_expressoes (Iterable[int]): Índice da expressão de cada sentença (ou SEM_EXPRESSAO).
+        """
+        self.ids.append(id_texto)
+        self.textos.append(texto)
+        for inicio, fim in spans:
+            self.sentenca_inicio.append(inicio)
+            self.sentenca_fim.append(fim)
+        self.expressao.extend(indices_expressoes)
+        self.inicio_sentencas.append(len(self.expressao))
+
+    def sentencas(self, indice_texto: int) -> List[Dict[str, Any]]:
+        """Sentenças de um texto no formato de `encontra_expressoes`.
+
+        Args:
+            indice_texto (int): Posição do texto no resultado.
+
+        Returns:
+            List[Dict[str, Any]]: Lista de dicionários com 'sentenca' e 'expressao'.
+        """
+        texto = self.textos[indice_texto]
+        return [
+            {
+                'sentenca': texto[self.sentenca_inicio[posicao]:self.sentenca_fim[posicao]],
+                'expressao': None if self.expressao[posicao] == SEM_EXPRESSAO
+                else self.expressoes[self.expressao[posicao]]
+            }
+            for posicao in range(self.inicio_sentencas[indice_texto], self.inicio_sentencas[indice_texto + 1])
+        ]
+
+    def iter_json(self) -> Iterator[Dict[str, Any]]:
+        """Produz os resultados no formato de `encontra_expressoes`, um texto por vez.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Dicionários com 'id' e 'sentencas'.
+        """
+        for indice_texto, id_texto in enumerate(self.ids):
+            yield {'id': id_texto, 'sentencas': self.sentencas(indice_texto)}
+
+    def para_json(self) -> List[Dict[str, Any]]:
+        """Converte para o formato de `encontra_expressoes` (sem perdas).
+
+        Returns:
+            List[Dict[str, Any]]: Mesma saída de `encontra_expressoes`.
+        """
+        return list(self.iter_json())
+
+    def texto_das_sentencas(self) -> array:
+        """Posição do texto de cada sentença (coluna auxiliar para agrupamentos).
+
+        Returns:
+            array: Para cada sentença, o índice do seu texto.
+        """
+        coluna = array('q')
+        for indice_texto in range(len(self.ids)):
+            coluna.extend([indice_texto] * (self.inicio_sentencas[indice_texto + 1]
+                                            - self.inicio_sentencas[indice_texto]))
+        return coluna
+
+    def contagem_expressoes(self) -> Dict[str, int]:
+        """Número de sentenças iniciadas por cada expressão.
+
+        Returns:
+            Dict[str, int]: Contagem por expressão (apenas as que ocorreram).
+        """
+        if numpy is not None and self.qtd_sentencas:
+            indices = numpy.frombuffer(self.expressao, dtype=numpy.int64)
+            contagens = numpy.bincount(indices[indices != SEM_EXPRESSAO], minlength=len(self.expressoes))
+            return {self.expressoes[i]: int(qtd) for i, qtd in enumerate(contagens) if qtd}
+
+        contagens = {}
+        for indice in self.expressao:
+            if indice != SEM_EXPRESSAO:
+                expressao = self.expressoes[indice]
+                contagens[expressao] = contagens.get(expressao, 0) + 1
+        return contagens
+
+    def colunas_numpy(self) -> Dict[str, Any]:
+        """Colunas numéricas como arrays NumPy, sem cópia.
+
+        Returns:
+            Dict[str, numpy.ndarray]: 'inicio_sentencas', 'sentenca_inicio', 'sentenca_fim' e 'expressao'.
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+        if numpy is None:
+            raise ImportError("O NumPy é necessário para colunas_numpy (pip install numpy)")
+        # Um buffer vazio não é aceito por todas as versões de `frombuffer`
+        return {
+            nome: (numpy.frombuffer(coluna, dtype=numpy.int64) if len(coluna)
+                   else numpy.empty(0, dtype=numpy.int64))
+            for nome, coluna in (('inicio_sentencas', self.inicio_sentencas),
+                                 ('sentenca_inicio', self.sentenca_inicio),
+                                 ('sentenca_fim', self.sentenca_fim),
+                                 ('expressao', self.expressao))
+        }
+
+
+def encontra_expressoes_colunar(informacoes_textos: Iterable[Dict[str, Any]],
+                                arquivo_expressoes: str = "expressoes.txt",
+                                resultado: Optional[ResultadoColunar] = None) -> ResultadoColunar:
+    """Versão colunar de `encontra_expressoes`.
+
+    Args:
+        informacoes_textos (Iterable[Dict[str, Any]]): Iterável de dicionários com 'id' e 'texto'.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões. Padrão: "expressoes.txt".
+        resultado (Optional[ResultadoColunar]): Resultado ao qual os textos são acrescentados.
+            Padrão: um novo resultado.
+
+    Returns:
+        ResultadoColunar: Resultado em colunas; `para_json()` reproduz a saída de `encontra_expressoes`.
+    """
+    trie_expressoes = registro.trie_expressoes(arquivo_expressoes)
+    if resultado is None:
+        resultado = ResultadoColunar(trie_expressoes.expressoes)
+    elif resultado.expressoes != trie_expressoes.expressoes:
+        raise ValueError("O resultado usa uma tabela de expressões diferente da do arquivo")
+
+    for info_texto in informacoes_textos:
+        texto = info_texto["texto"]
+        spans = separar_sentencas_spans(texto)
+        indices = [SEM_EXPRESSAO if indice is None else indice
+                   for indice in trie_expressoes.buscar_indices_spans(texto, spans)]
+        resultado.adicionar(info_texto["id"], texto, spans, indices)
+
+    return resultado
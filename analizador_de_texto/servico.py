@@ -0,0 +1,398 @@
+"""servico.py
+============================
+Serviço HTTP (asyncio, apenas biblioteca padrão) para verificação de expressões e
+categorização de textos.
+
+As regras compiladas e a árvore de expressões ficam residentes em memória (via
+registro de recursos). Requisições concorrentes são agrupadas em micro-lotes, com
+tamanho máximo e tempo máximo de espera configuráveis, e cada lote é processado
+em um executor, de forma que o laço de eventos continue respondendo.
+
+Endpoints (corpo JSON: um registro {"id", "texto"} ou uma lista de registros):
+- POST /expressoes: saída de encontra_expressoes
+- POST /categorias: saída de aplica_regras
+- GET /saude: estado do serviço e estatísticas dos lotes (e do cache, se houver)
+
+Classes:
+- AgrupadorLotes: agrupa registros enviados concorrentemente em micro-lotes
+- ServicoClassificacao: servidor HTTP
+- ClienteServico: cliente HTTP simples para o serviço
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import http.client
+import json
+
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.problema1 import encontra_expressoes_iter
+from analizador_de_texto.problema2 import aplica_regras_iter
+from analizador_de_texto.registro import registro
+
+ROTAS = {'/expressoes': 'expressoes', '/categorias': 'categorias'}
+
+MENSAGENS_STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+
+def processar_lote(tarefa: str, registros: List[Dict[str, Any]],
+                   arquivo_regras: str = "regras_linguagem_natural.txt",
+                   arquivo_expressoes: str = "expressoes.txt",
+                   cache: Optional[CacheResultados] = None) -> List[Dict[str, Any]]:
+    """Processa um lote de registros (executado fora do laço de eventos).
+
+    Args:
+        tarefa (str): 'expressoes' (problema 1) ou 'categorias' (problema 2).
+        registros (List[Dict[str, Any]]): Registros com 'id' e 'texto'.
+        arquivo_regras (str, optional): Nome do arquivo com regras.
+        arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+        cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto.
+
+    Returns:
+        List[Dict[str, Any]]: Resultados, na ordem dos registros.
+    """
+    if tarefa == 'expressoes':
+        return list(encontra_expressoes_iter(registros, arquivo_expressoes, cache))
+    return list(aplica_regras_iter(registros, arquivo_regras, arquivo_expressoes, cache))
+
+
+class AgrupadorLotes:
+    """Agrupa registros enviados concorrentemente em micro-lotes processados em um executor."""
+
+    def __init__(self, executor: Executor, max_lote: int = 64, max_espera: float = 0.005,
+                 arquivo_regras: str = "regras_linguagem_natural.txt",
+                 arquivo_expressoes: str = "expressoes.txt",
+                 cache: Optional[CacheResultados] = None):
+        """Inicializa o agrupador.
+
+        Args:
+            executor (Executor): Executor onde os lotes são processados.
+            max_lote (int): Número máximo de registros por lote.
+            max_espera (float): Tempo máximo, em segundos, que o primeiro registro aguarda o lote encher.
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+            cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto.
+        """
+        self.executor = executor
+        self.max_lote = max_lote
+        self.max_espera = max_espera
+        self.arquivo_regras = arquivo_regras
+        self.arquivo_expressoes = arquivo_expressoes
+        self.cache = cache
+        self.lotes_processados = 0
+        self.registros_processados = 0
+        self._filas = {}
+        self._tarefas = set()
+
+    async def submeter(self, tarefa: str, registro_texto: Dict[str, Any]) -> Dict[str, Any]:
+        """Envia um registro para o próximo lote e aguarda o seu resultado.
+
+        Args:
+            tarefa (str): 'expressoes' ou 'categorias'.
+            registro_texto (Dict[str, Any]): Registro com 'id' e 'texto'.
+
+        Returns:
+            Dict[str, Any]: Resultado do registro.
+        """
+        fila = self._filas.get(tarefa)
+        if fila is None:
+            fila = self._filas[tarefa] = asyncio.Queue()
+            consumidor = asyncio.ensure_future(self._consumir(tarefa, fila))
+            self._tarefas.add(consumidor)
+
+        futuro = asyncio.get_running_loop().create_future()
+        await fila.put((registro_texto, futuro))
+        return await futuro
+
+    async def _consumir(self, tarefa: str, fila: asyncio.Queue) -> None:
+        """Monta os lotes de uma tarefa e os envia ao executor."""
+        loop = asyncio.get_running_loop()
+        # Leitura da fila que ainda não terminou; nunca é cancelada para não perder registros
+        leitura = None
+
+        try:
+            while True:
+                if leitura is None:
+                    leitura = asyncio.ensure_future(fila.get())
+                lote = [await leitura]
+                leitura = None
+
+                limite = loop.time() + self.max_espera
+                while len(lote) < self.max_lote:
+                    try:
+                        lote.append(fila.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    restante = limite - loop.time()
+                    if restante <= 0:
+                        break
+                    leitura = asyncio.ensure_future(fila.get())
+                    concluidas, _ = await asyncio.wait({leitura}, timeout=restante)
+                    if not concluidas:
+                        break
+                    lote.append(leitura.result())
+                    leitura = None
+
+                await self._processar(tarefa, lote)
+        finally:
+            if leitura is not None:
+                leitura.cancel()
+
+    async def _processar(self, tarefa: str, lote: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Processa um lote no executor e entrega os resultados aos respectivos futuros."""
+        loop = asyncio.get_running_loop()
+        registros = [registro_texto for registro_texto, _ in lote]
+        try:
+            resultados = await loop.run_in_executor(
+                self.executor, processar_lote, tarefa, registros,
+                self.arquivo_regras, self.arquivo_expressoes, self.cache
+            )
+        except Exception as erro:
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(erro)
+            return
+
+        self.lotes_processados += 1
+        self.registros_processados += len(lote)
+        for (_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+    async def encerrar(self) -> None:
+        """Cancela os consumidores de lotes."""
+        for consumidor in self._tarefas:
+            consumidor.cancel()
+        await asyncio.gather(*self._tarefas, return_exceptions=True)
+        self._tarefas.clear()
+        self._filas.clear()
+
+
+class _ErroHTTP(Exception):
+    """Erro que deve ser devolvido ao cliente com o status indicado."""
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+class ServicoClassificacao:
+    """Servidor HTTP asyncio para verificação de expressões e categorização de textos."""
+
+    def __init__(self, host: str = "127.0.0.1", porta: int = 8080, max_lote: int = 64,
+                 max_espera: float = 0.005, executor: Optional[Executor] = None,
+                 arquivo_regras: str = "regras_linguagem_natural.txt",
+                 arquivo_expressoes: str = "expressoes.txt",
+                 max_tamanho_corpo: int = 16 * 1024 * 1024,
+                 cache: Optional[CacheResultados] = None):
+        """Inicializa o serviço.
+
+        Args:
+            host (str): Endereço de escuta.
+            porta (int): Porta de escuta (0 escolhe uma porta livre).
+            max_lote (int): Número máximo de registros por micro-lote.
+            max_espera (float): Tempo máximo, em segundos, de espera para completar um micro-lote.
+            executor (Optional[Executor]): Executor dos lotes. Padrão: uma thread dedicada.
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+            max_tamanho_corpo (int): Tamanho máximo, em bytes, do corpo de uma requisição.
+            cache (Optional[CacheResultados]): Cache de resultados por conteúdo do texto.
+        """
+        self.host = host
+        self.porta = porta
+        self.max_tamanho_corpo = max_tamanho_corpo
+        self.arquivo_regras = arquivo_regras
+        self.arquivo_expressoes = arquivo_expressoes
+        self._executor_proprio = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.agrupador = AgrupadorLotes(self.executor, max_lote, max_espera,
+                                        arquivo_regras, arquivo_expressoes, cache)
+        self._servidor = None
+
+    async def iniciar(self) -> Tuple[str, int]:
+        """Carrega os recursos e começa a aceitar conexões.
+
+        Returns:
+            Tuple[str, int]: Endereço e porta efetivamente usados.
+        """
+        registro.precarregar(self.arquivo_regras, self.arquivo_expressoes)
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.host, self.porta = self._servidor.sockets[0].getsockname()[:2]
+        return self.host, self.porta
+
+    async def servir_para_sempre(self) -> None:
+        """Inicia o serviço (se necessário) e atende até ser cancelado."""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def encerrar(self) -> None:
+        """Para de aceitar conexões e libera os recursos."""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        await self.agrupador.encerrar()
+        if self._executor_proprio:
+            self.executor.shutdown(wait=False)
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atende as requisições de uma conexão (com suporte a keep-alive)."""
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+
+                try:
+                    metodo, caminho, versao = linha.decode('latin-1').split()
+                except ValueError:
+                    await self._responder(escritor, 400, {'erro': 'Linha de requisição inválida'}, False)
+                    break
+
+                cabecalhos = {}
+                while True:
+                    linha = await leitor.readline()
+                    if linha in (b'\r\n', b'\n', b''):
+                        break
+                    nome, _, valor = linha.decode('latin-1').partition(':')
+                    cabecalhos[nome.strip().lower()] = valor.strip()
+
+                manter_conexao = (versao == 'HTTP/1.1' and cabecalhos.get('connection', '').lower() != 'close')
+                try:
+                    tamanho = int(cabecalhos.get('content-length', 0))
+                    if tamanho > self.max_tamanho_corpo:
+                        raise _ErroHTTP(413, 'Corpo da requisição muito grande')
+                    corpo = await leitor.readexactly(tamanho) if tamanho else b''
+                    status, resposta = 200, await self._rotear(metodo, caminho, corpo)
+                except _ErroHTTP as erro:
+                    status, resposta = erro.status, {'erro': str(erro)}
+                    manter_conexao = manter_conexao and erro.status != 413
+                except ValueError:
+                    status, resposta, manter_conexao = 400, {'erro': 'Content-Length inválido'}, False
+                except Exception as erro:
+                    status, resposta = 500, {'erro': str(erro)}
+
+                await self._responder(escritor, status, resposta, manter_conexao)
+                if not manter_conexao:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _rotear(self, metodo: str, caminho: str, corpo: bytes) -> Union[Dict[str, Any], List[Any]]:
+        """Executa a rota correspondente à requisição.
+
+        Args:
+            metodo (str): Método HTTP.
+            caminho (str): Caminho da requisição.
+            corpo (bytes): Corpo da requisição.
+
+        Returns:
+            Union[Dict[str, Any], List[Any]]: Corpo JSON da resposta.
+        """
+        caminho = caminho.split('?', 1)[0]
+        if caminho == '/saude':
+            saude = {
+                'status': 'ok',
+                'lotes_processados': self.agrupador.lotes_processados,
+                'registros_processados': self.agrupador.registros_processados,
+            }
+            if self.agrupador.cache is not None:
+                saude['cache'] = self.agrupador.cache.estatisticas()
+            return saude
+
+        tarefa = ROTAS.get(caminho)
+        if tarefa is None:
+            raise _ErroHTTP(404, f'Rota não encontrada: {caminho}')
+        if metodo != 'POST':
+            raise _ErroHTTP(405, f'Método não permitido: {metodo}')
+
+        try:
+            dados = json.loads(corpo)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise _ErroHTTP(400, 'Corpo JSON inválido')
+
+        registros = dados if isinstance(dados, list) else [dados]
+        for registro_texto in registros:
+            if not isinstance(registro_texto, dict) or 'id' not in registro_texto \
+                    or not isinstance(registro_texto.get('texto'), str):
+                raise _ErroHTTP(400, "Cada registro deve ter 'id' e 'texto'")
+
+        resultados = await asyncio.gather(*(
+            self.agrupador.submeter(tarefa, registro_texto) for registro_texto in registros
+        ))
+        return list(resultados) if isinstance(dados, list) else resultados[0]
+
+    @staticmethod
+    async def _responder(escritor: asyncio.StreamWriter, status: int, corpo: Any, manter_conexao: bool) -> None:
+        """Escreve uma resposta HTTP com corpo JSON."""
+        conteudo = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+        cabecalho = (
+            f'HTTP/1.1 {status} {MENSAGENS_STATUS.get(status, "")}\r\n'
+            f'Content-Type: application/json; charset=utf-8\r\n'
+            f'Content-Length: {len(conteudo)}\r\n'
+            f'Connection: {"keep-alive" if manter_conexao else "close"}\r\n\r\n'
+        )
+        escritor.write(cabecalho.encode('latin-1') + conteudo)
+        await escritor.drain()
+
+
+class ClienteServico:
+    """Cliente HTTP simples (e síncrono) para o ServicoClassificacao."""
+
+    def __init__(self, host: str = "127.0.0.1", porta: int = 8080, timeout: float = 30.0):
+        """Inicializa o cliente com uma conexão persistente.
+
+        Args:
+            host (str): Endereço do serviço.
+            porta (int): Porta do serviço.
+            timeout (float): Tempo máximo, em segundos, de cada requisição.
+        """
+        self._conexao = http.client.HTTPConnection(host, porta, timeout=timeout)
+
+    def __enter__(self) -> 'ClienteServico':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Fecha a conexão com o serviço."""
+        self._conexao.close()
+
+    def _requisitar(self, metodo: str, caminho: str, dados: Any = None) -> Any:
+        """Envia uma requisição e devolve o corpo JSON da resposta.
+
+        Raises:
+            RuntimeError: Se o serviço responder com status diferente de 200.
+        """
+        corpo = None if dados is None else json.dumps(dados, ensure_ascii=False).encode('utf-8')
+        cabecalhos = {'Content-Type': 'application/json'} if corpo is not None else {}
+        self._conexao.request(metodo, caminho, body=corpo, headers=cabecalhos)
+        resposta = self._conexao.getresponse()
+        conteudo = json.loads(resposta.read())
+        if resposta.status != 200:
+            raise RuntimeError(f"Erro {resposta.status}: {conteudo.get('erro')}")
+        return conteudo
+
+    def encontra_expressoes(self, informacoes_textos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Equivalente remoto de `encontra_expressoes`."""
+        return self._requisitar('POST', '/expressoes', informacoes_textos)
+
+    def aplica_regras(self, informacoes_textos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Equivalente remoto de `aplica_regras`."""
+        return self._requisitar('POST', '/categorias', informacoes_textos)
+
+    def saude(self) -> Dict[str, Any]:
+        """Estado do serviço e estatísticas dos lotes."""
+        return self._requisitar('GET', '/saude')
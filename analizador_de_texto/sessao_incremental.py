@@ -0,0 +1,178 @@
+"""sessao_incremental.py
+============================
+Reanálise incremental de um texto editado, no nível das sentenças.
+
+Um editor que reenvia a redação inteira a cada salvamento automático costuma
+alterar apenas uma sentença. `SessaoTexto` guarda, para o documento, o texto
+dividido em trechos terminados por pontuação (.?!) e, para cada trecho, a sua
+sentença, o número de tokens e a expressão encontrada no início da sentença. A
+cada atualização, os trechos iguais no início e no fim do texto são mantidos, e
+apenas os trechos do meio são reprocessados; as características agregadas usadas
+pelas regras (número de sentenças, de tokens e de sentenças com expressão) são
+atualizadas pela diferença.
+
+Os trechos são independentes: nenhuma sentença (`utils.separar_sentencas_spans`)
+nem token atravessa um caractere de pontuação, e a expressão de uma sentença só
+depende da própria sentença. Por isso o resultado é idêntico ao de `aplica_regras`
+sobre o texto completo. As ocorrências dos literais citados nas regras continuam
+contadas no texto completo pelo avaliador, pois a contagem de `str.count` (sem
+sobreposição, da esquerda para a direita) não é a soma das contagens dos trechos.
+
+Quando o arquivo de expressões muda (e o registro o recarrega), a sessão reprocessa
+todos os trechos na atualização seguinte.
+
+Exemplo:
+    sessao = SessaoTexto(id_texto=42)
+    sessao.atualizar(texto)             # primeira análise: todos os trechos
+    sessao.atualizar(texto_editado)     # apenas os trechos alterados
+
+Classes e funções:
+- dividir_em_trechos: divide o texto em trechos terminados por pontuação
+- SessaoTexto: estado de um documento e atualização incremental das categorias
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import re
+
+from analizador_de_texto.registro import registro
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.tokenizador import contar_tokens
+from analizador_de_texto.utils import separar_sentencas_spans
+
+# Trecho terminado por um caractere de pontuação (o que sobra no fim do texto é o último trecho)
+_PADRAO_TRECHO = re.compile(r'[^.?!]*[.?!]')
+
+
+def dividir_em_trechos(texto: str) -> List[str]:
+    """Divide o texto em trechos que terminam em pontuação (.?!), sem perder nenhum caractere.
+
+    O texto após a última pontuação, se houver, forma o último trecho.
+
+    Args:
+        texto (str): Texto a ser dividido.
+
+    Returns:
+        List[str]: Trechos do texto, cuja concatenação é o próprio texto.
+    """
+    trechos = _PADRAO_TRECHO.findall(texto)
+    consumido = sum(map(len, trechos))
+    if consumido < len(texto):
+        trechos.append(texto[consumido:])
+    return trechos
+
+
+class SessaoTexto:
+    """Estado de um documento editado, reprocessado apenas nas sentenças alteradas."""
+
+    def __init__(self, id_texto: Any = None,
+                 arquivo_regras: str = "regras_linguagem_natural.txt",
+                 arquivo_expressoes: str = "expressoes.txt"):
+        """Inicializa uma sessão vazia.
+
+        Args:
+            id_texto (Any, optional): Identificador do documento.
+            arquivo_regras (str, optional): Nome do arquivo com regras.
+            arquivo_expressoes (str, optional): Nome do arquivo com expressões.
+        """
+        self.id = id_texto
+        self.arquivo_regras = arquivo_regras
+        self.arquivo_expressoes = arquivo_expressoes
+        self.texto = ''
+        self.qtd_sentencas = 0
+        self.qtd_tokens = 0
+        self.qtd_sentencas_com_expressao = 0
+        # Trechos reprocessados na última atualização
+        self.trechos_reprocessados = 0
+
+        self._trie_expressoes = None
+        self._trechos: List[str] = []
+        # Por trecho: posição da sentença no trecho (ou None), tokens e índice da expressão (ou None)
+        self._spans: List[Optional[Tuple[int, int]]] = []
+        self._tokens: List[int] = []
+        self._expressoes: List[Optional[int]] = []
+
+    def _analisar_trecho(self, trecho: str) -> Tuple[Optional[Tuple[int, int]], int, Optional[int]]:
+        """Sentença, número de tokens e expressão de um trecho."""
+        spans = separar_sentencas_spans(trecho)
+        if not spans:
+            return None, contar_tokens(trecho), None
+        (inicio, fim), = spans
+        return (inicio, fim), contar_tokens(trecho), self._trie_expressoes.buscar_indice_span(trecho, inicio, fim)
+
+    def _substituir(self, inicio: int, fim: int, trechos: List[str]) -> None:
+        """Substitui os trechos `inicio:fim` pelos trechos novos, atualizando os agregados."""
+        for posicao in range(inicio, fim):
+            if self._spans[posicao] is not None:
+                self.qtd_sentencas -= 1
+            if self._expressoes[posicao] is not None:
+                self.qtd_sentencas_com_expressao -= 1
+            self.qtd_tokens -= self._tokens[posicao]
+
+        spans, tokens, expressoes = [], [], []
+        for trecho in trechos:
+            span, qtd_tokens, expressao = self._analisar_trecho(trecho)
+            spans.append(span)
+            tokens.append(qtd_tokens)
+            expressoes.append(expressao)
+            self.qtd_sentencas += span is not None
+            self.qtd_sentencas_com_expressao += expressao is not None
+            self.qtd_tokens += qtd_tokens
+
+        self._trechos[inicio:fim] = trechos
+        self._spans[inicio:fim] = spans
+        self._tokens[inicio:fim] = tokens
+        self._expressoes[inicio:fim] = expressoes
+        self.trechos_reprocessados = len(trechos)
+
+    def atualizar(self, texto: str) -> Dict[str, Any]:
+        """Atualiza o documento com o novo texto e retorna as suas categorias.
+
+        Args:
+            texto (str): Texto completo do documento, após a edição.
+
+        Returns:
+            Dict[str, Any]: Dicionário com 'id' e 'categorias' (mesma saída de `aplica_regras`).
+        """
+        trie_expressoes = registro.trie_expressoes(self.arquivo_expressoes)
+        if trie_expressoes is not self._trie_expressoes:
+            # Expressões novas: nenhum resultado anterior continua válido
+            self._trie_expressoes = trie_expressoes
+            self._substituir(0, len(self._trechos), [])
+
+        anteriores = self._trechos
+        novos = dividir_em_trechos(texto)
+        limite = min(len(anteriores), len(novos))
+        prefixo = 0
+        while prefixo < limite and anteriores[prefixo] == novos[prefixo]:
+            prefixo += 1
+        sufixo = 0
+        while sufixo < limite - prefixo and anteriores[-1 - sufixo] == novos[-1 - sufixo]:
+            sufixo += 1
+
+        self._substituir(prefixo, len(anteriores) - sufixo, novos[prefixo:len(novos) - sufixo])
+        self.texto = texto
+
+        avaliar_regras = registro.avaliador_regras(self.arquivo_regras)
+        return {'id': self.id, 'categorias': sorted(avaliar_regras(self.texto_analisado()))}
+
+    def texto_analisado(self) -> TextoAnalisado:
+        """Texto analisado do documento, com as características agregadas já memorizadas.
+
+        Returns:
+            TextoAnalisado: Texto atual; as ocorrências dos literais são contadas sob demanda.
+        """
+        texto_analisado = TextoAnalisado(self.texto, self._trie_expressoes, self.id)
+        for caracteristica in ('qtd_sentencas', 'qtd_tokens', 'qtd_sentencas_com_expressao'):
+            texto_analisado.__dict__[caracteristica] = getattr(self, caracteristica)
+        return texto_analisado
+
+    @property
+    def sentencas(self) -> List[str]:
+        """Sentenças do documento."""
+        return [trecho[span[0]:span[1]] for trecho, span in zip(self._trechos, self._spans) if span is not None]
+
+    @property
+    def expressoes_sentencas(self) -> List[Optional[str]]:
+        """Expressão encontrada no início de cada sentença (ou None)."""
+        expressoes = self._trie_expressoes.expressoes if self._trie_expressoes is not None else []
+        return [None if indice is None else expressoes[indice]
+                for span, indice in zip(self._spans, self._expressoes) if span is not None]
@@ -0,0 +1,187 @@
+"""texto_analisado.py
+============================
+Representação de um texto analisado, compartilhada entre os problemas 1 e 2.
+
+As características do texto (sentenças, tokens, texto em minúsculas, expressões
+por sentença e contagens) são calculadas sob demanda e memorizadas, de forma que
+cada uma seja computada no máximo uma vez por texto, independentemente de quantas
+regras ou etapas a consultem.
+
+As sentenças são representadas pelas suas posições no texto (`spans_sentencas`);
+contagens e expressões são calculadas sobre essas posições, e as sentenças só são
+copiadas como strings quando `sentencas` é consultada.
+
+Com um `AutomatoLiterais`, as contagens de todos os literais das regras são obtidas
+em uma única passada pelo texto (`contagens_literais`).
+
+Classes:
+- TextoAnalisado: texto com características calculadas de forma preguiçosa
+"""
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple
+
+from analizador_de_texto.automato_literais import AutomatoLiterais
+from analizador_de_texto.tokenizador import contar_tokens
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import separar_sentencas, separar_sentencas_spans, tokenize
+
+
+class TextoAnalisado:
+    """Texto com características calculadas sob demanda e memorizadas."""
+
+    def __init__(self, texto: str, trie_expressoes: Optional[TrieExpressoes] = None, id_texto: Any = None):
+        """Inicializa o texto analisado.
+
+        Args:
+            texto (str): Texto original.
+            trie_expressoes (Optional[TrieExpressoes]): Árvore usada para detectar expressões
+                no início das sentenças. Obrigatória apenas se as expressões forem consultadas.
+            id_texto (Any, optional): Identificador do texto.
+        """
+        self.id = id_texto
+        self.texto = texto
+        self.trie_expressoes = trie_expressoes
+        self._contagens = {}
+
+    @classmethod
+    def de_dados(cls, dados_texto: Dict[str, Any]) -> 'TextoAnalisado':
+        """Cria um texto analisado a partir do dicionário `dados_texto` usado anteriormente pelas regras.
+
+        Args:
+            dados_texto (Dict[str, Any]): Dicionário com 'texto' e, opcionalmente,
+                'id', 'sentencas' e 'expressoes_sentencas' já calculados.
+
+        Returns:
+            TextoAnalisado: Texto analisado equivalente.
+        """
+        if isinstance(dados_texto, cls):
+            return dados_texto
+
+        texto_analisado = cls(dados_texto['texto'], id_texto=dados_texto.get('id'))
+        # Valores já calculados ocupam o lugar das propriedades memorizadas
+        for chave in ('sentencas', 'expressoes_sentencas'):
+            if chave in dados_texto:
+                texto_analisado.__dict__[chave] = dados_texto[chave]
+        return texto_analisado
+
+    @cached_property
+    def texto_lower(self) -> str:
+        """Texto em minúsculas."""
+        return self.texto.lower()
+
+    @cached_property
+    def spans_sentencas(self) -> List[Tuple[int, int]]:
+        """Posições (início, fim) das sentenças no texto."""
+        return separar_sentencas_spans(self.texto)
+
+    @cached_property
+    def sentencas(self) -> List[str]:
+        """Sentenças do texto."""
+        if 'spans_sentencas' not in self.__dict__:
+            return separar_sentencas(self.texto)
+        texto = self.texto
+        return [texto[inicio:fim] for inicio, fim in self.spans_sentencas]
+
+    def _usar_spans(self) -> bool:
+        """Indica se as sentenças devem ser tratadas pelas posições (ainda não foram copiadas)."""
+        return 'sentencas' not in self.__dict__
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Tokens do texto completo."""
+        return tokenize(self.texto)
+
+    @cached_property
+    def qtd_tokens(self) -> int:
+        """Número de tokens do texto."""
+        if 'tokens' in self.__dict__:
+            return len(self.tokens)
+        return contar_tokens(self.texto)
+
+    @cached_property
+    def qtd_sentencas(self) -> int:
+        """Número de sentenças do texto."""
+        if self._usar_spans():
+            return len(self.spans_sentencas)
+        return len(self.sentencas)
+
+    @cached_property
+    def expressoes_sentencas(self) -> List[Optional[str]]:
+        """Expressão encontrada no início de cada sentença (ou None)."""
+        if self.trie_expressoes is None:
+            raise ValueError("TextoAnalisado criado sem árvore de expressões")
+        if not self._usar_spans():
+            return [self.trie_expressoes.buscar(sentenca) for sentenca in self.sentencas]
+
+        expressoes = self.trie_expressoes.expressoes
+        return [
+            None if indice is None else expressoes[indice]
+            # O texto em minúsculas só é aproveitado se já tiver sido calculado (ex.: pelas regras)
+            for indice in self.trie_expressoes.buscar_indices_spans(self.texto, self.spans_sentencas,
+                                                                    self.__dict__.get('texto_lower'))
+        ]
+
+    @cached_property
+    def qtd_sentencas_com_expressao(self) -> int:
+        """Número de sentenças que começam com uma expressão."""
+        return sum(1 for expressao in self.expressoes_sentencas if expressao is not None)
+
+    @cached_property
+    def tokens_por_sentenca(self) -> List[int]:
+        """Número de tokens de cada sentença."""
+        if not self._usar_spans():
+            return [len(tokenize(sentenca)) for sentenca in self.sentencas]
+        texto = self.texto
+        return [contar_tokens(texto, inicio, fim) for inicio, fim in self.spans_sentencas]
+
+    def contem(self, token: str) -> bool:
+        """Verifica se um token está presente no texto (sem diferenciar maiúsculas).
+
+        Args:
+            token (str): Token a ser verificado.
+
+        Returns:
+            bool: True se o token estiver presente, False caso contrário.
+        """
+        token_lower = token.lower()
+        qtd = self._contagens.get(token_lower)
+        if qtd is not None:
+            return qtd > 0
+        return token_lower in self.texto_lower
+
+    def contagens_literais(self, automato: AutomatoLiterais) -> Dict[str, int]:
+        """Conta todos os literais do autômato em uma única passada pelo texto.
+
+        As contagens ficam memorizadas e passam a responder `contem` e `contar_ocorrencias`.
+        Contagens já conhecidas (ex.: restauradas de um estado gravado) prevalecem.
+
+        Args:
+            automato (AutomatoLiterais): Autômato com os literais em minúsculas.
+
+        Returns:
+            Dict[str, int]: Contagens do texto (inclui pelo menos todos os literais do autômato).
+        """
+        contagens = self._contagens
+        if not contagens:
+            contagens = self._contagens = automato.contar(self.texto_lower)
+        elif any(literal not in contagens for literal in automato.literais):
+            for literal, qtd in automato.contar(self.texto_lower).items():
+                contagens.setdefault(literal, qtd)
+        return contagens
+
+    def contar_ocorrencias(self, token: str) -> int:
+        """Conta as ocorrências de um token no texto (sem diferenciar maiúsculas).
+
+        Mesma semântica de `utils.contar_ocorrencias_token`.
+
+        Args:
+            token (str): Token a ser contado.
+
+        Returns:
+            int: Número de ocorrências do token no texto.
+        """
+        token_lower = token.lower()
+        qtd = self._contagens.get(token_lower)
+        if qtd is None:
+            qtd = self._contagens[token_lower] = self.texto_lower.count(token_lower)
+        return qtd
@@ -0,0 +1,122 @@
+"""tokenizador.py
+============================
+Tokenização com padrão pré-compilado e modos especializados.
+
+Os tokens são os mesmos de `utils.tokenize`: sequências de caracteres de palavra
+(`\\w+`) ou qualquer outro caractere visível isolado. O padrão não usa grupo de
+captura (mais rápido que `(\\w+|\\S)`, com os mesmos tokens), e nenhum token é
+vazio, portanto nenhum filtro é necessário.
+
+Além da lista completa de tokens, há modos para quem não precisa dela:
+- contagem: conta os tokens sem criar as strings dos tokens nem a lista;
+- iterador limitado: produz os tokens sob demanda e para após N tokens
+  (ex.: apenas o início de uma sentença);
+- lotes: tokenizam ou contam os tokens de muitos textos em uma chamada.
+
+Todas as funções aceitam um trecho do texto (`inicio`, `fim`), sem copiá-lo.
+
+Funções:
+- tokenizar: lista de tokens
+- contar_tokens: número de tokens, sem criar os tokens
+- iterar_tokens: iterador preguiçoso, opcionalmente limitado a N tokens
+- tokenizar_lote: listas de tokens de vários textos
+- contar_tokens_lote: número de tokens de vários textos
+"""
+from collections import deque
+from itertools import count, islice
+from typing import Iterable, Iterator, List, Optional
+import re
+import sys
+
+# Mesmos tokens de r'(\w+|\S)', sem o custo do grupo de captura
+PADRAO_TOKEN = re.compile(r'\w+|\S')
+
+_tokens = PADRAO_TOKEN.findall
+_matches = PADRAO_TOKEN.finditer
+_grupo = re.Match.group
+_substituir = PADRAO_TOKEN.subn
+
+
+def tokenizar(texto: str, inicio: int = 0, fim: int = sys.maxsize) -> List[str]:
+    """Divide o texto (ou o trecho `texto[inicio:fim]`) em tokens.
+
+    Args:
+        texto (str): Texto a ser tokenizado.
+        inicio (int): Início do trecho. Padrão: início do texto.
+        fim (int): Fim do trecho. Padrão: fim do texto.
+
+    Returns:
+        List[str]: Lista de tokens, na ordem do texto.
+    """
+    return _tokens(texto, inicio, fim)
+
+
+def contar_tokens(texto: str, inicio: int = 0, fim: int = sys.maxsize) -> int:
+    """Conta os tokens do texto (ou do trecho `texto[inicio:fim]`) sem criá-los.
+
+    Os tokens são substituídos por nada e apenas o número de substituições é usado:
+    nenhuma string de token nem lista de tokens é criada. A contagem não é livre de
+    alocações: `subn` monta a string com o que sobra entre os tokens (em geral os
+    espaços), descartada em seguida. Ainda assim é mais rápida que percorrer os
+    matches, que só é usado para um trecho (`subn` não aceita limites).
+
+    Args:
+        texto (str): Texto a ser analisado.
+        inicio (int): Início do trecho. Padrão: início do texto.
+        fim (int): Fim do trecho. Padrão: fim do texto.
+
+    Returns:
+        int: Número de tokens.
+    """
+    if inicio or fim < len(texto):
+        # subn não aceita limites: o trecho é percorrido pelos matches, sem cópia
+        contador = count()
+        deque(zip(_matches(texto, inicio, fim), contador), maxlen=0)
+        return next(contador)
+    return _substituir('', texto)[1]
+
+
+def iterar_tokens(texto: str, limite: Optional[int] = None, inicio: int = 0,
+                  fim: int = sys.maxsize) -> Iterator[str]:
+    """Produz os tokens sob demanda, parando após `limite` tokens.
+
+    O restante do texto não é percorrido: útil quando apenas os primeiros tokens
+    interessam (ex.: expressões no início de uma sentença).
+
+    Args:
+        texto (str): Texto a ser tokenizado.
+        limite (Optional[int]): Número máximo de tokens. Padrão: sem limite.
+        inicio (int): Início do trecho. Padrão: início do texto.
+        fim (int): Fim do trecho. Padrão: fim do texto.
+
+    Returns:
+        Iterator[str]: Tokens, na ordem do texto.
+    """
+    matches = _matches(texto, inicio, fim)
+    if limite is not None:
+        matches = islice(matches, limite)
+    return map(_grupo, matches)
+
+
+def tokenizar_lote(textos: Iterable[str]) -> List[List[str]]:
+    """Tokeniza vários textos em uma chamada.
+
+    Args:
+        textos (Iterable[str]): Textos a serem tokenizados.
+
+    Returns:
+        List[List[str]]: Lista de tokens de cada texto, na ordem da entrada.
+    """
+    return list(map(_tokens, textos))
+
+
+def contar_tokens_lote(textos: Iterable[str]) -> List[int]:
+    """Conta os tokens de vários textos em uma chamada, sem criá-los.
+
+    Args:
+        textos (Iterable[str]): Textos a serem analisados.
+
+    Returns:
+        List[int]: Número de tokens de cada texto, na ordem da entrada.
+    """
+    return list(map(contar_tokens, textos))
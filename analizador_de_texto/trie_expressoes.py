@@ -0,0 +1,348 @@
+"""trie_expressoes.py
+============================
+Árvore de prefixos (trie) de tokens para localizar expressões no início de sentenças.
+
+Este módulo substitui a varredura linear de `verificar_expressao_inicio` por uma
+estrutura construída uma única vez a partir da lista de expressões. Para cada
+sentença apenas os primeiros tokens são extraídos e a busca é feita em uma única
+caminhada pela árvore, independentemente da quantidade de expressões carregadas.
+
+As expressões candidatas de uma sentença dependem apenas dos seus primeiros tokens,
+e as aberturas de sentença se repetem em um corpus ("Logo, ...", "Portanto, ...").
+Com `max_prefixos`, a árvore mantém um cache LRU limitado (`CachePrefixos`) dos
+candidatos pelos tokens iniciais da sentença, em minúsculas: os `max_tokens_inicio`
+primeiros tokens e, apenas quando esses tokens ainda podem continuar uma expressão
+na árvore, os tokens seguintes até o comprimento da expressão mais longa. Assim, a
+mesma abertura com maiúsculas ou espaçamento diferentes ocupa uma única entrada. Em
+um acerto, apenas os primeiros tokens são lidos e a árvore não é percorrida; a
+confirmação das candidatas (busca de substring da implementação original) é mantida.
+Cada sentença conta uma única consulta nos contadores (`CachePrefixos.estatisticas`),
+que indicam se o cache compensa para um corpus: uma falta custa um pouco mais que a
+busca sem cache, por isso ele é desativado por padrão. Como o cache pertence à
+árvore, ele vale apenas para o conjunto de expressões ativo.
+
+Classes:
+- CachePrefixos: cache LRU dos candidatos por prefixo de tokens, com contadores por sentença
+- TrieExpressoes: árvore de tokens compilada a partir de uma lista de expressões
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+from itertools import islice
+import re
+import threading
+
+from analizador_de_texto.tokenizador import PADRAO_TOKEN, iterar_tokens
+from analizador_de_texto.utils import minusculas_alinhadas
+
+# Chave reservada nos nós da árvore para os índices das expressões que terminam ali
+_FIM = None
+
+# Valor guardado para um prefixo cujos candidatos dependem dos tokens seguintes
+_ABERTO = object()
+
+
+class CachePrefixos:
+    """Cache LRU dos candidatos de cada prefixo de tokens, seguro entre threads."""
+
+    def __init__(self, max_itens: int):
+        """Inicializa o cache vazio.
+
+        Args:
+            max_itens (int): Número máximo de prefixos guardados.
+        """
+        self.max_itens = max_itens
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+        self._trava = threading.Lock()
+        self._itens = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def obter(self, prefixo: Hashable) -> Optional[Any]:
+        """Candidatos guardados para o prefixo, ou None.
+
+        Um prefixo aberto não é contado como acerto: a consulta da sentença é a da chave
+        longa que vem em seguida, de modo que cada sentença conta uma única vez.
+        """
+        with self._trava:
+            candidatos = self._itens.get(prefixo)
+            if candidatos is None:
+                self.faltas += 1
+                return None
+            self._itens.move_to_end(prefixo)
+            if candidatos is not _ABERTO:
+                self.acertos += 1
+            return candidatos
+
+    def guardar(self, prefixo: Hashable, candidatos: Any) -> None:
+        """Guarda os candidatos de um prefixo, removendo os menos usados."""
+        with self._trava:
+            self._itens[prefixo] = candidatos
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+                self.remocoes += 1
+
+    def limpar(self) -> None:
+        """Descarta os prefixos guardados e zera os contadores."""
+        with self._trava:
+            self._itens.clear()
+            self.acertos = self.faltas = self.remocoes = 0
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Contadores do cache.
+
+        Returns:
+            Dict[str, Any]: Itens guardados, capacidade, acertos, faltas, remoções e taxa de acerto.
+        """
+        with self._trava:
+            consultas = self.acertos + self.faltas
+            return {
+                'itens': len(self._itens),
+                'max_itens': self.max_itens,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            }
+
+
+class TrieExpressoes:
+    """Árvore de prefixos de tokens construída a partir de uma lista de expressões.
+
+    O resultado de `buscar` é idêntico ao de `utils.verificar_expressao_inicio`
+    com a mesma lista de expressões: em caso de mais de uma expressão possível,
+    prevalece a que aparece primeiro na lista.
+    """
+
+    def __init__(self, expressoes: List[str], max_tokens_inicio: int = 3, max_prefixos: int = 0):
+        """Constrói a árvore de tokens.
+
+        Args:
+            expressoes (List[str]): Lista de expressões (ex.: saída de `ler_expressoes`).
+            max_tokens_inicio (int): Número máximo de tokens considerados como início.
+            max_prefixos (int): Tamanho do cache de prefixos de sentença (0, o padrão, desativa o cache).
+        """
+        self.expressoes = list(expressoes)
+        self.max_tokens_inicio = max_tokens_inicio
+        self._expressoes_lower = [expressao.lower() for expressao in self.expressoes]
+        self._raiz = {}
+        self.profundidade = 0
+
+        for indice, expressao_lower in enumerate(self._expressoes_lower):
+            tokens_expressao = PADRAO_TOKEN.findall(expressao_lower)
+            no = self._raiz
+            for token in tokens_expressao:
+                no = no.setdefault(token, {})
+            no.setdefault(_FIM, []).append(indice)
+            self.profundidade = max(self.profundidade, len(tokens_expressao))
+
+        # Só é preciso tokenizar o suficiente para a expressão mais longa
+        # começando no último token inicial permitido
+        self._limite_tokens = max(0, max_tokens_inicio - 1) + self.profundidade
+        self.configurar_cache(max_prefixos)
+
+    def __len__(self) -> int:
+        return len(self.expressoes)
+
+    def estado(self) -> Dict[str, Any]:
+        """Estrutura já construída da árvore, para ser serializada (ex.: com `marshal`).
+
+        Returns:
+            Dict[str, Any]: Dicionário com 'expressoes', 'max_tokens_inicio', 'profundidade'
+            e 'raiz' (nós aninhados; a chave None guarda os índices das expressões).
+        """
+        return {
+            'expressoes': self.expressoes,
+            'max_tokens_inicio': self.max_tokens_inicio,
+            'profundidade': self.profundidade,
+            'raiz': self._raiz,
+        }
+
+    @classmethod
+    def de_estado(cls, estado: Dict[str, Any], max_prefixos: int = 0) -> 'TrieExpressoes':
+        """Reconstrói a árvore a partir de `estado()`, sem tokenizar as expressões.
+
+        Args:
+            estado (Dict[str, Any]): Saída de `TrieExpressoes.estado`.
+            max_prefixos (int): Tamanho do cache de prefixos de sentença (0 desativa o cache).
+
+        Returns:
+            TrieExpressoes: Árvore equivalente à original.
+        """
+        trie = cls.__new__(cls)
+        trie.expressoes = list(estado['expressoes'])
+        trie.max_tokens_inicio = estado['max_tokens_inicio']
+        trie.profundidade = estado['profundidade']
+        trie._expressoes_lower = [expressao.lower() for expressao in trie.expressoes]
+        trie._raiz = estado['raiz']
+        trie._limite_tokens = max(0, trie.max_tokens_inicio - 1) + trie.profundidade
+        trie.configurar_cache(max_prefixos)
+        return trie
+
+    def configurar_cache(self, max_prefixos: int) -> None:
+        """Cria (ou recria, vazio) o cache de prefixos de sentença com o tamanho indicado.
+
+        Args:
+            max_prefixos (int): Número máximo de prefixos guardados (0 desativa o cache).
+        """
+        self.cache_prefixos = CachePrefixos(max_prefixos) if max_prefixos > 0 else None
+        self._tokens_inicio = max(0, self.max_tokens_inicio)
+        # Trecho do início da sentença até o fim do N-ésimo token (ou da sentença, se for menor)
+        self._padrao_inicio = re.compile(r'(?:\s*(?:\w+|\S)){0,%d}' % self._tokens_inicio)
+        self._padrao_restante = re.compile(r'(?:\s*(?:\w+|\S)){0,%d}'
+                                           % max(0, self._limite_tokens - self._tokens_inicio))
+
+    def _percorrer(self, tokens: Sequence[str]) -> Tuple[Set[int], bool]:
+        """Percorre a árvore a partir de cada token inicial e coleta as expressões casadas.
+
+        Args:
+            tokens (Sequence[str]): Primeiros tokens da sentença, já em minúsculas.
+
+        Returns:
+            Tuple[Set[int], bool]: Índices das expressões cujos tokens casam em alguma posição
+            inicial, e se algum caminho, após os `max_tokens_inicio` primeiros tokens, chegou a
+            um nó com continuações (os candidatos dependem então dos tokens seguintes).
+        """
+        candidatos = set()
+        aberto = False
+        if self.max_tokens_inicio > 0 and _FIM in self._raiz:
+            candidatos.update(self._raiz[_FIM])
+
+        tokens_inicio = self._tokens_inicio
+        completo = len(tokens) >= tokens_inicio
+        for inicio in range(min(self.max_tokens_inicio, len(tokens))):
+            no = self._raiz
+            for token in islice(tokens, inicio, tokens_inicio):
+                no = no.get(token)
+                if no is None:
+                    break
+                if _FIM in no:
+                    candidatos.update(no[_FIM])
+            else:
+                if not completo or len(no) == (_FIM in no):
+                    continue
+                aberto = True
+                for token in islice(tokens, tokens_inicio, None):
+                    no = no.get(token)
+                    if no is None:
+                        break
+                    if _FIM in no:
+                        candidatos.update(no[_FIM])
+
+        return candidatos, aberto
+
+    def _candidatos(self, tokens: Sequence[str]) -> Set[int]:
+        """Índices das expressões cujos tokens casam em alguma posição inicial (ver `_percorrer`)."""
+        return self._percorrer(tokens)[0]
+
+    def _candidatos_cache(self, texto: str, inicio: int, fim: int) -> Tuple[int, ...]:
+        """Candidatos da sentença `texto[inicio:fim]`, consultando o cache de prefixos.
+
+        A chave é a tupla dos `max_tokens_inicio` primeiros tokens em minúsculas, os mesmos
+        usados na caminhada pela árvore. Se esses tokens ainda puderem continuar uma
+        expressão, a chave passa a ser a tupla dos tokens até o limite (`_limite_tokens`),
+        guardada dentro de outra tupla para não se confundir com as chaves curtas.
+        """
+        cache = self.cache_prefixos
+        fim_inicio = self._padrao_inicio.match(texto, inicio, fim).end()
+        tokens = [token.lower() for token in PADRAO_TOKEN.findall(texto, inicio, fim_inicio)]
+        chave = tuple(tokens)
+        candidatos = cache.obter(chave)
+        if candidatos is not None and candidatos is not _ABERTO:
+            return candidatos
+
+        aberto = candidatos is _ABERTO
+        if aberto or len(tokens) >= self._tokens_inicio:
+            # Os tokens seguintes são lidos a partir do fim do trecho inicial
+            fim_limite = self._padrao_restante.match(texto, fim_inicio, fim).end()
+            tokens.extend(token.lower() for token in PADRAO_TOKEN.findall(texto, fim_inicio, fim_limite))
+        chave_limite = (tuple(tokens),)
+        if aberto:
+            candidatos = cache.obter(chave_limite)
+            if candidatos is not None:
+                return candidatos
+
+        encontrados, aberto = self._percorrer(tokens)
+        candidatos = tuple(sorted(encontrados))
+        if aberto:
+            cache.guardar(chave, _ABERTO)
+            cache.guardar(chave_limite, candidatos)
+        else:
+            cache.guardar(chave, candidatos)
+        return candidatos
+
+    def buscar(self, sentenca: str) -> Optional[str]:
+        """Verifica se uma expressão está presente no início da sentença.
+
+        Args:
+            sentenca (str): Sentença a ser verificada.
+
+        Returns:
+            Optional[str]: A expressão encontrada ou None se nenhuma for encontrada.
+        """
+        indice = self.buscar_indice(sentenca)
+        return None if indice is None else self.expressoes[indice]
+
+    def buscar_indice(self, sentenca: str) -> Optional[int]:
+        """Como `buscar`, mas retorna a posição da expressão na lista de expressões.
+
+        Args:
+            sentenca (str): Sentença a ser verificada.
+
+        Returns:
+            Optional[int]: Índice da expressão encontrada ou None se nenhuma for encontrada.
+        """
+        return self.buscar_indice_span(sentenca, 0, len(sentenca))
+
+    def buscar_indice_span(self, texto: str, inicio: int, fim: int,
+                           texto_lower: Optional[str] = None) -> Optional[int]:
+        """Como `buscar_indice`, para a sentença `texto[inicio:fim]`, sem copiá-la.
+
+        Args:
+            texto (str): Texto que contém a sentença.
+            inicio (int): Início da sentença no texto.
+            fim (int): Fim da sentença no texto.
+            texto_lower (Optional[str]): Texto em minúsculas alinhado caractere a caractere com
+                `texto` (ver `utils.minusculas_alinhadas`). Se None, apenas as sentenças com
+                candidatos são copiadas e convertidas.
+
+        Returns:
+            Optional[int]: Índice da expressão encontrada ou None se nenhuma for encontrada.
+        """
+        if self.cache_prefixos is not None:
+            # Aberturas repetidas reaproveitam os candidatos sem tokenizar nem percorrer a árvore
+            candidatos = self._candidatos_cache(texto, inicio, fim)
+        else:
+            tokens = [token.lower() for token in iterar_tokens(texto, self._limite_tokens, inicio, fim)]
+            candidatos = sorted(self._candidatos(tokens))
+        if not candidatos:
+            return None
+
+        # Mantém a verificação de substring da implementação original
+        if texto_lower is None:
+            texto_lower, inicio, fim = texto[inicio:fim].lower(), 0, None
+        for indice in candidatos:
+            if texto_lower.find(self._expressoes_lower[indice], inicio, fim) != -1:
+                return indice
+
+        return None
+
+    def buscar_indices_spans(self, texto: str, spans: List[Tuple[int, int]],
+                             texto_lower: Optional[str] = None) -> List[Optional[int]]:
+        """Índice da expressão no início de cada sentença do texto, dadas as suas posições.
+
+        Args:
+            texto (str): Texto original.
+            spans (List[Tuple[int, int]]): Início e fim de cada sentença (`utils.separar_sentencas_spans`).
+            texto_lower (Optional[str]): `texto.lower()`, se já calculado. Se None, apenas as
+                sentenças com candidatos são copiadas e convertidas para minúsculas.
+
+        Returns:
+            List[Optional[int]]: Índice da expressão de cada sentença, ou None.
+        """
+        if texto_lower is not None and not minusculas_alinhadas(texto, texto_lower):
+            texto_lower = None
+        buscar = self.buscar_indice_span
+        return [buscar(texto, inicio, fim, texto_lower) for inicio, fim in spans]
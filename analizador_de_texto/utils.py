@@ -3,22 +3,30 @@
 Este módulo fornece funções auxiliares para processamento de texto e
 manipulação de arquivos utilizadas.
 """
+import itertools
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Iterator, TextIO, Tuple
 import re
 import os
 import importlib.resources as pkg_resources
 
+from analizador_de_texto import tokenizador
+
 ### PROBLEMA 1 ###
 def caminho_amostras(nome_arquivo: str) -> str:
     """Retorna o caminho completo para um arquivo de amostras.
 
+    Caminhos absolutos são devolvidos sem alteração, permitindo usar arquivos
+    fora da pasta de dados do pacote.
+
     Args:
-        nome_arquivo (str): Nome do arquivo de amostras.
+        nome_arquivo (str): Nome do arquivo de amostras (ou caminho absoluto).
 
     Returns:
         str: Caminho completo para o arquivo de amostras.
     """
+    if os.path.isabs(nome_arquivo):
+        return nome_arquivo
     try:
         # Tenta encontrar como recurso do pacote
         with pkg_resources.path('analizador_de_texto.dados', nome_arquivo) as p:
@@ -68,6 +76,82 @@ def ler_entrada_json(nome_arquivo: str = "entrada.json") -> Dict[str, str]:
     except json.JSONDecodeError:
         raise ValueError(f"Formato JSON inválido no arquivo: {caminho_arquivo}")
 
+# Caracteres que podem continuar um número JSON lido pela metade
+_CONTINUACAO_NUMERO = frozenset('0123456789.eE+-')
+
+def ler_registros_json(fluxo: TextIO, tamanho_bloco: int = 65536) -> Iterator[Dict[str, Any]]:
+    """Lê registros de um fluxo JSONL ou JSON (lista no nível superior) sem carregá-lo inteiro.
+
+    O formato é detectado pelo primeiro caractere não branco: '[' indica uma lista JSON,
+    cujos elementos são decodificados um a um; caso contrário cada linha não vazia é
+    tratada como um registro JSON.
+
+    Args:
+        fluxo (TextIO): Fluxo de texto (arquivo aberto ou sys.stdin).
+        tamanho_bloco (int): Quantidade de caracteres lidos por vez de uma lista JSON.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Registros lidos, na ordem do fluxo.
+    """
+    primeiro = fluxo.read(1)
+    while primeiro.isspace():
+        primeiro = fluxo.read(1)
+    if not primeiro:
+        return
+
+    if primeiro != '[':
+        # JSONL: um registro por linha
+        linhas = itertools.chain([primeiro + fluxo.readline()], fluxo)
+        for numero, linha in enumerate(linhas, start=1):
+            if linha.strip():
+                try:
+                    yield json.loads(linha)
+                except json.JSONDecodeError:
+                    raise ValueError(f"Formato JSON inválido na linha {numero}")
+        return
+
+    decodificador = json.JSONDecoder()
+    buffer, posicao = '', 0
+    fim_fluxo = False
+    # Estado da lista: 'inicio', 'elemento' (após um registro) ou 'virgula' (após uma vírgula)
+    estado = 'inicio'
+
+    while True:
+        while posicao < len(buffer) and buffer[posicao].isspace():
+            posicao += 1
+
+        if posicao < len(buffer):
+            caractere = buffer[posicao]
+            if estado == 'elemento':
+                if caractere == ']':
+                    return
+                if caractere != ',':
+                    raise ValueError("Formato JSON inválido: esperado ',' ou ']' entre os registros")
+                estado = 'virgula'
+                posicao += 1
+                continue
+            if caractere == ']' and estado == 'inicio':
+                return
+
+            try:
+                registro, fim = decodificador.raw_decode(buffer, posicao)
+            except json.JSONDecodeError:
+                registro, fim = None, None
+
+            # Um número no fim do buffer (ou seguido de um caractere numérico) pode estar incompleto
+            if fim is not None and (fim_fluxo or (fim < len(buffer) and buffer[fim] not in _CONTINUACAO_NUMERO)):
+                yield registro
+                estado = 'elemento'
+                posicao = fim
+                continue
+
+        if fim_fluxo:
+            raise ValueError("Formato JSON inválido na lista de registros")
+        # Descarta o que já foi consumido para manter a memória limitada
+        bloco = fluxo.read(tamanho_bloco)
+        buffer, posicao = buffer[posicao:] + bloco, 0
+        fim_fluxo = not bloco
+
 def separar_sentencas(texto: str) -> List[str]:
     """Separa um texto em sentenças (frases delimitadas por .?!).
 
@@ -80,6 +164,45 @@ def separar_sentencas(texto: str) -> List[str]:
     sentencas = re.findall(r'[^.?!]+[.?!]', texto)
     return [s.strip() for s in sentencas]
 
+# Mesmas sentenças de separar_sentencas, com os espaços iniciais fora do grupo capturado:
+# um trecho que começa com um caractere visível, ou apenas espaços antes da pontuação
+_PADRAO_SENTENCA_SPAN = re.compile(r'\s*([^.?!\s][^.?!]*[.?!])|\s+([.?!])')
+
+def separar_sentencas_spans(texto: str) -> List[Tuple[int, int]]:
+    """Posições (início, fim) no texto das sentenças de `separar_sentencas`.
+
+    `texto[inicio:fim]` é exatamente a sentença devolvida por `separar_sentencas`,
+    sem espaços nas extremidades.
+
+    Args:
+        texto (str): Texto a ser separado em sentenças.
+
+    Returns:
+        List[Tuple[int, int]]: Início e fim de cada sentença.
+    """
+    spans = []
+    for match in _PADRAO_SENTENCA_SPAN.finditer(texto):
+        # Nenhuma string é criada: apenas as posições do grupo que casou
+        inicio = match.start(1)
+        spans.append((inicio if inicio >= 0 else match.start(2), match.end()))
+    return spans
+
+def minusculas_alinhadas(texto: str, texto_lower: str) -> bool:
+    """Verifica se `texto_lower` (= texto.lower()) corresponde caractere a caractere a `texto`.
+
+    Nesse caso, `texto_lower[inicio:fim]` é igual a `texto[inicio:fim].lower()` para qualquer
+    trecho. Isso não vale se algum caractere virar mais de um ao ser convertido (ex.: 'İ') ou
+    para o sigma maiúsculo, cuja forma minúscula depende dos caracteres vizinhos.
+
+    Args:
+        texto (str): Texto original.
+        texto_lower (str): Texto em minúsculas.
+
+    Returns:
+        bool: True se as posições dos dois textos forem equivalentes.
+    """
+    return len(texto_lower) == len(texto) and 'Σ' not in texto
+
 def tokenize(sentence: str) -> List[str]:
     """Divide uma sentença em tokens.
 
@@ -89,12 +212,8 @@ def tokenize(sentence: str) -> List[str]:
     Returns:
         List[str]: Lista de tokens.
     """
-    # Preserva a pontuação como tokens separados
-    pattern = r'(\w+|\S)'
-    tokens = re.findall(pattern, sentence)
-
-    # Remove tokens vazios
-    return [token for token in tokens if token.strip()]
+    # Preserva a pontuação como tokens separados (nenhum token é vazio)
+    return tokenizador.tokenizar(sentence)
 
 def verificar_expressao_inicio(sentenca: str, expressoes: List[str], max_tokens_inicio: int = 3) -> Optional[str]:
     """Verifica se uma expressão está presente no início da sentença.
@@ -107,8 +226,10 @@ def verificar_expressao_inicio(sentenca: str, expressoes: List[str], max_tokens_
     Returns:
         Optional[str]: A expressão encontrada ou None se nenhuma for encontrada.
     """
-    # Limita a verificação aos primeiros max_tokens_inicio tokens
-    tokens_sentenca = tokenize(sentenca)
+    # Limita a verificação aos primeiros max_tokens_inicio tokens: a sentença é
+    # tokenizada sob demanda, só até onde as expressões candidatas precisam
+    tokens_sentenca = []
+    proximos_tokens = tokenizador.iterar_tokens(sentenca)
 
     # Texto completo em lowercase para verificação
     texto_lower = sentenca.lower()
@@ -121,6 +242,9 @@ def verificar_expressao_inicio(sentenca: str, expressoes: List[str], max_tokens_
         if expressao_lower in texto_lower:
             # Tokeniza a expressão
             tokens_expressao = tokenize(expressao_lower)
+            necessarios = max_tokens_inicio - 1 + len(tokens_expressao) - len(tokens_sentenca)
+            if necessarios > 0:
+                tokens_sentenca.extend(itertools.islice(proximos_tokens, necessarios))
 
             # Verifica se a expressão começa em algum dos tokens iniciais
             for i in range(min(max_tokens_inicio, len(tokens_sentenca) - len(tokens_expressao) + 1)):
@@ -159,8 +283,7 @@ def contar_tokens(texto: str) -> int:
     Returns:
         int: Número de tokens no texto.
     """
-    tokens = tokenize(texto)
-    return len(tokens)
+    return tokenizador.contar_tokens(texto)
 
 def contar_ocorrencias_token(texto: str, token: str) -> int:
     """Conta o número de ocorrências de um token específico no texto.
@@ -0,0 +1,26 @@
+"""__init__.py
+=================================
+Este pacote reúne os benchmarks do pacote analizador_de_texto.
+
+Cada módulo pode ser executado diretamente, por exemplo:
+
+    poetry run python -m benchmarks.bench_compilador_regras
+
+Benchmarks disponíveis:
+- executar.py: suíte com vazão e percentis de latência de cada etapa, com saída em JSON
+- bench_compilador_regras.py: avaliador compilado x closures do ParserRegras
+- bench_avaliacao_vetorizada.py: avaliador compilado x avaliação vetorizada (NumPy)
+- bench_tokenizador.py: tokenização anterior x modos do tokenizador (lista, contagem, prefixo, lote)
+- bench_artefato_regras.py: inicialização a frio de um worker com e sem o artefato pré-compilado
+- bench_daemon.py: latência por chamada com um processo novo x cliente do daemon
+- bench_estatisticas_expressoes.py: contagem das expressões pela saída por sentença x modo agregado
+- bench_corpus_mapeado.py: memória do processo principal e vazão, lista de registros x corpus mapeado
+- bench_paralelo.py: vazão do ExecutorProcessos de 1 a N workers
+- bench_threads.py: vazão do ExecutorThreads de 1 a N threads, com e sem GIL
+- bench_sessao_incremental.py: recálculo completo x SessaoTexto a cada salvamento
+- bench_cache_prefixos.py: busca das expressões sem e com o cache de prefixos de sentença
+- bench_automato_literais.py: uma passada de str.count por literal x uma passada do autômato
+
+Módulos auxiliares:
+- gerador_corpus.py: corpora, expressões e regras sintéticas determinísticas
+"""
\ No newline at end of file
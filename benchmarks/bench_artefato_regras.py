@@ -0,0 +1,81 @@
+"""bench_artefato_regras.py
+================================
+Mede o tempo de inicialização a frio de um worker: importar o pacote, carregar
+as regras e expressões e categorizar um texto, com e sem o artefato pré-compilado.
+
+Cada medição é um processo Python novo (como um worker serverless ou um contêiner
+por tarefa). São usados arquivos sintéticos de regras e expressões, gravados em
+um diretório temporário, além dos arquivos do pacote.
+
+Uso:
+    poetry run python -m benchmarks.bench_artefato_regras [--regras 1000 5000] [--expressoes 5000] [--repeticoes 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from analizador_de_texto.artefato_regras import compilar_artefato
+from benchmarks.gerador_corpus import gerar_expressoes, gerar_regras
+
+# Programa executado em cada processo: importa, carrega e categoriza um texto
+PROGRAMA = '''
+import sys
+from analizador_de_texto.registro import registro
+if sys.argv[3]:
+    from analizador_de_texto.artefato_regras import carregar_artefato
+    registro.instalar_artefato(carregar_artefato(sys.argv[3]))
+from analizador_de_texto import aplica_regras
+aplica_regras([{"id": 1, "texto": "Por fim, uma frase curta. Outra frase!"}], sys.argv[1], sys.argv[2])
+'''
+
+
+def medir(regras: str, expressoes: str, artefato: str, repeticoes: int) -> float:
+    """Menor tempo (s) de um processo novo que importa, carrega e categoriza um texto."""
+    comando = [sys.executable, '-c', PROGRAMA, regras, expressoes, artefato]
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, stdout=subprocess.DEVNULL)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def comparar(nome: str, regras: str, expressoes: str, diretorio: str, repeticoes: int) -> None:
+    """Compila o artefato e imprime os tempos de inicialização com e sem ele."""
+    artefato = os.path.join(diretorio, f'{nome}.bin')
+    tamanho = compilar_artefato(artefato, regras, expressoes)
+    vazio = medir(regras, expressoes, '', repeticoes)
+    com_artefato = medir(regras, expressoes, artefato, repeticoes)
+    print(f'  {nome:28} sem artefato {vazio * 1e3:9.1f} ms   com artefato {com_artefato * 1e3:9.1f} ms'
+          f'   ganho {vazio / com_artefato:5.2f}x   ({tamanho / 1024:.0f} KiB)')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--regras', type=int, nargs='+', default=[1000, 5000],
+                        help='números de regras sintéticas')
+    parser.add_argument('--expressoes', type=int, default=5000,
+                        help='número de expressões sintéticas usadas com as regras sintéticas')
+    parser.add_argument('--repeticoes', type=int, default=10)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        expressoes = os.path.join(diretorio, 'expressoes.txt')
+        with open(expressoes, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(gerar_expressoes(argumentos.expressoes)) + '\n')
+
+        print('Inicialização a frio (import + carga + 1 texto), melhor de', argumentos.repeticoes)
+        comparar('regras do pacote', 'regras_linguagem_natural.txt', 'expressoes.txt',
+                 diretorio, argumentos.repeticoes)
+        for quantidade in argumentos.regras:
+            regras = os.path.join(diretorio, f'regras_{quantidade}.txt')
+            with open(regras, 'w', encoding='utf-8') as arquivo:
+                arquivo.write('\n'.join(gerar_regras(quantidade)) + '\n')
+            comparar(f'{quantidade} regras sintéticas', regras, expressoes, diretorio, argumentos.repeticoes)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""bench_automato_literais.py
+================================
+Compara a contagem dos literais das regras com uma passada de `str.count` por
+literal e com uma única passada do `AutomatoLiterais`.
+
+Os literais são palavras e pares de palavras sorteados do próprio corpus, de forma
+que a maioria ocorra nos textos. O ponto em que o autômato passa a ser mais rápido
+define `automato_literais.LIMIAR_LITERAIS`. Por fim, a avaliação das regras
+compiladas é medida com e sem o autômato para um conjunto sintético de regras.
+
+Uso:
+    poetry run python -m benchmarks.bench_automato_literais --literais 50 150 500 2000
+"""
+import argparse
+import random
+import timeit
+from typing import List
+
+from analizador_de_texto.automato_literais import AutomatoLiterais
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.utils import tokenize
+from benchmarks.gerador_corpus import gerar_corpus
+
+
+def sortear_literais(textos: List[str], quantidade: int, semente: int = 0) -> List[str]:
+    """Sorteia literais distintos (palavras e pares de palavras) do corpus."""
+    gerador = random.Random(semente)
+    candidatos = set()
+    for texto in textos:
+        tokens = [token.lower() for token in tokenize(texto) if token.isalpha()]
+        candidatos.update(tokens)
+        candidatos.update(' '.join(par) for par in zip(tokens, tokens[1:]))
+    candidatos = sorted(candidatos)
+    return gerador.sample(candidatos, min(quantidade, len(candidatos)))
+
+
+def medir_contagem(textos_lower: List[str], literais: List[str], repeticoes: int) -> None:
+    """Confere que as duas contagens concordam e imprime os tempos por texto."""
+    automato = AutomatoLiterais(literais)
+    for texto in textos_lower:
+        assert automato.contar(texto) == {literal: texto.count(literal) for literal in literais}
+
+    tempo_count = min(timeit.repeat(
+        lambda: [[texto.count(literal) for literal in literais] for texto in textos_lower],
+        number=repeticoes, repeat=5))
+    tempo_automato = min(timeit.repeat(
+        lambda: [automato.contar(texto) for texto in textos_lower], number=repeticoes, repeat=5))
+
+    por_texto = 1e6 / (repeticoes * len(textos_lower))
+    print(f'  {len(literais):6} literais   str.count {tempo_count * por_texto:10.2f} µs/texto'
+          f'   autômato {tempo_automato * por_texto:10.2f} µs/texto'
+          f'   ganho {tempo_count / tempo_automato:5.2f}x')
+
+
+def medir_regras(textos: List[str], literais: List[str], repeticoes: int) -> None:
+    """Mede a avaliação das regras compiladas com e sem o autômato."""
+    regras_texto = [f'Se número de "{literal}" é maior que 1, então a categoria é C{indice % 50}.'
+                    for indice, literal in enumerate(literais)]
+    regras_estruturadas = ParserRegras().estruturar_regras(regras_texto)
+    sem_automato = compilar_regras(regras_estruturadas, limiar_literais=len(literais) + 1)
+    com_automato = compilar_regras(regras_estruturadas, limiar_literais=0)
+
+    for texto in textos:
+        assert sem_automato(TextoAnalisado(texto)) == com_automato(TextoAnalisado(texto))
+
+    # Um TextoAnalisado novo por execução, para que as contagens não sejam reaproveitadas
+    tempo_sem = min(timeit.repeat(
+        lambda: [sem_automato(TextoAnalisado(texto)) for texto in textos], number=repeticoes, repeat=5))
+    tempo_com = min(timeit.repeat(
+        lambda: [com_automato(TextoAnalisado(texto)) for texto in textos], number=repeticoes, repeat=5))
+
+    por_texto = 1e6 / (repeticoes * len(textos))
+    print(f'  {len(regras_texto):6} regras     sem autômato {tempo_sem * por_texto:10.2f} µs/texto'
+          f'   com autômato {tempo_com * por_texto:10.2f} µs/texto'
+          f'   ganho {tempo_sem / tempo_com:5.2f}x')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--textos', type=int, default=50, help='número de redações sintéticas')
+    parser.add_argument('--literais', type=int, nargs='+', default=[10, 50, 100, 150, 300, 1000],
+                        help='números de literais medidos')
+    parser.add_argument('--repeticoes', type=int, default=3, help='execuções por medição')
+    argumentos = parser.parse_args()
+
+    textos = [info_texto['texto'] for info_texto in gerar_corpus(argumentos.textos, sentencas_por_texto=20)]
+    textos_lower = [texto.lower() for texto in textos]
+
+    print('Contagem dos literais:')
+    for quantidade in argumentos.literais:
+        medir_contagem(textos_lower, sortear_literais(textos, quantidade), argumentos.repeticoes)
+    print('Regras compiladas:')
+    for quantidade in argumentos.literais:
+        medir_regras(textos, sortear_literais(textos, quantidade), argumentos.repeticoes)
+
+
+if __name__ == '__main__':
+    main()
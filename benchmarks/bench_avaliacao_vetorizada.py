@@ -0,0 +1,59 @@
+"""bench_avaliacao_vetorizada.py
+================================
+Compara a avaliação das regras pela função gerada por `compilar_regras` (um texto
+por vez) com a avaliação vetorizada de `AvaliadorVetorizado` (lote inteiro).
+
+As características dos textos são extraídas antes da medição, de forma que apenas
+o custo de avaliação das regras seja comparado; o tempo de extração da matriz é
+informado à parte. Usa um corpus sintético e 1.000 regras sintéticas. Requer o NumPy.
+
+Uso:
+    poetry run python -m benchmarks.bench_avaliacao_vetorizada --textos 100000
+"""
+import argparse
+import time
+import timeit
+
+from analizador_de_texto.avaliacao_vetorizada import AvaliadorVetorizado
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.problema2 import ParserRegras
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from benchmarks.gerador_corpus import gerar_corpus, gerar_expressoes, gerar_regras
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--textos', type=int, default=20_000, help='número de textos do lote')
+    parser.add_argument('--regras', type=int, default=1_000, help='número de regras sintéticas')
+    argumentos = parser.parse_args()
+
+    expressoes = gerar_expressoes()
+    trie_expressoes = TrieExpressoes(expressoes)
+    regras = ParserRegras().estruturar_regras(gerar_regras(argumentos.regras))
+    avaliar_regras = compilar_regras(regras)
+    avaliador = AvaliadorVetorizado(regras)
+
+    textos = [TextoAnalisado(info_texto['texto'], trie_expressoes)
+              for info_texto in gerar_corpus(argumentos.textos, expressoes=expressoes)]
+    inicio = time.perf_counter()
+    matriz = avaliador.extrair_caracteristicas(textos)
+    tempo_extracao = time.perf_counter() - inicio
+
+    # Os dois avaliadores precisam concordar antes de serem comparados
+    assert avaliador.categorias_lote(matriz) == [sorted(avaliar_regras(texto)) for texto in textos]
+
+    tempo_compilado = min(timeit.repeat(
+        lambda: [sorted(avaliar_regras(texto)) for texto in textos], number=1, repeat=3))
+    tempo_vetorizado = min(timeit.repeat(lambda: avaliador.categorias_lote(matriz), number=1, repeat=3))
+
+    por_texto = 1e6 / len(textos)
+    print(f'  textos: {len(textos)}  regras: {len(regras)}  colunas: {len(avaliador.colunas)}')
+    print(f'  extração da matriz: {tempo_extracao * por_texto:10.2f} µs/texto')
+    print(f'  compilado:          {tempo_compilado * por_texto:10.2f} µs/texto')
+    print(f'  vetorizado:         {tempo_vetorizado * por_texto:10.2f} µs/texto')
+    print(f'  ganho:              {tempo_compilado / tempo_vetorizado:10.2f}x')
+
+
+if __name__ == '__main__':
+    main()
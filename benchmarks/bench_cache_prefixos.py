@@ -0,0 +1,76 @@
+"""bench_cache_prefixos.py
+================================
+Mede a busca de expressões no início das sentenças (`TrieExpressoes.buscar_indice`)
+sem o cache de prefixos e com caches de tamanhos diferentes, informando a taxa de
+acerto de cada tamanho.
+
+Um acerto dispensa a tokenização do início da sentença e a caminhada pela árvore;
+uma falta custa um pouco mais que a busca sem cache. Os corpora sintéticos sorteiam
+as palavras de cada sentença e repetem poucas aberturas; um terceiro corpus troca o
+início de cada sentença por uma de poucas centenas de aberturas, como em redações
+reais. A taxa de acerto a partir da qual o cache compensa é o número a comparar com a
+taxa medida em produção (`registro.trie_expressoes().cache_prefixos.estatisticas()`,
+com `RegistroRecursos(max_prefixos=...)`).
+
+Uso:
+    poetry run python -m benchmarks.bench_cache_prefixos --tamanhos 256 4096 65536
+"""
+import argparse
+import random
+import timeit
+from typing import List
+
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import ler_expressoes, separar_sentencas
+from benchmarks.gerador_corpus import gerar_corpus, gerar_expressoes
+
+
+def repetir_aberturas(sentencas: List[str], aberturas: int, semente: int = 0) -> List[str]:
+    """Troca as três primeiras palavras de cada sentença por uma de poucas aberturas."""
+    gerador = random.Random(semente)
+    inicios = [' '.join(sentenca.split(' ')[:3]) for sentenca in sentencas[:aberturas]]
+    return [gerador.choice(inicios) + ' ' + ' '.join(sentenca.split(' ')[3:]) for sentenca in sentencas]
+
+
+def medir(nome: str, expressoes: List[str], sentencas: List[str], tamanhos: List[int], repeticoes: int) -> None:
+    """Imprime o tempo por sentença sem cache e com cada tamanho de cache."""
+    sem_cache = TrieExpressoes(expressoes, max_prefixos=0)
+    esperado = [sem_cache.buscar_indice(sentenca) for sentenca in sentencas]
+    tempo = min(timeit.repeat(lambda: [sem_cache.buscar_indice(sentenca) for sentenca in sentencas],
+                              number=repeticoes, repeat=5))
+    por_sentenca = 1e6 / (repeticoes * len(sentencas))
+    print(f'{nome}: {len(expressoes)} expressões, {len(sentencas)} sentenças')
+    print(f'  sem cache           {tempo * por_sentenca:8.2f} µs/sentença')
+
+    for tamanho in tamanhos:
+        trie = TrieExpressoes(expressoes, max_prefixos=tamanho)
+        # Começa vazio: cada medição percorre o corpus uma vez, como em um lote real
+        tempo_cache = min(timeit.repeat(lambda: [trie.buscar_indice(sentenca) for sentenca in sentencas],
+                                        setup=lambda: trie.configurar_cache(tamanho), number=1, repeat=5))
+        assert [trie.buscar_indice(sentenca) for sentenca in sentencas] == esperado
+        trie.configurar_cache(tamanho)
+        for sentenca in sentencas:
+            trie.buscar_indice(sentenca)
+        taxa = trie.cache_prefixos.estatisticas()['taxa_acerto']
+        print(f'  cache {tamanho:>7}       {tempo_cache * 1e6 / len(sentencas):8.2f} µs/sentença'
+              f'   acertos {taxa:6.1%}   ganho {tempo * por_sentenca * len(sentencas) / 1e6 / tempo_cache:5.2f}x')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--textos', type=int, default=1000, help='número de redações sintéticas')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[256, 4096, 65536],
+                        help='tamanhos do cache medidos')
+    argumentos = parser.parse_args()
+
+    for nome, expressoes in (('expressões do pacote', ler_expressoes()),
+                             ('expressões sintéticas', gerar_expressoes(1000))):
+        corpus = gerar_corpus(argumentos.textos, expressoes=expressoes)
+        sentencas = [sentenca for info_texto in corpus for sentenca in separar_sentencas(info_texto['texto'])]
+        medir(nome, expressoes, sentencas, argumentos.tamanhos, repeticoes=1)
+        medir(f'{nome}, 300 aberturas', expressoes, repetir_aberturas(sentencas, 300),
+              argumentos.tamanhos, repeticoes=1)
+
+
+if __name__ == '__main__':
+    main()
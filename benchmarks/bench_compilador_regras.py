@@ -0,0 +1,62 @@
+"""bench_compilador_regras.py
+================================
+Compara a avaliação das regras pelas closures de `ParserRegras.analisar_regras`
+com a função gerada por `compilar_regras`.
+
+As características dos textos (sentenças, tokens e expressões) são calculadas
+antes da medição, de forma que apenas o custo de avaliação das regras seja
+comparado. São medidos dois conjuntos de regras: o do pacote e um conjunto
+sintético com 1.000 regras.
+
+Uso:
+    poetry run python -m benchmarks.bench_compilador_regras
+"""
+import timeit
+from typing import List
+
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.problema2 import ParserRegras, categorizar
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import ler_entrada_json, ler_expressoes, ler_regras
+from benchmarks.gerador_corpus import gerar_regras
+
+def medir(regras_texto: List[str], textos: List[TextoAnalisado], repeticoes: int) -> None:
+    """Mede e imprime o tempo por texto dos dois avaliadores."""
+    parser = ParserRegras()
+    regras = parser.analisar_regras(regras_texto)
+    avaliar_regras = compilar_regras(parser.estruturar_regras(regras_texto))
+
+    # Os dois avaliadores precisam concordar antes de serem comparados
+    for texto in textos:
+        assert categorizar(texto, regras) == sorted(avaliar_regras(texto))
+
+    tempo_closures = min(timeit.repeat(
+        lambda: [categorizar(texto, regras) for texto in textos], number=repeticoes, repeat=5))
+    tempo_compilado = min(timeit.repeat(
+        lambda: [sorted(avaliar_regras(texto)) for texto in textos], number=repeticoes, repeat=5))
+
+    por_texto = 1e6 / (repeticoes * len(textos))
+    print(f'  regras: {len(regras)}')
+    print(f'  closures:  {tempo_closures * por_texto:10.2f} µs/texto')
+    print(f'  compilado: {tempo_compilado * por_texto:10.2f} µs/texto')
+    print(f'  ganho:     {tempo_closures / tempo_compilado:10.2f}x')
+
+
+def main() -> None:
+    trie_expressoes = TrieExpressoes(ler_expressoes())
+    textos = []
+    for info_texto in ler_entrada_json():
+        texto = TextoAnalisado(info_texto['texto'], trie_expressoes, info_texto['id'])
+        # Pré-calcula as características para medir apenas a avaliação das regras
+        texto.qtd_tokens, texto.qtd_sentencas, texto.qtd_sentencas_com_expressao
+        textos.append(texto)
+
+    print('Regras do pacote:')
+    medir(ler_regras(), textos, repeticoes=2000)
+    print('Regras sintéticas (1.000):')
+    medir(gerar_regras(1000), textos, repeticoes=20)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
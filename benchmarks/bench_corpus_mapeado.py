@@ -0,0 +1,88 @@
+"""bench_corpus_mapeado.py
+================================
+Mede o pico de memória residente do processo principal e a vazão do
+`ExecutorProcessos` ao categorizar um corpus JSONL: registros decodificados em
+uma lista (`ler_registros_json`) x `CorpusMapeado` (fatias enviadas aos workers).
+Mede também o acesso a um registro por id: leitura do arquivo inteiro x índice.
+
+Cada medição é um processo Python novo, para que o pico de memória residente
+(ru_maxrss) seja apenas o da variante medida. Os resultados são consumidos um a um
+(`aplica_regras_iter`), de modo que a memória medida é a da entrada.
+
+Uso:
+    poetry run python -m benchmarks.bench_corpus_mapeado [--textos 50000] [--workers N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.gerador_corpus import gerar_corpus
+
+# Programa executado em cada processo: imprime o tempo (s) e o pico de memória residente (KiB)
+PROGRAMA = '''
+import resource, sys, time
+from analizador_de_texto.corpus_mapeado import CorpusMapeado
+from analizador_de_texto.paralelo import ExecutorProcessos
+from analizador_de_texto.utils import ler_registros_json
+variante, caminho, workers = sys.argv[1], sys.argv[2], int(sys.argv[3])
+inicio = time.perf_counter()
+if variante == 'id':
+    with open(caminho, encoding='utf-8') as arquivo:
+        registro = next(r for r in ler_registros_json(arquivo) if r['id'] == int(sys.argv[4]))
+elif variante == 'id_mapeado':
+    registro = CorpusMapeado(caminho).por_id(int(sys.argv[4]))
+else:
+    with ExecutorProcessos(workers=workers) as executor:
+        if variante == 'lista':
+            with open(caminho, encoding='utf-8') as arquivo:
+                entrada = list(ler_registros_json(arquivo))
+        else:
+            entrada = CorpusMapeado(caminho)
+        for _ in executor.aplica_regras_iter(entrada):
+            pass
+print(time.perf_counter() - inicio, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+
+def medir(variante: str, caminho: str, workers: int, *extra: str):
+    """Executa a variante em um processo novo e devolve (tempo em s, pico de memória em KiB)."""
+    saida = subprocess.run([sys.executable, '-c', PROGRAMA, variante, caminho, str(workers), *extra],
+                           check=True, capture_output=True, text=True).stdout.split()
+    return float(saida[-2]), int(saida[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--textos', type=int, default=50_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'corpus.jsonl')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            for registro in gerar_corpus(argumentos.textos):
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        print(f'{argumentos.textos} textos, {os.path.getsize(caminho) / 2**20:.1f} MiB, '
+              f'workers={argumentos.workers}')
+
+        tempo_lista, memoria_lista = medir('lista', caminho, argumentos.workers)
+        tempo_mapeado, memoria_mapeado = medir('mapeado', caminho, argumentos.workers)
+        print('Categorização (processo principal):')
+        print(f'  lista de registros   {argumentos.textos / tempo_lista:8.0f} textos/s   '
+              f'pico {memoria_lista / 1024:7.1f} MiB')
+        print(f'  CorpusMapeado        {argumentos.textos / tempo_mapeado:8.0f} textos/s   '
+              f'pico {memoria_mapeado / 1024:7.1f} MiB')
+
+        ultimo = str(argumentos.textos - 1)
+        tempo_id, _ = medir('id', caminho, 0, ultimo)
+        tempo_id_mapeado, _ = medir('id_mapeado', caminho, 0, ultimo)
+        print('Acesso ao último registro por id (inclui a indexação):')
+        print(f'  leitura em fluxo     {tempo_id * 1e3:8.1f} ms')
+        print(f'  CorpusMapeado        {tempo_id_mapeado * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
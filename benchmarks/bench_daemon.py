@@ -0,0 +1,91 @@
+"""bench_daemon.py
+================================
+Mede a latência por chamada de um job que categoriza um arquivo JSON: um processo
+novo por chamada (`python -m analizador_de_texto.problema2`) x cliente do daemon
+(`python -m analizador_de_texto.cliente_daemon categorias`), além da latência de
+uma requisição pelo socket a partir de um processo já iniciado, com 1 e N clientes
+concorrentes.
+
+O daemon é iniciado em um processo separado, com um socket em um diretório temporário.
+
+Uso:
+    poetry run python -m benchmarks.bench_daemon [--repeticoes 20] [--clientes 8]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from analizador_de_texto.cliente_daemon import ClienteDaemon
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def medir_processos(comando, repeticoes: int, ambiente) -> float:
+    """Menor tempo (s) de um processo novo executando o comando."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, stdout=subprocess.DEVNULL, env=ambiente)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def medir_requisicoes(caminho_socket: str, repeticoes: int, clientes: int) -> float:
+    """Latência mediana (s) de uma requisição com `clientes` conexões concorrentes."""
+    textos = ler_entrada_json()
+    latencias = []
+
+    def executar():
+        with ClienteDaemon(caminho_socket) as cliente:
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                cliente.aplica_regras(textos)
+                latencias.append(time.perf_counter() - inicio)
+
+    threads = [threading.Thread(target=executar) for _ in range(clientes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(latencias)[len(latencias) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    parser.add_argument('--clientes', type=int, default=8)
+    argumentos = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_socket = os.path.join(diretorio, 'daemon.sock')
+        ambiente = dict(os.environ, ANALIZADOR_SOCKET=caminho_socket)
+        daemon = subprocess.Popen([sys.executable, '-m', 'analizador_de_texto', 'daemon'],
+                                  env=ambiente, stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(caminho_socket):
+                time.sleep(0.01)
+
+            sem_daemon = medir_processos([sys.executable, '-m', 'analizador_de_texto.problema2'],
+                                         argumentos.repeticoes, ambiente)
+            cliente = medir_processos([sys.executable, '-m', 'analizador_de_texto.cliente_daemon', 'categorias'],
+                                      argumentos.repeticoes, ambiente)
+            interpretador = medir_processos([sys.executable, '-c', 'pass'], argumentos.repeticoes, ambiente)
+            print(f'Processo por chamada (melhor de {argumentos.repeticoes}):')
+            print(f'  python -m ...problema2            {sem_daemon * 1e3:8.1f} ms')
+            print(f'  python -m ...cliente_daemon       {cliente * 1e3:8.1f} ms   ganho {sem_daemon / cliente:5.1f}x')
+            print(f'  (python -c pass                   {interpretador * 1e3:8.1f} ms)')
+
+            print('Requisição pelo socket, processo já iniciado (mediana):')
+            for clientes in (1, argumentos.clientes):
+                latencia = medir_requisicoes(caminho_socket, argumentos.repeticoes * 5, clientes)
+                print(f'  {clientes:3} cliente(s)                     {latencia * 1e3:8.2f} ms')
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+
+if __name__ == '__main__':
+    main()
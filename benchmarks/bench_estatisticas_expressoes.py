@@ -0,0 +1,65 @@
+"""bench_estatisticas_expressoes.py
+================================
+Mede o tempo e o pico de memória alocada para obter as contagens das expressões de
+um corpus: saída por sentença de `encontra_expressoes` seguida da contagem x modo
+agregado (`estatisticas_expressoes`), com e sem os contadores por texto.
+
+Uso:
+    poetry run python -m benchmarks.bench_estatisticas_expressoes [--textos 20000] [--repeticoes 3]
+"""
+import argparse
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable, Dict
+
+from analizador_de_texto.estatisticas_expressoes import estatisticas_expressoes
+from analizador_de_texto.problema1 import encontra_expressoes
+from benchmarks.gerador_corpus import gerar_corpus
+
+
+def contar_pela_saida(textos) -> Dict[str, int]:
+    """Contagem das expressões a partir da saída de `encontra_expressoes`."""
+    return dict(Counter(sentenca['expressao'] for resultado in encontra_expressoes(textos)
+                        for sentenca in resultado['sentencas'] if sentenca['expressao'] is not None))
+
+
+def medir(funcao: Callable[[], object], repeticoes: int):
+    """Menor tempo (s) entre as repetições e pico de memória alocada (bytes) em uma chamada."""
+    tempo = min(_cronometrar(funcao) for _ in range(repeticoes))
+    tracemalloc.start()
+    try:
+        funcao()
+        return tempo, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _cronometrar(funcao: Callable[[], object]) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--textos', type=int, default=20_000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    argumentos = parser.parse_args()
+
+    textos = gerar_corpus(argumentos.textos)
+    assert contar_pela_saida(textos) == estatisticas_expressoes(textos, por_texto=False).contagem_expressoes()
+    print(f'{len(textos)} textos')
+
+    base = None
+    for nome, funcao in (('encontra_expressoes + contagem', lambda: contar_pela_saida(textos)),
+                         ('agregado, por texto', lambda: estatisticas_expressoes(textos)),
+                         ('agregado, só corpus', lambda: estatisticas_expressoes(textos, por_texto=False))):
+        tempo, memoria = medir(funcao, argumentos.repeticoes)
+        base = base or (tempo, memoria)
+        print(f'  {nome:32} {len(textos) / tempo:9.0f} textos/s ({base[0] / tempo:4.2f}x)'
+              f'   pico {memoria / 2**20:8.2f} MiB ({base[1] / memoria:6.1f}x menos)')
+
+
+if __name__ == '__main__':
+    main()
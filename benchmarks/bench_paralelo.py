@@ -0,0 +1,51 @@
+"""bench_paralelo.py
+================================
+Mede a vazão (textos/s) do `ExecutorProcessos` variando o número de workers
+de 1 até N, comparando com a execução sequencial.
+
+Uso:
+    poetry run python -m benchmarks.bench_paralelo [--textos 20000] [--max-workers N]
+"""
+import argparse
+import os
+import time
+
+from analizador_de_texto.paralelo import ExecutorProcessos
+from analizador_de_texto.problema2 import aplica_regras
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--textos', type=int, default=20_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    argumentos = parser.parse_args()
+
+    amostras = ler_entrada_json()
+    textos = [
+        {'id': indice, 'texto': amostras[indice % len(amostras)]['texto']}
+        for indice in range(argumentos.textos)
+    ]
+
+    inicio = time.perf_counter()
+    esperado = aplica_regras(textos)
+    sequencial = time.perf_counter() - inicio
+    print(f'sequencial: {len(textos) / sequencial:10.0f} textos/s')
+
+    workers = 1
+    while workers <= argumentos.max_workers:
+        with ExecutorProcessos(workers=workers) as executor:
+            # Aquece o pool (inicialização dos processos fora da medição)
+            executor.aplica_regras(textos[:workers])
+            inicio = time.perf_counter()
+            resultado = executor.aplica_regras(textos)
+            duracao = time.perf_counter() - inicio
+
+        assert resultado == esperado
+        print(f'workers={workers:<3d} {len(textos) / duracao:10.0f} textos/s  '
+              f'({sequencial / duracao:5.2f}x sequencial)')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""bench_sessao_incremental.py
+================================
+Compara o recálculo completo das categorias de uma redação (`aplica_regras`) com
+a atualização incremental de uma `SessaoTexto`, quando apenas uma sentença muda
+entre dois salvamentos.
+
+Cada salvamento acrescenta uma palavra a uma sentença sorteada da redação.
+
+Uso:
+    poetry run python -m benchmarks.bench_sessao_incremental --sentencas 20 80
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from analizador_de_texto.problema2 import aplica_regras
+from analizador_de_texto.sessao_incremental import SessaoTexto, dividir_em_trechos
+from benchmarks.gerador_corpus import gerar_corpus
+
+
+def gerar_edicoes(texto: str, quantidade: int, semente: int = 0) -> List[str]:
+    """Versões sucessivas do texto, cada uma com uma sentença alterada em relação à anterior."""
+    gerador = random.Random(semente)
+    versoes = []
+    for _ in range(quantidade):
+        trechos = dividir_em_trechos(texto)
+        indice = gerador.randrange(len(trechos))
+        trechos[indice] = ' palavra' + trechos[indice]
+        texto = ''.join(trechos)
+        versoes.append(texto)
+    return versoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sentencas', type=int, nargs='+', default=[10, 40, 160],
+                        help='sentenças por redação')
+    parser.add_argument('--edicoes', type=int, default=500, help='salvamentos por redação')
+    argumentos = parser.parse_args()
+
+    for sentencas in argumentos.sentencas:
+        texto = gerar_corpus(1, sentencas_por_texto=sentencas)[0]['texto']
+        versoes = gerar_edicoes(texto, argumentos.edicoes)
+
+        inicio = time.perf_counter()
+        esperado = [aplica_regras([{'id': 1, 'texto': versao}])[0] for versao in versoes]
+        completo = time.perf_counter() - inicio
+
+        sessao = SessaoTexto(id_texto=1)
+        sessao.atualizar(texto)
+        inicio = time.perf_counter()
+        resultado = [sessao.atualizar(versao) for versao in versoes]
+        incremental = time.perf_counter() - inicio
+
+        assert resultado == esperado
+        por_edicao = 1e6 / len(versoes)
+        print(f'  {sentencas:4} sentenças   completo {completo * por_edicao:9.1f} µs/salvamento'
+              f'   incremental {incremental * por_edicao:9.1f} µs/salvamento'
+              f'   ganho {completo / incremental:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""bench_threads.py
+================================
+Mede a vazão (textos/s) do `ExecutorThreads` variando o número de threads de 1
+até N, comparando com a execução sequencial.
+
+Com o GIL, as threads não devem ganhar vazão (o ganho esperado é próximo de 1x);
+no CPython sem GIL (build 3.13t ou posterior, executado com o GIL desativado), a
+vazão deve crescer com o número de núcleos. O tipo de build e o estado do GIL são
+impressos junto com os resultados, para comparar as duas execuções.
+
+Uso:
+    poetry run python -m benchmarks.bench_threads [--textos 20000] [--max-workers N]
+    python3.13t -X gil=0 -m benchmarks.bench_threads
+"""
+import argparse
+import os
+import platform
+import sys
+import sysconfig
+import time
+
+from analizador_de_texto.paralelo import ExecutorThreads
+from analizador_de_texto.problema1 import encontra_expressoes
+from analizador_de_texto.problema2 import aplica_regras
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def descrever_build() -> str:
+    """Versão do Python, tipo de build (com ou sem GIL) e estado do GIL nesta execução."""
+    sem_gil = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+    # sys._is_gil_enabled só existe a partir do 3.13
+    gil_ativo = sys._is_gil_enabled() if hasattr(sys, '_is_gil_enabled') else True
+    build = 'free-threaded' if sem_gil else 'padrão'
+    return f'Python {platform.python_version()} ({build}), GIL {"ativo" if gil_ativo else "desativado"}'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--textos', type=int, default=20_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    argumentos = parser.parse_args()
+
+    amostras = ler_entrada_json()
+    textos = [
+        {'id': indice, 'texto': amostras[indice % len(amostras)]['texto']}
+        for indice in range(argumentos.textos)
+    ]
+    print(descrever_build())
+
+    for nome, sequencial_func in (('aplica_regras', aplica_regras), ('encontra_expressoes', encontra_expressoes)):
+        inicio = time.perf_counter()
+        esperado = sequencial_func(textos)
+        sequencial = time.perf_counter() - inicio
+        print(f'{nome}')
+        print(f'  sequencial: {len(textos) / sequencial:10.0f} textos/s')
+
+        workers = 1
+        while workers <= argumentos.max_workers:
+            with ExecutorThreads(workers=workers, caracteres_por_lote=20_000) as executor:
+                executar = getattr(executor, nome)
+                inicio = time.perf_counter()
+                resultado = executar(textos)
+                duracao = time.perf_counter() - inicio
+
+            assert resultado == esperado
+            print(f'  threads={workers:<3d} {len(textos) / duracao:10.0f} textos/s  '
+                  f'({sequencial / duracao:5.2f}x sequencial)')
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
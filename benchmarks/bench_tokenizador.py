@@ -0,0 +1,85 @@
+"""bench_tokenizador.py
+================================
+Micro-benchmarks dos modos do `tokenizador` contra a tokenização anterior
+(`re.findall(r'(\\w+|\\S)')` seguido do filtro de tokens vazios).
+
+Casos medidos, sobre redações sintéticas:
+- lista de tokens de um texto;
+- contagem de tokens de um texto (e das suas sentenças);
+- primeiros tokens de cada sentença (início usado na busca de expressões);
+- lote de textos (lista e contagem).
+
+Também é informado o pico de memória alocada na contagem.
+
+Uso:
+    poetry run python -m benchmarks.bench_tokenizador --textos 200
+"""
+import argparse
+import re
+import timeit
+import tracemalloc
+from typing import Callable, List
+
+from analizador_de_texto.tokenizador import (contar_tokens, contar_tokens_lote, iterar_tokens, tokenizar,
+                                             tokenizar_lote)
+from analizador_de_texto.utils import separar_sentencas
+from benchmarks.gerador_corpus import gerar_corpus
+
+
+def tokenize_anterior(sentenca: str) -> List[str]:
+    """Implementação anterior de `utils.tokenize`."""
+    tokens = re.findall(r'(\w+|\S)', sentenca)
+    return [token for token in tokens if token.strip()]
+
+
+def medir(nome: str, anterior: Callable[[], object], novo: Callable[[], object], repeticoes: int) -> None:
+    """Confere que as duas versões concordam e imprime os tempos."""
+    assert anterior() == novo(), nome
+    tempo_anterior = min(timeit.repeat(anterior, number=repeticoes, repeat=5)) / repeticoes
+    tempo_novo = min(timeit.repeat(novo, number=repeticoes, repeat=5)) / repeticoes
+    print(f'  {nome:32} anterior {tempo_anterior * 1e3:9.3f} ms   novo {tempo_novo * 1e3:9.3f} ms'
+          f'   ganho {tempo_anterior / tempo_novo:5.2f}x')
+
+
+def pico_memoria(funcao: Callable[[], object]) -> int:
+    """Pico de memória alocada, em bytes, durante uma chamada."""
+    tracemalloc.start()
+    try:
+        funcao()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--textos', type=int, default=200, help='número de redações sintéticas')
+    parser.add_argument('--repeticoes', type=int, default=10, help='execuções por medição')
+    argumentos = parser.parse_args()
+
+    textos = [info_texto['texto'] for info_texto in gerar_corpus(argumentos.textos, sentencas_por_texto=20)]
+    sentencas = [sentenca for texto in textos for sentenca in separar_sentencas(texto)]
+    repeticoes = argumentos.repeticoes
+    print(f'{len(textos)} textos, {len(sentencas)} sentenças, {sum(map(len, textos))} caracteres')
+
+    medir('lista de tokens', lambda: [tokenize_anterior(texto) for texto in textos],
+          lambda: [tokenizar(texto) for texto in textos], repeticoes)
+    medir('contagem (texto)', lambda: [len(tokenize_anterior(texto)) for texto in textos],
+          lambda: [contar_tokens(texto) for texto in textos], repeticoes)
+    medir('contagem (sentenças)', lambda: [len(tokenize_anterior(sentenca)) for sentenca in sentencas],
+          lambda: [contar_tokens(sentenca) for sentenca in sentencas], repeticoes)
+    medir('5 primeiros tokens (sentenças)', lambda: [tokenize_anterior(sentenca)[:5] for sentenca in sentencas],
+          lambda: [list(iterar_tokens(sentenca, 5)) for sentenca in sentencas], repeticoes)
+    medir('lote: listas de tokens', lambda: [tokenize_anterior(texto) for texto in textos],
+          lambda: tokenizar_lote(textos), repeticoes)
+    medir('lote: contagens', lambda: [len(tokenize_anterior(texto)) for texto in textos],
+          lambda: contar_tokens_lote(textos), repeticoes)
+
+    texto_longo = ' '.join(textos)
+    print(f'  pico de memória na contagem de {len(texto_longo)} caracteres: '
+          f'anterior {pico_memoria(lambda: len(tokenize_anterior(texto_longo))) / 1024:.0f} KiB, '
+          f'novo {pico_memoria(lambda: contar_tokens(texto_longo)) / 1024:.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""executar.py
+================================
+Suíte de benchmarks das etapas do analisador sobre corpora sintéticos.
+
+Para cada configuração (número de textos, sentenças por texto, número de
+expressões e número de regras) é gerado um corpus determinístico com
+`gerador_corpus`, e são medidas a vazão e os percentis de latência de:
+- separar_sentencas e tokenize (por texto);
+- verificar_expressao_inicio e TrieExpressoes.buscar (por sentença);
+- encontra_expressoes e aplica_regras (por texto e em lote).
+
+As configurações variam um eixo por vez a partir de uma configuração base. Os
+resultados são impressos e gravados em JSON, para comparação entre versões.
+
+Uso:
+    poetry run python -m benchmarks.executar --saida resultados.json
+    poetry run python -m benchmarks.executar --textos 100 1000 --regras 6 1000
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from analizador_de_texto import aplica_regras
+from analizador_de_texto.problema1 import encontra_expressoes_iter
+from analizador_de_texto.registro import registro
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import (ler_regras, separar_sentencas, tokenize,
+                                       verificar_expressao_inicio)
+from benchmarks.gerador_corpus import gerar_corpus, gerar_expressoes, gerar_regras
+
+CONFIGURACAO_BASE = {'textos': 200, 'sentencas': 10, 'expressoes': 30, 'regras': 6}
+
+
+def percentil(valores_ordenados: List[float], fracao: float) -> float:
+    """Percentil (pelo posto mais próximo) de uma lista já ordenada."""
+    indice = min(len(valores_ordenados) - 1, max(0, round(fracao * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+def medir_latencias(funcao: Callable[[Any], Any], entradas: Iterable[Any],
+                    etapa: str) -> Dict[str, Any]:
+    """Mede a latência de cada chamada de `funcao` e resume vazão e percentis.
+
+    Args:
+        funcao (Callable[[Any], Any]): Função medida, chamada com cada entrada.
+        entradas (Iterable[Any]): Entradas das chamadas.
+        etapa (str): Nome da etapa medida.
+
+    Returns:
+        Dict[str, Any]: Número de chamadas, vazão (chamadas/s) e latências em µs.
+    """
+    relogio = time.perf_counter_ns
+    latencias = []
+    for entrada in entradas:
+        inicio = relogio()
+        funcao(entrada)
+        latencias.append(relogio() - inicio)
+
+    latencias.sort()
+    total = sum(latencias) or 1
+    return {
+        'etapa': etapa,
+        'chamadas': len(latencias),
+        'vazao_por_s': len(latencias) * 1e9 / total,
+        'latencia_us': {
+            'media': total / len(latencias) / 1e3,
+            'p50': percentil(latencias, 0.50) / 1e3,
+            'p90': percentil(latencias, 0.90) / 1e3,
+            'p99': percentil(latencias, 0.99) / 1e3,
+            'max': latencias[-1] / 1e3,
+        },
+    }
+
+
+def medir_lote(funcao: Callable[[Any], Any], entrada: List[Any], etapa: str) -> Dict[str, Any]:
+    """Mede uma única chamada em lote e calcula a vazão por item."""
+    inicio = time.perf_counter()
+    funcao(entrada)
+    duracao = time.perf_counter() - inicio
+    return {
+        'etapa': etapa,
+        'chamadas': 1,
+        'itens': len(entrada),
+        'vazao_por_s': len(entrada) / duracao if duracao else float('inf'),
+        'duracao_s': duracao,
+    }
+
+
+def executar_configuracao(configuracao: Dict[str, int], diretorio: str,
+                          semente: int = 0) -> List[Dict[str, Any]]:
+    """Gera o corpus de uma configuração e mede todas as etapas.
+
+    Args:
+        configuracao (Dict[str, int]): 'textos', 'sentencas', 'expressoes' e 'regras'.
+        diretorio (str): Diretório onde os arquivos de expressões e regras são gravados.
+        semente (int): Semente dos geradores.
+
+    Returns:
+        List[Dict[str, Any]]: Um resultado por etapa, com a configuração incluída.
+    """
+    expressoes = gerar_expressoes(configuracao['expressoes'], semente)
+    regras = ler_regras() if configuracao['regras'] <= 6 else gerar_regras(configuracao['regras'], semente)
+    regras = regras[:configuracao['regras']]
+    corpus = gerar_corpus(configuracao['textos'], configuracao['sentencas'],
+                          expressoes=expressoes, semente=semente)
+
+    nome = '_'.join(f'{chave}{valor}' for chave, valor in sorted(configuracao.items()))
+    arquivo_expressoes = os.path.join(diretorio, f'expressoes_{nome}.txt')
+    arquivo_regras = os.path.join(diretorio, f'regras_{nome}.txt')
+    with open(arquivo_expressoes, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('\n'.join(expressoes) + '\n')
+    with open(arquivo_regras, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('\n'.join(regras) + '\n')
+
+    textos = [info_texto['texto'] for info_texto in corpus]
+    sentencas = [sentenca for texto in textos for sentenca in separar_sentencas(texto)]
+    trie_expressoes = TrieExpressoes(expressoes)
+    # Carrega e compila os recursos fora da medição (avisos de regras vão para stderr)
+    with redirect_stdout(sys.stderr):
+        registro.precarregar(arquivo_regras, arquivo_expressoes)
+
+    resultados = [
+        medir_latencias(separar_sentencas, textos, 'separar_sentencas'),
+        medir_latencias(tokenize, textos, 'tokenize'),
+        medir_latencias(lambda sentenca: verificar_expressao_inicio(sentenca, expressoes),
+                        sentencas, 'verificar_expressao_inicio'),
+        medir_latencias(trie_expressoes.buscar, sentencas, 'TrieExpressoes.buscar'),
+        medir_latencias(lambda info_texto: list(encontra_expressoes_iter([info_texto], arquivo_expressoes)),
+                        corpus, 'encontra_expressoes'),
+        medir_latencias(lambda info_texto: aplica_regras([info_texto], arquivo_regras, arquivo_expressoes),
+                        corpus, 'aplica_regras'),
+        medir_lote(lambda lote: list(encontra_expressoes_iter(lote, arquivo_expressoes)),
+                   corpus, 'encontra_expressoes (lote)'),
+        medir_lote(lambda lote: aplica_regras(lote, arquivo_regras, arquivo_expressoes),
+                   corpus, 'aplica_regras (lote)'),
+    ]
+
+    registro.recarregar(arquivo_expressoes)
+    registro.recarregar(arquivo_regras)
+    for resultado in resultados:
+        resultado['configuracao'] = dict(configuracao)
+    return resultados
+
+
+def configuracoes(eixos: Dict[str, Optional[List[int]]]) -> List[Dict[str, int]]:
+    """Configurações a medir: a base e, para cada eixo informado, uma variação por valor."""
+    lista = [dict(CONFIGURACAO_BASE)]
+    for eixo, valores in eixos.items():
+        for valor in valores or []:
+            configuracao = dict(CONFIGURACAO_BASE, **{eixo: valor})
+            if configuracao not in lista:
+                lista.append(configuracao)
+    return lista
+
+
+def imprimir(resultado: Dict[str, Any]) -> None:
+    """Imprime um resultado em uma linha."""
+    configuracao = ' '.join(f'{chave}={valor}' for chave, valor in resultado['configuracao'].items())
+    linha = f"{configuracao:48} {resultado['etapa']:28} {resultado['vazao_por_s']:12.1f}/s"
+    if 'latencia_us' in resultado:
+        latencia = resultado['latencia_us']
+        linha += f"  p50 {latencia['p50']:9.1f}µs  p90 {latencia['p90']:9.1f}µs  p99 {latencia['p99']:9.1f}µs"
+    print(linha)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument('--textos', type=int, nargs='*', help='Variações do número de textos')
+    parser.add_argument('--sentencas', type=int, nargs='*', help='Variações de sentenças por texto')
+    parser.add_argument('--expressoes', type=int, nargs='*', help='Variações do número de expressões')
+    parser.add_argument('--regras', type=int, nargs='*', help='Variações do número de regras')
+    parser.add_argument('--semente', type=int, default=0, help='Semente dos geradores')
+    parser.add_argument('-o', '--saida', help='Arquivo JSON onde os resultados são gravados')
+    argumentos = parser.parse_args(argv)
+
+    eixos = {eixo: getattr(argumentos, eixo) for eixo in CONFIGURACAO_BASE}
+    resultados = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        for configuracao in configuracoes(eixos):
+            for resultado in executar_configuracao(configuracao, diretorio, argumentos.semente):
+                imprimir(resultado)
+                resultados.append(resultado)
+
+    if argumentos.saida:
+        documento = {
+            'metadados': {
+                'python': platform.python_version(),
+                'implementacao': platform.python_implementation(),
+                'plataforma': platform.platform(),
+                'cpus': os.cpu_count(),
+                'semente': argumentos.semente,
+                'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'resultados': resultados,
+        }
+        with open(argumentos.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(documento, arquivo, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""gerador_corpus.py
+================================
+Gerador determinístico de corpora sintéticos de redações em português, além de
+listas de expressões e regras sintéticas, para os benchmarks.
+
+As redações são montadas a partir das expressões (as do pacote ou sintéticas) e
+de um vocabulário de preenchimento. Com a mesma semente, o resultado é sempre o mesmo.
+
+Funções:
+- gerar_expressoes: lista de expressões com o tamanho desejado
+- gerar_regras: regras aleatórias no formato em linguagem natural
+- gerar_corpus: redações com número controlado de textos, sentenças e expressões
+"""
+import random
+from typing import Any, Dict, List, Optional
+
+from analizador_de_texto.utils import ler_expressoes
+
+VOCABULARIO = [
+    'educação', 'sociedade', 'escola', 'aluno', 'professor', 'cultura', 'realidade', 'governo',
+    'tecnologia', 'população', 'desenvolvimento', 'cidadão', 'direito', 'saúde', 'ambiente',
+    'problema', 'solução', 'políticas', 'públicas', 'brasileira', 'país', 'jovens', 'crianças',
+    'adultos', 'formação', 'ensino', 'aprendizagem', 'conhecimento', 'valores', 'história',
+    'a', 'o', 'os', 'as', 'de', 'do', 'da', 'dos', 'das', 'em', 'no', 'na', 'para', 'com',
+    'que', 'é', 'são', 'foi', 'pode', 'deve', 'muito', 'mais', 'menos', 'também', 'onde',
+    'Pitágoras', 'Aristóteles', 'Platão', 'Paulo', 'Freire', 'importante', 'necessário',
+    'fundamental', 'grave', 'atual', 'social', 'econômico', 'digital', 'moderna',
+]
+
+PALAVRAS_REGRAS = ['onde', 'Pitágoras', 'educação', 'adultos', 'cultura', 'realidade',
+                   'sociedade', 'escola', ',', '-']
+
+OPERADORES = ['maior', 'menor', 'igual', 'maior ou igual', 'menor ou igual']
+
+
+def gerar_expressoes(quantidade: Optional[int] = None, semente: int = 0) -> List[str]:
+    """Gera uma lista de expressões: as do pacote, completadas com expressões sintéticas.
+
+    Args:
+        quantidade (Optional[int]): Tamanho da lista. Padrão: apenas as expressões do pacote.
+        semente (int): Semente do gerador aleatório.
+
+    Returns:
+        List[str]: Lista de expressões (sem repetições).
+    """
+    expressoes = ler_expressoes()
+    if quantidade is None:
+        return expressoes
+    if quantidade <= len(expressoes):
+        return expressoes[:quantidade]
+
+    gerador = random.Random(semente)
+    vistas = set(expressoes)
+    while len(expressoes) < quantidade:
+        expressao = ' '.join(gerador.choice(VOCABULARIO).lower() for _ in range(gerador.randint(2, 5)))
+        if expressao not in vistas:
+            vistas.add(expressao)
+            expressoes.append(expressao)
+    return expressoes
+
+
+def gerar_regras(quantidade: int, semente: int = 0, categorias: int = 50) -> List[str]:
+    """Gera regras aleatórias no formato em linguagem natural.
+
+    Args:
+        quantidade (int): Número de regras.
+        semente (int): Semente do gerador aleatório.
+        categorias (int): Número de categorias distintas.
+
+    Returns:
+        List[str]: Lista de regras.
+    """
+    gerador = random.Random(semente)
+
+    def condicao():
+        operador = gerador.choice(OPERADORES)
+        valor = gerador.randint(0, 120)
+        return gerador.choice([
+            f'número de sentenças é {operador} que {valor % 8}',
+            f'número de tokens é {operador} que {valor}',
+            f'"{gerador.choice(PALAVRAS_REGRAS)}" aparece no texto',
+            f'número de "{gerador.choice(PALAVRAS_REGRAS)}" é {operador} que {valor % 12}',
+            f'número de sentenças com expressão é {operador} que {valor % 4}',
+            'não tem expressões',
+        ])
+
+    regras = []
+    for indice in range(quantidade):
+        condicoes = ' E '.join(condicao() for _ in range(gerador.randint(1, 3)))
+        regras.append(f'Se {condicoes}, então a categoria é C{indice % categorias}.')
+    return regras
+
+
+def gerar_sentenca(gerador: random.Random, expressoes: List[str], proporcao_expressoes: float,
+                   palavras: int) -> str:
+    """Gera uma sentença, iniciada por uma expressão com a probabilidade indicada."""
+    corpo = ' '.join(gerador.choice(VOCABULARIO) for _ in range(palavras))
+    if expressoes and gerador.random() < proporcao_expressoes:
+        corpo = f'{gerador.choice(expressoes)}, {corpo}'
+    # Vírgulas internas ocasionais, como em redações reais
+    if palavras > 8 and gerador.random() < 0.5:
+        partes = corpo.split(' ')
+        partes[len(partes) // 2] += ','
+        corpo = ' '.join(partes)
+    return corpo[0].upper() + corpo[1:] + gerador.choice('...!?')
+
+
+def gerar_corpus(textos: int, sentencas_por_texto: int = 10, proporcao_expressoes: float = 0.3,
+                 expressoes: Optional[List[str]] = None, palavras_por_sentenca: int = 18,
+                 semente: int = 0) -> List[Dict[str, Any]]:
+    """Gera um corpus sintético de redações.
+
+    Args:
+        textos (int): Número de textos.
+        sentencas_por_texto (int): Número médio de sentenças por texto.
+        proporcao_expressoes (float): Proporção de sentenças iniciadas por uma expressão.
+        expressoes (Optional[List[str]]): Expressões usadas. Padrão: as do pacote.
+        palavras_por_sentenca (int): Número médio de palavras por sentença.
+        semente (int): Semente do gerador aleatório.
+
+    Returns:
+        List[Dict[str, Any]]: Lista de dicionários com 'id' e 'texto'.
+    """
+    gerador = random.Random(semente)
+    expressoes = ler_expressoes() if expressoes is None else expressoes
+
+    corpus = []
+    for indice in range(textos):
+        qtd_sentencas = max(1, round(gerador.gauss(sentencas_por_texto, sentencas_por_texto / 4)))
+        sentencas = [
+            gerar_sentenca(gerador, expressoes, proporcao_expressoes,
+                           max(3, round(gerador.gauss(palavras_por_sentenca, palavras_por_sentenca / 3))))
+            for _ in range(qtd_sentencas)
+        ]
+        corpus.append({'id': indice, 'texto': ' '.join(sentencas)})
+    return corpus
\ No newline at end of file
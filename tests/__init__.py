@@ -9,4 +9,25 @@ O pacote de testes contém:
 - test_utils.py: testes para funções utilitárias
 - test_problema1.py: testes para verificação de expressões
 - test_problema2.py: testes para categorização por regras
+- test_trie_expressoes.py: testes para a árvore de prefixos de expressões
+- test_texto_analisado.py: testes para o texto analisado compartilhado
+- test_analise.py: testes para o ponto de entrada combinado
+- test_compilador_regras.py: testes para a compilação das regras
+- test_registro.py: testes para o registro de recursos em memória
+- test_cli.py: testes para a leitura em fluxo e a linha de comando
+- test_paralelo.py: testes para a execução com múltiplos processos
+- test_servico.py: testes para o serviço HTTP
+- test_instrumentacao.py: testes para a instrumentação das etapas e regras
+- test_cache_resultados.py: testes para o cache de resultados por conteúdo
+- test_resultado_colunar.py: testes para o formato colunar dos resultados
+- test_avaliacao_vetorizada.py: testes para a avaliação vetorizada das regras
+- test_recategorizacao.py: testes para a recategorização incremental
+- test_armazem_caracteristicas.py: testes para o armazém persistente de características
+- test_tokenizador.py: testes para o subsistema de tokenização
+- test_artefato_regras.py: testes para o artefato pré-compilado de regras e expressões
+- test_daemon.py: testes para o daemon local (Unix socket) e o seu cliente
+- test_corpus_mapeado.py: testes para o corpus JSONL/JSON mapeado em memória
+- test_estatisticas_expressoes.py: testes para as estatísticas agregadas das expressões
+- test_automato_literais.py: testes para a contagem dos literais em uma única passada
+- test_sessao_incremental.py: testes para a reanálise incremental de um texto editado
 """
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""test_analise.py
+================================
+Testes para o ponto de entrada combinado `analisar`.
+
+Testes implementados:
+- test_analisar_equivale_problemas_separados: compara com encontra_expressoes e aplica_regras
+"""
+from analizador_de_texto import analisar, encontra_expressoes, aplica_regras
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def test_analisar_equivale_problemas_separados():
+    """Testa que a passada única produz as mesmas saídas dos dois problemas."""
+    textos = ler_entrada_json()
+
+    resultado = analisar(textos)
+
+    assert resultado["expressoes"] == encontra_expressoes(textos)
+    assert resultado["categorias"] == aplica_regras(textos)
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""test_armazem_caracteristicas.py
+================================
+Testes para o armazém persistente de características dos textos.
+
+Testes implementados:
+- test_armazem_equivale_aplica_regras: verifica as categorias com o armazém vazio, preenchido e sozinho
+- test_armazem_caracteristicas: verifica as características guardadas para um texto
+- test_armazem_expressoes_alteradas: verifica o recálculo quando as expressões mudam
+"""
+from analizador_de_texto import aplica_regras
+from analizador_de_texto.armazem_caracteristicas import ArmazemCaracteristicas
+from analizador_de_texto.registro import registro
+from analizador_de_texto.utils import ler_entrada_json
+
+TEXTOS = [
+    {"id": 1, "texto": "Por fim, uma frase. Outra frase, com vírgula!"},
+    {"id": "b", "texto": ""},
+    {"id": 3, "texto": "Sem pontuação final"},
+]
+
+
+def test_armazem_equivale_aplica_regras(tmp_path):
+    """Testa que as categorias não mudam com o armazém e que ele persiste entre aberturas."""
+    arquivo = str(tmp_path / "caracteristicas.sqlite")
+    textos = ler_entrada_json() + TEXTOS
+    esperado = aplica_regras(textos)
+
+    with ArmazemCaracteristicas(arquivo) as armazem:
+        assert aplica_regras(textos, armazem=armazem) == esperado
+        assert armazem.estatisticas()['faltas'] == len(textos)
+
+    with ArmazemCaracteristicas(arquivo) as armazem:
+        assert len(armazem) == len(textos)
+        assert aplica_regras(textos, armazem=armazem) == esperado
+        assert list(armazem.textos()) == textos
+        assert aplica_regras(armazem.textos(), armazem=armazem) == esperado
+        assert armazem.estatisticas()['acertos'] == 2 * len(textos)
+
+
+def test_armazem_caracteristicas():
+    """Testa as contagens, a tabela de frequências e as expressões por sentença."""
+    with ArmazemCaracteristicas() as armazem:
+        aplica_regras(TEXTOS, armazem=armazem)
+
+        caracteristicas = armazem.caracteristicas(1)
+
+        assert armazem.caracteristicas("inexistente") is None
+    assert caracteristicas['qtd_sentencas'] == 2
+    assert caracteristicas['qtd_tokens'] == 12
+    assert caracteristicas['qtd_sentencas_com_expressao'] == 1
+    assert caracteristicas['frequencias'][","] == 2
+    assert caracteristicas['frequencias']["frase"] == 2
+    assert caracteristicas['expressoes'] == [registro.expressoes().index("por fim"), -1]
+
+
+def test_armazem_expressoes_alteradas(tmp_path):
+    """Testa que um registro gerado com outras expressões é recalculado."""
+    (tmp_path / "expressoes.txt").write_text("outra frase\n", encoding="utf-8")
+    expressoes = str(tmp_path / "expressoes.txt")
+
+    with ArmazemCaracteristicas() as armazem:
+        aplica_regras(TEXTOS, armazem=armazem)
+        assert aplica_regras(TEXTOS, arquivo_expressoes=expressoes, armazem=armazem) == \
+            aplica_regras(TEXTOS, arquivo_expressoes=expressoes)
+        assert armazem.estatisticas()['faltas'] == 2 * len(TEXTOS)
+        assert armazem.caracteristicas(1)['expressoes'] == [-1, 0]
@@ -0,0 +1,111 @@
+"""test_artefato_regras.py
+================================
+Testes para o artefato pré-compilado de regras e expressões.
+
+Testes implementados:
+- test_artefato_equivale_arquivos: verifica que os recursos do artefato equivalem aos dos arquivos
+- test_artefato_sem_analise_das_regras: verifica que a carga não analisa as regras
+- test_artefato_arquivo_alterado_prevalece: verifica que um arquivo diferente do artefato prevalece
+- test_artefato_invalido: verifica a recusa de arquivos que não são artefatos desta versão
+"""
+import pytest
+
+from analizador_de_texto import artefato_regras
+from analizador_de_texto import registro as modulo_registro
+from analizador_de_texto import utils
+from analizador_de_texto.artefato_regras import carregar_artefato, compilar_artefato, gerar_artefato, ler_artefato
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.registro import RegistroRecursos, registro
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def _categorias(recursos):
+    """Categorias e expressões por sentença dos textos de exemplo com os recursos do registro."""
+    trie_expressoes = recursos.trie_expressoes()
+    avaliar_regras = recursos.avaliador_regras()
+    resultado = []
+    for info_texto in ler_entrada_json():
+        texto_analisado = TextoAnalisado(info_texto["texto"], trie_expressoes, info_texto["id"])
+        resultado.append((sorted(avaliar_regras(texto_analisado)), texto_analisado.expressoes_sentencas))
+    return resultado
+
+
+def test_artefato_equivale_arquivos(tmp_path):
+    """Testa que o artefato reproduz as regras, o avaliador e a árvore construídos dos arquivos."""
+    caminho = str(tmp_path / "regras.bin")
+    assert compilar_artefato(caminho) == len(gerar_artefato())
+
+    artefato = carregar_artefato(caminho)
+    assert artefato.codigo_reutilizado
+    assert artefato.regras == registro.regras()
+    assert artefato.expressoes == registro.expressoes()
+    assert artefato.regras_estruturadas == registro.regras_estruturadas()
+    assert artefato.avaliador_regras.fonte == registro.avaliador_regras().fonte
+
+    recursos = RegistroRecursos()
+    assert recursos.instalar_artefato(artefato) == ["regras_linguagem_natural.txt", "expressoes.txt"]
+    assert recursos.avaliador_regras() is artefato.avaliador_regras
+    assert _categorias(recursos) == _categorias(registro)
+
+
+def test_artefato_sem_analise_das_regras(tmp_path, monkeypatch):
+    """Testa que carregar e usar o artefato não passa pelo parser de regras, nem em outra versão do Python."""
+    dados = gerar_artefato()
+    esperado = _categorias(registro)
+
+    def falhar(*args):
+        raise AssertionError("regra analisada")
+
+    monkeypatch.setattr(ParserRegras, "_estruturar_condicao", falhar)
+    recursos = RegistroRecursos()
+    recursos.instalar_artefato(ler_artefato(dados))
+    assert _categorias(recursos) == esperado
+
+    # Em outra versão do Python o avaliador é recompilado da fonte gerada
+    monkeypatch.setattr(artefato_regras.sys.implementation, "cache_tag", "outra-versao")
+    artefato = ler_artefato(dados)
+    assert not artefato.codigo_reutilizado
+    recursos = RegistroRecursos()
+    recursos.instalar_artefato(artefato)
+    assert _categorias(recursos) == esperado
+
+
+def test_artefato_arquivo_alterado_prevalece(tmp_path, monkeypatch):
+    """Testa que um arquivo editado depois da compilação prevalece e que, sem arquivos, vale o artefato."""
+    caminho = lambda nome_arquivo: str(tmp_path / nome_arquivo)
+    monkeypatch.setattr(utils, "caminho_amostras", caminho)
+    monkeypatch.setattr(modulo_registro, "caminho_amostras", caminho)
+    (tmp_path / "expressoes.txt").write_text("por fim\n", encoding="utf-8")
+    (tmp_path / "regras.txt").write_text('Se "onde" aparece no texto, então a categoria é A.\n', encoding="utf-8")
+
+    recursos = RegistroRecursos()
+    monkeypatch.setattr(artefato_regras, "registro", recursos)
+    dados = gerar_artefato("regras.txt")
+    texto = TextoAnalisado("Onde está?")
+
+    (tmp_path / "regras.txt").write_text('Se "onde" aparece no texto, então a categoria é B.\n', encoding="utf-8")
+    recursos = RegistroRecursos()
+    assert recursos.instalar_artefato(ler_artefato(dados)) == ["expressoes.txt"]
+    assert recursos.avaliador_regras("regras.txt")(texto) == {"B"}
+
+    (tmp_path / "regras.txt").unlink()
+    (tmp_path / "expressoes.txt").unlink()
+    recursos = RegistroRecursos()
+    assert recursos.instalar_artefato(ler_artefato(dados)) == ["regras.txt", "expressoes.txt"]
+    assert recursos.avaliador_regras("regras.txt")(texto) == {"A"}
+    assert recursos.expressoes() == ["por fim"]
+
+
+def test_artefato_invalido():
+    """Testa que dados que não são um artefato desta versão são recusados com ValueError."""
+    dados = gerar_artefato()
+    with pytest.raises(ValueError, match="não é um artefato"):
+        ler_artefato(b"qualquer coisa")
+    with pytest.raises(ValueError, match="truncado"):
+        ler_artefato(dados[:4])
+    with pytest.raises(ValueError, match="Versão"):
+        ler_artefato(artefato_regras._CABECALHO.pack(artefato_regras.ASSINATURA, 99)
+                     + dados[artefato_regras._CABECALHO.size:])
+    with pytest.raises(ValueError, match="corrompido"):
+        ler_artefato(dados[:len(dados) // 2])
@@ -0,0 +1,73 @@
+"""test_automato_literais.py
+================================
+Testes para a contagem de todos os literais das regras em uma única passada.
+
+Testes implementados:
+- test_automato_conta_como_str_count: compara com `str.count` em casos de sobreposição
+- test_automato_equivale_contar_ocorrencias_token: compara com `utils.contar_ocorrencias_token`
+- test_contagens_literais_texto_analisado: verifica a memorização no TextoAnalisado
+- test_compilar_regras_com_automato: compara o avaliador com e sem o autômato
+"""
+import random
+
+from analizador_de_texto.automato_literais import AutomatoLiterais
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.problema2 import ParserRegras, categorizar
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import contar_ocorrencias_token
+
+
+def test_automato_conta_como_str_count():
+    """Testa sobreposições, literais contidos em outros, repetições e o literal vazio."""
+    literais = ["aa", "a", "aaa", "ab", "bab", "b", ",", "", "aa"]
+    automato = AutomatoLiterais(literais)
+
+    assert len(automato) == 8
+    for texto in ["aaaa", "ababab", "babab", "", "a, b, aab,", "xyz"]:
+        assert automato.contar(texto) == {literal: texto.count(literal) for literal in literais}
+
+
+def test_automato_equivale_contar_ocorrencias_token():
+    """Testa textos e literais aleatórios sobre um alfabeto pequeno."""
+    gerador = random.Random(0)
+    for _ in range(200):
+        literais = [''.join(gerador.choices('abc ', k=gerador.randint(1, 4))) for _ in range(8)]
+        texto = ''.join(gerador.choices('abcABC ', k=gerador.randint(0, 40)))
+        contagens = AutomatoLiterais(literais).contar(texto.lower())
+        for literal in literais:
+            assert contagens[literal] == contar_ocorrencias_token(texto, literal)
+
+
+def test_contagens_literais_texto_analisado():
+    """Testa que as contagens do autômato respondem `contem` e `contar_ocorrencias`."""
+    texto = TextoAnalisado("Onde, onde? Aqui, ali.")
+    # Contagem já conhecida prevalece sobre a do autômato
+    assert texto.contar_ocorrencias(",") == 2
+
+    contagens = texto.contagens_literais(AutomatoLiterais(["onde", ",", "lá"]))
+
+    assert contagens["onde"] == 2 and contagens[","] == 2 and contagens["lá"] == 0
+    assert texto.contar_ocorrencias("ONDE") == 2
+    assert not texto.contem("lá")
+
+
+def test_compilar_regras_com_automato():
+    """Testa que o avaliador com autômato produz as mesmas categorias das closures."""
+    regras_texto = [
+        'Se "a" aparece no texto, então a categoria é A.',
+        'Se número de "aa" é igual a 2, então a categoria é B.',
+        'Se número de "," é maior que 1 E "por" aparece no texto, então a categoria é C.',
+        'Se número de "x" é igual a 0 E número de sentenças é maior que 1, então a categoria é D.',
+        'Se não tem expressões, então a categoria é E.',
+    ]
+    parser = ParserRegras()
+    regras = parser.analisar_regras(regras_texto)
+    avaliar = compilar_regras(parser.estruturar_regras(regras_texto), limiar_literais=1)
+    trie_expressoes = TrieExpressoes(["por fim"])
+
+    assert "AutomatoLiterais" in avaliar.fonte
+    assert "texto_lower" not in avaliar.fonte
+    for texto in ["aaaa. Por fim, b, c.", "aa, aa", "", "x, y, z. Por fim.", "Sem nada"]:
+        esperado = categorizar(TextoAnalisado(texto, trie_expressoes), regras)
+        assert sorted(avaliar(TextoAnalisado(texto, trie_expressoes))) == esperado
@@ -0,0 +1,79 @@
+"""test_avaliacao_vetorizada.py
+================================
+Testes para a avaliação vetorizada das regras.
+
+Testes implementados:
+- test_avaliador_vetorizado_colunas: verifica o planejamento das colunas e das comparações
+- test_avaliador_vetorizado_equivale_compilado: compara com o avaliador compilado (requer NumPy)
+- test_aplica_regras_vetorizado: compara com aplica_regras, em lotes (requer NumPy)
+"""
+import pytest
+
+from analizador_de_texto import aplica_regras
+from analizador_de_texto.avaliacao_vetorizada import AvaliadorVetorizado, aplica_regras_vetorizado_iter
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.problema2 import ParserRegras
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import ler_entrada_json
+
+REGRAS = [
+    "Se número de sentenças é maior que 2, então a categoria é X.",
+    "Se \"Palavra\" aparece no texto, então a categoria é Y.",
+    "Se número de \"palavra\" é maior ou igual a 2, então a categoria é Z.",
+    "Se número de sentenças é menor ou igual a 5 E \"outra\" aparece no texto, então a categoria é Z.",
+    "Se número de tokens é maior ou igual a 12 E número de \",\" é igual a 1, então a categoria é W.",
+    "Se número de sentenças com expressão é igual a 1, então a categoria é V.",
+    "Se não tem expressões, então a categoria é U.",
+    "Se número de sentenças é maior que 2 E qualquer coisa, então a categoria é T.",
+]
+
+TEXTOS = [
+    "Esta é uma sentença com a palavra chave. Esta é outra sentença.",
+    "Por fim, uma sentença. Outra. Mais uma! Palavra, palavra.",
+    "",
+    "Sem pontuação final e sem expressões",
+]
+
+
+def test_avaliador_vetorizado_colunas():
+    """Testa que cada característica vira uma única coluna, compartilhada entre as regras."""
+    avaliador = AvaliadorVetorizado(ParserRegras().estruturar_regras(REGRAS))
+
+    assert avaliador.categorias == ["T", "U", "V", "W", "X", "Y", "Z"]
+    assert avaliador.colunas == [
+        ("qtd_sentencas", None),
+        ("contagem", "palavra"),
+        ("presenca", "outra"),
+        ("qtd_tokens", None),
+        ("contagem", ","),
+        ("qtd_sentencas_com_expressao", None),
+    ]
+    # A presença de "Palavra" é respondida pela contagem do mesmo literal
+    assert avaliador.comparacoes[1] == [(1, "maior", 0)]
+    assert avaliador.comparacoes[6] == [(5, "igual", 0)]
+
+
+def test_avaliador_vetorizado_equivale_compilado():
+    """Testa que as máscaras produzem as mesmas categorias do avaliador compilado."""
+    pytest.importorskip("numpy")
+    regras = ParserRegras().estruturar_regras(REGRAS)
+    avaliador = AvaliadorVetorizado(regras)
+    avaliar = compilar_regras(regras)
+    trie_expressoes = TrieExpressoes(["por fim"])
+
+    matriz = avaliador.extrair_caracteristicas(TextoAnalisado(texto, trie_expressoes) for texto in TEXTOS)
+
+    assert matriz.shape == (len(TEXTOS), len(avaliador.colunas))
+    assert avaliador.mascaras(matriz).shape == (len(TEXTOS), len(REGRAS))
+    assert avaliador.categorias_lote(matriz) == [
+        sorted(avaliar(TextoAnalisado(texto, trie_expressoes))) for texto in TEXTOS
+    ]
+
+
+def test_aplica_regras_vetorizado():
+    """Testa que a versão vetorizada reproduz aplica_regras, inclusive com vários lotes."""
+    pytest.importorskip("numpy")
+    textos = ler_entrada_json() + [{"id": i, "texto": texto} for i, texto in enumerate(TEXTOS)]
+
+    assert list(aplica_regras_vetorizado_iter(textos, textos_por_lote=3)) == aplica_regras(textos)
@@ -0,0 +1,83 @@
+"""test_cache_resultados.py
+================================
+Testes para o cache de resultados por conteúdo (CacheResultados).
+
+Testes implementados:
+- test_cache_lru_itens_e_bytes: verifica a remoção por número de itens e por bytes
+- test_cache_aplica_regras: verifica acertos, faltas e a independência do 'id'
+- test_cache_invalida_regras_modificadas: verifica a invalidação quando as regras mudam
+- test_cache_em_disco: verifica que os resultados sobrevivem a um novo cache
+"""
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.cache_resultados import CacheResultados
+from analizador_de_texto.registro import registro
+
+RECURSOS = (("regras.txt", "h1"),)
+
+
+def test_cache_lru_itens_e_bytes():
+    """Testa a remoção dos itens menos usados pelos dois limites."""
+    cache = CacheResultados(max_itens=2)
+    cache.guardar("categorias", RECURSOS, "a", ["A"])
+    cache.guardar("categorias", RECURSOS, "b", ["B"])
+    assert cache.obter("categorias", RECURSOS, "a") == ["A"]
+    cache.guardar("categorias", RECURSOS, "c", ["C"])
+
+    assert cache.obter("categorias", RECURSOS, "b") is None
+    assert cache.obter("categorias", RECURSOS, "a") == ["A"]
+    assert cache.estatisticas()["remocoes"] == 1
+
+    cache = CacheResultados(max_bytes=200)
+    for indice in range(10):
+        cache.guardar("categorias", RECURSOS, str(indice), ["X" * 20])
+    assert 0 < len(cache) < 10
+    assert cache.bytes <= 200
+
+
+def test_cache_aplica_regras():
+    """Testa que textos repetidos reutilizam o resultado, mesmo com outro 'id'."""
+    cache = CacheResultados()
+    textos = [{"id": 1, "texto": "Pitágoras disse. Onde?"}, {"id": 2, "texto": "Pitágoras disse. Onde?"}]
+
+    resultado = aplica_regras(textos, cache=cache)
+
+    assert resultado == aplica_regras(textos)
+    assert [item["id"] for item in resultado] == [1, 2]
+    assert cache.estatisticas()["acertos"] == 1
+    assert cache.estatisticas()["faltas"] == 1
+
+    resultado[0]["categorias"].append("Z")
+    assert aplica_regras(textos[:1], cache=cache) == aplica_regras(textos[:1])
+    assert encontra_expressoes(textos, cache=cache) == encontra_expressoes(textos)
+
+
+def test_cache_invalida_regras_modificadas(tmp_path):
+    """Testa que editar as regras descarta os resultados produzidos com a versão anterior."""
+    arquivo_regras = tmp_path / "regras.txt"
+    arquivo_regras.write_text('Se "onde" aparece no texto, então a categoria é A.\n', encoding="utf-8")
+    cache = CacheResultados()
+    textos = [{"id": 1, "texto": "Onde fica?"}]
+
+    try:
+        assert aplica_regras(textos, str(arquivo_regras), cache=cache)[0]["categorias"] == ["A"]
+        arquivo_regras.write_text('Se "fica" aparece no texto, então a categoria é BB.\n', encoding="utf-8")
+
+        assert aplica_regras(textos, str(arquivo_regras), cache=cache)[0]["categorias"] == ["BB"]
+        assert cache.estatisticas()["remocoes"] == 1
+        assert len(cache) == 1
+    finally:
+        registro.recarregar(str(arquivo_regras))
+
+
+def test_cache_em_disco(tmp_path):
+    """Testa a leitura do SQLite por um novo cache (como após um reinício)."""
+    arquivo = str(tmp_path / "cache.sqlite")
+    textos = [{"id": 1, "texto": "Por fim, um texto."}]
+
+    with CacheResultados(arquivo=arquivo) as cache:
+        esperado = encontra_expressoes(textos, cache=cache)
+
+    with CacheResultados(arquivo=arquivo) as cache:
+        assert encontra_expressoes(textos, cache=cache) == esperado
+        assert cache.estatisticas()["acertos_disco"] == 1
+        assert cache.estatisticas()["faltas"] == 0
\ No newline at end of file
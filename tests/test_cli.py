@@ -0,0 +1,196 @@
+"""test_cli.py
+================================
+Testes para a leitura em fluxo e a interface de linha de comando.
+
+Testes implementados:
+- test_ler_registros_json_lista: verifica a leitura de uma lista JSON em blocos pequenos
+- test_ler_registros_json_jsonl: verifica a leitura de JSONL
+- test_ler_registros_json_invalido: verifica o erro para JSON inválido
+- test_cli_categorias: verifica a saída JSONL do comando categorias
+- test_cli_categorias_armazem: verifica o comando categorias com o armazém de características
+- test_cli_compilar_regras_artefato: verifica a compilação do artefato e o seu uso no comando categorias
+- test_cli_expressoes_entrada_padrao: verifica a leitura da entrada padrão
+- test_cli_estatisticas: verifica os totais do corpus escritos pelo comando estatisticas
+- test_cli_recategorizar: verifica a gravação do estado e a recategorização incremental
+- test_cli_recategorizar_caminhos_relativos: verifica os arquivos de regras relativos ao diretório atual
+- test_cli_arquivo_regras_inexistente: verifica o erro de uso para um arquivo de regras inexistente
+- test_cli_estado_com_cache: verifica a recusa de --estado combinado com --cache ou --armazem
+"""
+import io
+import json
+
+import pytest
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.cli import main
+from analizador_de_texto.utils import ler_entrada_json, ler_regras, ler_registros_json
+
+REGISTROS = [
+    {"id": 1, "texto": "Por fim, uma frase. Outra frase!"},
+    {"id": "dois", "texto": "Texto com \"aspas\", [colchetes] e números 1.5e3."},
+    {"id": 3, "texto": ""},
+]
+
+
+@pytest.mark.parametrize("tamanho_bloco", [1, 3, 64, 65536])
+def test_ler_registros_json_lista(tamanho_bloco):
+    """Testa a leitura de uma lista JSON com blocos de vários tamanhos."""
+    fluxo = io.StringIO(json.dumps(REGISTROS, indent=2))
+
+    assert list(ler_registros_json(fluxo, tamanho_bloco)) == REGISTROS
+
+
+def test_ler_registros_json_jsonl():
+    """Testa a leitura de um registro por linha, ignorando linhas vazias."""
+    fluxo = io.StringIO("\n".join(json.dumps(registro) for registro in REGISTROS) + "\n\n")
+
+    assert list(ler_registros_json(fluxo)) == REGISTROS
+
+
+def test_ler_registros_json_invalido():
+    """Testa que uma lista JSON malformada gera ValueError."""
+    with pytest.raises(ValueError):
+        list(ler_registros_json(io.StringIO('[{"id": 1} {"id": 2}]')))
+
+
+def test_cli_categorias(tmp_path):
+    """Testa que o comando categorias produz a mesma saída de aplica_regras."""
+    entrada = tmp_path / "entrada.json"
+    saida = tmp_path / "saida.jsonl"
+    textos = ler_entrada_json()
+    entrada.write_text(json.dumps(textos), encoding="utf-8")
+
+    assert main(["categorias", str(entrada), "-o", str(saida)]) == 0
+
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(linha) for linha in linhas] == aplica_regras(textos)
+
+
+def test_cli_categorias_armazem(tmp_path):
+    """Testa que o comando categorias com --armazem produz a mesma saída, ao preencher e ao ler."""
+    entrada = tmp_path / "entrada.json"
+    saida = tmp_path / "saida.jsonl"
+    armazem = tmp_path / "caracteristicas.sqlite"
+    textos = ler_entrada_json()
+    entrada.write_text(json.dumps(textos), encoding="utf-8")
+
+    for _ in range(2):
+        assert main(["categorias", str(entrada), "-o", str(saida), "--armazem", str(armazem)]) == 0
+
+        linhas = saida.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(linha) for linha in linhas] == aplica_regras(textos)
+
+
+def test_cli_compilar_regras_artefato(tmp_path):
+    """Testa que o comando categorias com --artefato produz a mesma saída que com os arquivos."""
+    entrada = tmp_path / "entrada.json"
+    saida = tmp_path / "saida.jsonl"
+    artefato = tmp_path / "regras.bin"
+    textos = ler_entrada_json()
+    entrada.write_text(json.dumps(textos), encoding="utf-8")
+
+    assert main(["compilar-regras", "-o", str(artefato)]) == 0
+    assert main(["categorias", str(entrada), "-o", str(saida), "--artefato", str(artefato)]) == 0
+
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(linha) for linha in linhas] == aplica_regras(textos)
+
+    with pytest.raises(SystemExit):
+        main(["categorias", str(entrada), "--artefato", str(entrada)])
+
+
+def test_cli_expressoes_entrada_padrao(monkeypatch, capsys):
+    """Testa o comando expressoes lendo JSONL da entrada padrão."""
+    entrada = "\n".join(json.dumps(registro) for registro in REGISTROS)
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(entrada.encode("utf-8")), encoding="utf-8"))
+
+    assert main(["expressoes"]) == 0
+
+    linhas = capsys.readouterr().out.splitlines()
+    assert [json.loads(linha) for linha in linhas] == encontra_expressoes(REGISTROS)
+
+def test_cli_estatisticas(tmp_path, capsys):
+    """Testa que o comando estatisticas conta as expressões da saída de encontra_expressoes."""
+    entrada = tmp_path / "entrada.jsonl"
+    textos = ler_entrada_json()
+    entrada.write_text("\n".join(json.dumps(texto) for texto in textos), encoding="utf-8")
+
+    assert main(["estatisticas", str(entrada)]) == 0
+
+    totais = json.loads(capsys.readouterr().out)
+    sentencas = [s for resultado in encontra_expressoes(textos) for s in resultado["sentencas"]]
+    assert totais["qtd_textos"] == len(textos)
+    assert totais["qtd_sentencas"] == len(sentencas)
+    assert sum(totais["expressoes"].values()) == sum(1 for s in sentencas if s["expressao"] is not None)
+
+def test_cli_recategorizar(tmp_path, capsys):
+    """Testa categorias --estado seguido de recategorizar com uma regra alterada."""
+    entrada = tmp_path / "entrada.json"
+    estado = tmp_path / "estado.jsonl"
+    novo_estado = tmp_path / "novo_estado.jsonl"
+    antigas = tmp_path / "antigas.txt"
+    novas = tmp_path / "novas.txt"
+    textos = ler_entrada_json()
+    entrada.write_text(json.dumps(textos), encoding="utf-8")
+    regras = ler_regras()
+    antigas.write_text("\n".join(regras), encoding="utf-8")
+    novas.write_text("\n".join(regras[1:] + ["Se número de tokens é maior que 100, então a categoria é A."]),
+                     encoding="utf-8")
+
+    # Resultados esperados calculados antes: os avisos do parser não podem se misturar à saída capturada
+    anteriores = aplica_regras(textos, str(antigas))
+    esperado = aplica_regras(textos, str(novas))
+    capsys.readouterr()
+
+    assert main(["categorias", str(entrada), "--regras", str(antigas), "--estado", str(estado)]) == 0
+    assert [json.loads(linha) for linha in capsys.readouterr().out.splitlines()] == anteriores
+
+    assert main(["recategorizar", str(estado), "--regras-anteriores", str(antigas), "--regras", str(novas),
+                 "--novo-estado", str(novo_estado)]) == 0
+
+    mudancas = [json.loads(linha) for linha in capsys.readouterr().out.splitlines()]
+    assert {mudanca["id"]: mudanca["categorias"] for mudanca in mudancas} == {
+        resultado["id"]: resultado["categorias"] for resultado, anterior in zip(esperado, anteriores)
+        if resultado["categorias"] != anterior["categorias"]
+    }
+    estados = [json.loads(linha) for linha in novo_estado.read_text(encoding="utf-8").splitlines()]
+    assert [{"id": e["id"], "categorias": e["categorias"]} for e in estados] == esperado
+
+
+def test_cli_recategorizar_caminhos_relativos(tmp_path, monkeypatch, capsys):
+    """Testa que --regras-anteriores e --regras relativos são lidos do diretório atual."""
+    monkeypatch.chdir(tmp_path)
+    regras = ler_regras()
+    (tmp_path / "antigas.txt").write_text("\n".join(regras), encoding="utf-8")
+    (tmp_path / "novas.txt").write_text("\n".join(regras[1:]), encoding="utf-8")
+    (tmp_path / "entrada.json").write_text(json.dumps(ler_entrada_json()), encoding="utf-8")
+
+    assert main(["categorias", "entrada.json", "--regras", "antigas.txt", "--estado", "estado.jsonl"]) == 0
+    capsys.readouterr()
+
+    assert main(["recategorizar", "estado.jsonl", "--regras-anteriores", "antigas.txt",
+                 "--regras", "novas.txt"]) == 0
+    assert "ERRO" not in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("comando", ["categorias", "expressoes"])
+def test_cli_arquivo_regras_inexistente(tmp_path, monkeypatch, capsys, comando):
+    """Testa que um arquivo relativo inexistente é procurado no diretório atual e gera um erro de uso."""
+    monkeypatch.chdir(tmp_path)
+    opcao = "--regras" if comando == "categorias" else "--expressoes"
+
+    with pytest.raises(SystemExit):
+        main([comando, opcao, "inexistente.txt"])
+    assert str(tmp_path / "inexistente.txt") in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("opcao", ["--cache", "--armazem"])
+def test_cli_estado_com_cache(tmp_path, capsys, opcao):
+    """Testa que --estado combinado com --cache ou --armazem é recusado em vez de ignorar a opção."""
+    entrada = tmp_path / "entrada.json"
+    entrada.write_text(json.dumps(ler_entrada_json()), encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        main(["categorias", str(entrada), "--estado", str(tmp_path / "estado.jsonl"),
+              opcao, str(tmp_path / "dados.sqlite")])
+    assert "--estado" in capsys.readouterr().err
@@ -0,0 +1,129 @@
+"""test_compilador_regras.py
+================================
+Testes para a compilação das regras em uma função avaliadora.
+
+Testes implementados:
+- test_compilar_regras_resolve_operadores: verifica o código gerado
+- test_compilar_regras_equivale_closures: compara com as closures do ParserRegras
+- test_compilar_regras_composta_sem_condicoes: verifica regra composta sem condições reconhecidas
+- test_literais_necessarios: verifica os literais exigidos por cada regra
+- test_indice_regras_candidatas: verifica a poda das regras pelo literal obrigatório
+- test_compilar_regras_agrupa_por_literal: compara com as closures em regras com vários literais
+- test_compilar_regras_texto_com_quebra_de_linha: verifica que o texto da regra não vira código
+"""
+import random
+
+from analizador_de_texto.compilador_regras import compilar_regras
+from analizador_de_texto.problema2 import ParserRegras, categorizar
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+
+REGRAS = [
+    "Se número de sentenças é maior que 2, então a categoria é X.",
+    "Se \"palavra\" aparece no texto, então a categoria é Y.",
+    "Se número de sentenças é menor ou igual a 5 E \"outra\" aparece no texto, então a categoria é Z.",
+    "Se número de tokens é maior ou igual a 12 E número de \",\" é igual a 1, então a categoria é W.",
+    "Se número de sentenças com expressão é igual a 1, então a categoria é V.",
+    "Se não tem expressões, então a categoria é U.",
+]
+
+TEXTOS = [
+    "Esta é uma sentença com a palavra chave. Esta é outra sentença.",
+    "Por fim, uma sentença. Outra. Mais uma!",
+    "",
+    "Sem pontuação final e sem expressões",
+]
+
+
+def test_compilar_regras_resolve_operadores():
+    """Testa que os operadores são resolvidos e as condições encadeadas com and."""
+    avaliar = compilar_regras(ParserRegras().estruturar_regras(REGRAS))
+
+    assert "t.qtd_sentencas > 2" in avaliar.fonte
+    assert "t.qtd_sentencas <= 5" in avaliar.fonte
+    assert " and " in avaliar.fonte
+    assert "_comparar" not in avaliar.fonte
+
+
+def test_compilar_regras_equivale_closures():
+    """Testa que a função compilada produz as mesmas categorias das closures."""
+    parser = ParserRegras()
+    regras = parser.analisar_regras(REGRAS)
+    avaliar = compilar_regras(parser.estruturar_regras(REGRAS))
+    trie_expressoes = TrieExpressoes(["por fim"])
+
+    for texto in TEXTOS:
+        esperado = categorizar(TextoAnalisado(texto, trie_expressoes), regras)
+        assert sorted(avaliar(TextoAnalisado(texto, trie_expressoes))) == esperado
+
+
+def test_compilar_regras_composta_sem_condicoes():
+    """Testa que uma regra composta sem condições reconhecidas é sempre atendida."""
+    regras = ["Se algo estranho E outra coisa, então a categoria é Q."]
+
+    avaliar = compilar_regras(ParserRegras().estruturar_regras(regras))
+
+    assert avaliar(TextoAnalisado("Qualquer texto.")) == {"Q"}
+
+
+def test_literais_necessarios():
+    """Testa a extração dos literais que precisam ocorrer no texto."""
+    parser = ParserRegras()
+    regras = parser.estruturar_regras([
+        'Se "Onde" aparece no texto E número de tokens é maior que 90, então a categoria é B.',
+        'Se número de "," é menor que 10, então a categoria é C.',
+        'Se número de "," é maior que 0 E número de "x" é igual a 0, então a categoria é D.',
+        'Se número de "abc" é maior ou igual a 2 E "abc" aparece no texto, então a categoria é E.',
+    ])
+
+    assert [parser.literais_necessarios(regra) for regra in regras] == [["onde"], [], [","], ["abc"]]
+
+
+def test_indice_regras_candidatas():
+    """Testa que apenas as regras cujos literais ocorrem no texto são candidatas."""
+    parser = ParserRegras()
+    indice = parser.indexar_regras(parser.estruturar_regras(REGRAS))
+
+    assert indice.por_literal == {"palavra": [1], "outra": [2], ",": [3]}
+    assert indice.candidatas("sem nada") == [0, 4, 5]
+    assert indice.candidatas("outra palavra") == [0, 1, 2, 4, 5]
+
+
+def test_compilar_regras_agrupa_por_literal():
+    """Testa a equivalência com as closures em regras aleatórias com literais obrigatórios."""
+    gerador = random.Random(0)
+    palavras = ["onde", "Pitágoras", "sentença", ",", "a", "outra"]
+    operadores = ["maior", "menor", "igual", "maior ou igual", "menor ou igual"]
+    condicoes = [
+        lambda: f'"{gerador.choice(palavras)}" aparece no texto',
+        lambda: f'número de "{gerador.choice(palavras)}" é {gerador.choice(operadores)} que {gerador.randint(0, 3)}',
+        lambda: f'número de sentenças é {gerador.choice(operadores)} que {gerador.randint(0, 3)}',
+    ]
+    regras_texto = [
+        "Se " + " E ".join(gerador.choice(condicoes)() for _ in range(gerador.randint(1, 3)))
+        + f", então a categoria é C{indice % 7}."
+        for indice in range(200)
+    ]
+    parser = ParserRegras()
+    regras = parser.analisar_regras(regras_texto)
+    avaliar = compilar_regras(parser.estruturar_regras(regras_texto))
+    trie_expressoes = TrieExpressoes(["por fim"])
+
+    for texto in TEXTOS + ["Onde está Pitágoras? Em outra sentença, a resposta."]:
+        esperado = categorizar(TextoAnalisado(texto, trie_expressoes), regras)
+        assert sorted(avaliar(TextoAnalisado(texto, trie_expressoes))) == esperado
+
+
+def test_compilar_regras_texto_com_quebra_de_linha():
+    """Testa que quebras de linha no texto de uma regra ficam no comentário do código gerado."""
+    regras = [
+        'Se "palavra" aparece no texto, então a categoria é A\nraise RuntimeError("injetado")',
+        'Se "outra" aparece no texto, então a categoria é B\r    raise RuntimeError("injetado")',
+    ]
+    regras_estruturadas = ParserRegras().estruturar_regras(regras)
+    assert len(regras_estruturadas) == 2
+
+    avaliar = compilar_regras(regras_estruturadas)
+
+    assert avaliar(TextoAnalisado("Uma palavra e outra.")) == {"A", "B"}
+    assert avaliar(TextoAnalisado("Nada.")) == set()
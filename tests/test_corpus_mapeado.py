@@ -0,0 +1,114 @@
+"""test_corpus_mapeado.py
+================================
+Testes para o corpus mapeado em memória (CorpusMapeado).
+
+Testes implementados:
+- test_corpus_mapeado_equivale_a_leitura_em_fluxo: compara com ler_registros_json (JSONL e lista JSON)
+- test_corpus_mapeado_por_id: verifica o acesso direto por id
+- test_corpus_mapeado_fatias_serializaveis: verifica as fatias e a serialização sem os textos
+- test_corpus_mapeado_lista_malformada: verifica o erro para uma lista JSON sem fechamento
+- test_corpus_mapeado_fechar_compartilhado: verifica o fechamento com outros corpora sobre o mesmo arquivo
+- test_executor_processos_com_corpus_mapeado: compara a execução paralela com a sequencial
+"""
+import io
+import json
+import os
+import pickle
+
+import pytest
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.corpus_mapeado import CorpusMapeado, _mapeamentos
+from analizador_de_texto.paralelo import ExecutorProcessos
+from analizador_de_texto.utils import ler_entrada_json, ler_registros_json
+
+REGISTROS = [
+    {"id": i, "texto": f'Texto {i} com "aspas", {{chaves}} [colchetes], ç e \\ barra. Por fim, outra frase!'}
+    for i in range(12)
+]
+
+
+def _gravar(tmp_path, nome, conteudo):
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding='utf-8')
+    return str(caminho)
+
+
+def test_corpus_mapeado_equivale_a_leitura_em_fluxo(tmp_path):
+    """Testa que os registros e a ordem são os mesmos de ler_registros_json."""
+    jsonl = '\n'.join(json.dumps(r, ensure_ascii=False) for r in REGISTROS[:6]) + '\n\n' + \
+        '\n'.join(json.dumps(r) for r in REGISTROS[6:]) + '\n'
+    lista = json.dumps(REGISTROS, ensure_ascii=False, indent=2)
+
+    for nome, conteudo in (('corpus.jsonl', jsonl), ('corpus.json', lista)):
+        with CorpusMapeado(_gravar(tmp_path, nome, conteudo)) as corpus:
+            assert list(corpus) == list(ler_registros_json(io.StringIO(conteudo))) == REGISTROS
+            assert len(corpus) == len(REGISTROS)
+            assert corpus[3] == REGISTROS[3]
+            assert list(corpus.registros(4, 6)) == REGISTROS[4:6]
+
+    with CorpusMapeado(_gravar(tmp_path, 'vazio.json', ' [ ]\n')) as corpus:
+        assert list(corpus) == []
+
+
+def test_corpus_mapeado_por_id(tmp_path):
+    """Testa o acesso por id numérico e texto, e o erro para um id inexistente."""
+    registros = [{"id": "a", "texto": "Um."}, {"texto": "Dois.", "id": 7}, {"id": "a", "texto": "Repetido."}]
+    with CorpusMapeado(_gravar(tmp_path, 'corpus.json', json.dumps(registros))) as corpus:
+        assert corpus.por_id(7) == registros[1]
+        assert corpus.por_id("a") == registros[0]
+        assert corpus.posicao_id(7) == 1
+        with pytest.raises(KeyError):
+            corpus.por_id(8)
+
+
+def test_corpus_mapeado_fatias_serializaveis(tmp_path):
+    """Testa que as fatias cobrem o corpus e são serializadas sem os textos."""
+    with CorpusMapeado(_gravar(tmp_path, 'corpus.json', json.dumps(REGISTROS))) as corpus:
+        fatias = list(corpus.fatias(bytes_por_fatia=250, max_registros=3))
+
+        assert [registro for fatia in fatias for registro in fatia] == REGISTROS
+        assert all(len(fatia) <= 3 for fatia in fatias)
+        serializada = pickle.dumps(fatias[1])
+        assert b'aspas' not in serializada
+        assert list(pickle.loads(serializada)) == list(fatias[1])
+
+
+def test_corpus_mapeado_lista_malformada(tmp_path):
+    """Testa que uma lista JSON sem fechamento gera ValueError."""
+    with pytest.raises(ValueError, match="Formato JSON inválido"):
+        CorpusMapeado(_gravar(tmp_path, 'corpus.json', json.dumps(REGISTROS)[:-1]))
+
+
+def test_corpus_mapeado_fechar_compartilhado(tmp_path):
+    """Testa que fechar um corpus não fecha o mapeamento ainda usado por outro sobre o mesmo arquivo."""
+    caminho = _gravar(tmp_path, 'corpus.jsonl', '\n'.join(json.dumps(registro) for registro in REGISTROS))
+    primeiro = CorpusMapeado(caminho)
+    segundo = CorpusMapeado(caminho)
+    fatia = segundo.fatia(0, 2)
+
+    primeiro.fechar()
+    assert segundo[0] == REGISTROS[0]
+    segundo.fechar()
+    assert list(fatia) == REGISTROS[:2]
+
+    # Arquivo substituído por uma nova versão: o mapeamento anterior sai do registro
+    os.replace(_gravar(tmp_path, 'novo.jsonl', json.dumps(REGISTROS[0]) + '\n'), caminho)
+    with CorpusMapeado(caminho) as alterado:
+        assert list(alterado) == REGISTROS[:1]
+        assert len([chave for chave in _mapeamentos if chave[0] == caminho]) == 1
+    assert list(fatia) == REGISTROS[:2]
+    fatia.fechar()
+    assert not [chave for chave in _mapeamentos if chave[0] == caminho]
+
+
+def test_executor_processos_com_corpus_mapeado(tmp_path):
+    """Testa que os workers decodificam as fatias com o mesmo resultado da execução sequencial."""
+    amostras = ler_entrada_json()
+    textos = [{"id": i, "texto": amostras[i % 2]["texto"][: 50 + i * 7]} for i in range(40)]
+    caminho = _gravar(tmp_path, 'corpus.jsonl', ''.join(json.dumps(t) + '\n' for t in textos))
+
+    with CorpusMapeado(caminho) as corpus, \
+            ExecutorProcessos(workers=2, caracteres_por_lote=500) as executor:
+        assert executor.aplica_regras(corpus) == aplica_regras(textos)
+        assert executor.encontra_expressoes(corpus) == encontra_expressoes(textos)
@@ -0,0 +1,141 @@
+"""test_daemon.py
+================================
+Testes de ponta a ponta para o daemon local (DaemonClassificacao) com o ClienteDaemon.
+
+Testes implementados:
+- test_daemon_responde_como_funcoes_locais: compara as respostas com as funções locais
+- test_daemon_clientes_concorrentes: verifica o atendimento de clientes simultâneos
+- test_daemon_recarrega_regras_alteradas: verifica que edições nas regras são percebidas
+- test_daemon_erros: verifica as respostas de erro, a permissão do socket e a recusa de um segundo daemon
+- test_cliente_daemon_main: verifica a saída do cliente, com e sem o daemon em execução
+"""
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.cliente_daemon import ClienteDaemon, main
+from analizador_de_texto.daemon import DaemonClassificacao
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def _executar(daemon):
+    """Inicia o daemon em uma thread com o seu próprio laço de eventos e devolve a função de parada."""
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(daemon.iniciar())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def parar():
+        asyncio.run_coroutine_threadsafe(daemon.encerrar(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+    return parar
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Daemon com o socket em um diretório temporário."""
+    daemon = DaemonClassificacao(str(tmp_path / "daemon.sock"))
+    parar = _executar(daemon)
+    yield daemon
+    parar()
+
+
+def test_daemon_responde_como_funcoes_locais(daemon):
+    """Testa que o daemon produz as mesmas saídas das funções locais."""
+    textos = ler_entrada_json()
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        assert cliente.aplica_regras(textos) == aplica_regras(textos)
+        assert cliente.encontra_expressoes(textos) == encontra_expressoes(textos)
+        # Entrada lida pelo daemon, como nos blocos __main__
+        assert cliente.requisitar("categorias", entrada="entrada.json") == aplica_regras(textos)
+        assert cliente.saude()["requisicoes_atendidas"] == 3
+
+
+def test_daemon_clientes_concorrentes(daemon):
+    """Testa que clientes simultâneos recebem cada um a sua resposta."""
+    textos = [{"id": i, "texto": f"Por fim, texto {i}. Outra frase, onde." * (i % 5)} for i in range(32)]
+
+    def requisitar(texto):
+        with ClienteDaemon(daemon.caminho_socket) as cliente:
+            return cliente.aplica_regras([texto])[0]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resultados = list(executor.map(requisitar, textos))
+
+    assert resultados == aplica_regras(textos)
+
+
+def test_daemon_recarrega_regras_alteradas(tmp_path):
+    """Testa que uma edição no arquivo de regras vale na requisição seguinte, sem reiniciar o daemon."""
+    regras = tmp_path / "regras.txt"
+    regras.write_text('Se "onde" aparece no texto, então a categoria é A.\n', encoding="utf-8")
+    daemon = DaemonClassificacao(str(tmp_path / "daemon.sock"), arquivo_regras=str(regras))
+    parar = _executar(daemon)
+    textos = [{"id": 1, "texto": "Onde está?"}]
+
+    try:
+        with ClienteDaemon(daemon.caminho_socket) as cliente:
+            assert cliente.aplica_regras(textos) == [{"id": 1, "categorias": ["A"]}]
+
+            estado = os.stat(regras)
+            regras.write_text('Se "onde" aparece no texto, então a categoria é B.\n', encoding="utf-8")
+            os.utime(regras, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+            assert cliente.aplica_regras(textos) == [{"id": 1, "categorias": ["B"]}]
+
+            cliente.recarregar()
+            assert cliente.aplica_regras(textos) == [{"id": 1, "categorias": ["B"]}]
+    finally:
+        parar()
+
+
+def test_daemon_erros(daemon, monkeypatch):
+    """Testa as respostas para requisições inválidas e a recusa de um segundo daemon no mesmo socket."""
+    assert os.stat(daemon.caminho_socket).st_mode & 0o777 == 0o600
+
+    with ClienteDaemon(daemon.caminho_socket) as cliente:
+        with pytest.raises(RuntimeError, match="Comando inválido"):
+            cliente.requisitar("inexistente")
+        with pytest.raises(RuntimeError, match="não encontrado"):
+            cliente.requisitar("categorias", entrada="/inexistente.json")
+        with pytest.raises(RuntimeError, match="'textos'"):
+            cliente.requisitar("categorias", textos=[{"id": 1}])
+        # Uma exceção inesperada no processamento também é respondida
+        with monkeypatch.context() as patch:
+            patch.setattr(daemon, "processar", lambda requisicao: 1 / 0)
+            with pytest.raises(RuntimeError, match="division by zero"):
+                cliente.requisitar("saude")
+        # A conexão continua utilizável depois dos erros
+        assert cliente.saude()["status"] == "ok"
+
+    with pytest.raises(RuntimeError, match="Já existe"):
+        asyncio.run(DaemonClassificacao(daemon.caminho_socket).iniciar())
+
+
+def test_cliente_daemon_main(daemon, tmp_path, capsys):
+    """Testa que o cliente imprime o mesmo que os blocos __main__, com o daemon e sem ele."""
+    textos = ler_entrada_json()
+    esperado = f"{aplica_regras(textos)}\n"
+    entrada = tmp_path / "entrada.json"
+    entrada.write_text(json.dumps(textos), encoding="utf-8")
+    capsys.readouterr()
+
+    assert main(["categorias", str(entrada), "--socket", daemon.caminho_socket]) == 0
+    assert capsys.readouterr().out == esperado
+
+    assert main(["expressoes", "--socket", daemon.caminho_socket]) == 0
+    assert capsys.readouterr().out == f"{encontra_expressoes(textos)}\n"
+
+    # Sem daemon: processado no próprio processo
+    assert main(["categorias", str(entrada), "--socket", str(tmp_path / "sem_daemon.sock")]) == 0
+    assert capsys.readouterr().out.endswith(esperado)
+
+    assert main(["desconhecido"]) == 2
@@ -0,0 +1,95 @@
+"""test_estatisticas_expressoes.py
+================================
+Testes para as estatísticas agregadas das expressões (EstatisticasExpressoes).
+
+Testes implementados:
+- test_estatisticas_equivalem_a_encontra_expressoes: compara as contagens com a saída por sentença
+- test_estatisticas_mesclar_partes: verifica que a mescla de partes equivale ao corpus inteiro
+- test_estatisticas_estado_json: verifica a conversão de/para JSON
+- test_estatisticas_tabelas_diferentes: verifica o erro ao mesclar tabelas de expressões diferentes
+- test_executor_processos_estatisticas: compara a versão paralela com a sequencial
+"""
+from collections import Counter
+import json
+
+import pytest
+
+from analizador_de_texto import encontra_expressoes
+from analizador_de_texto.estatisticas_expressoes import EstatisticasExpressoes, estatisticas_expressoes
+from analizador_de_texto.paralelo import ExecutorProcessos
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def _textos(quantidade=30):
+    amostras = ler_entrada_json()
+    return [{"id": i, "texto": amostras[i % 2]["texto"][: 40 + i * 11]} for i in range(quantidade)] + \
+        [{"id": "vazio", "texto": ""}]
+
+
+def _contagem(sentencas):
+    return dict(Counter(s["expressao"] for s in sentencas if s["expressao"] is not None))
+
+
+def test_estatisticas_equivalem_a_encontra_expressoes():
+    """Testa os contadores do corpus e de cada texto contra a saída de encontra_expressoes."""
+    textos = _textos()
+    resultados = encontra_expressoes(textos)
+    sentencas = [s for resultado in resultados for s in resultado["sentencas"]]
+
+    estatisticas = estatisticas_expressoes(iter(textos))
+
+    assert len(estatisticas) == len(textos)
+    assert estatisticas.qtd_sentencas == len(sentencas)
+    assert estatisticas.contagem_expressoes() == _contagem(sentencas)
+    assert estatisticas.qtd_sentencas_com_expressao == sum(_contagem(sentencas).values())
+    assert estatisticas.proporcao_com_expressao == estatisticas.qtd_sentencas_com_expressao / len(sentencas)
+    assert [
+        (t["id"], t["qtd_sentencas"], t["expressoes"]) for t in estatisticas.iter_textos()
+    ] == [(r["id"], len(r["sentencas"]), _contagem(r["sentencas"])) for r in resultados]
+    assert list(estatisticas.resumo()["expressoes"].values()) == \
+        sorted(_contagem(sentencas).values(), reverse=True)
+
+
+@pytest.mark.parametrize("por_texto", [True, False])
+def test_estatisticas_mesclar_partes(por_texto):
+    """Testa que mesclar as estatísticas de fatias do corpus equivale a processá-lo inteiro."""
+    textos = _textos()
+    inteiro = estatisticas_expressoes(textos, por_texto=por_texto)
+
+    mescladas = estatisticas_expressoes(textos[:10], por_texto=por_texto)
+    for inicio in (10, 25):
+        mescladas.mesclar(estatisticas_expressoes(textos[inicio:inicio + 15], por_texto=por_texto))
+
+    assert mescladas.estado() == inteiro.estado()
+    if not por_texto:
+        with pytest.raises(ValueError):
+            mescladas.texto(0)
+
+
+def test_estatisticas_estado_json():
+    """Testa que as estatísticas sobrevivem a uma ida e volta por JSON."""
+    estatisticas = estatisticas_expressoes(_textos())
+
+    copia = EstatisticasExpressoes.de_estado(json.loads(json.dumps(estatisticas.estado())))
+
+    assert copia.estado() == estatisticas.estado()
+    assert copia.texto(5) == estatisticas.texto(5)
+
+
+def test_estatisticas_tabelas_diferentes():
+    """Testa que estatísticas com tabelas de expressões diferentes não podem ser mescladas."""
+    estatisticas = estatisticas_expressoes(_textos(3))
+
+    with pytest.raises(ValueError, match="tabelas de expressões"):
+        estatisticas.mesclar(EstatisticasExpressoes(["outra expressão"]))
+
+
+def test_executor_processos_estatisticas():
+    """Testa que as estatísticas paralelas (mescladas por lote) são iguais às sequenciais."""
+    textos = _textos(60)
+
+    with ExecutorProcessos(workers=2, caracteres_por_lote=300) as executor:
+        assert executor.estatisticas_expressoes(textos).estado() == estatisticas_expressoes(textos).estado()
+        assert executor.estatisticas_expressoes(textos, por_texto=False).resumo() == \
+            estatisticas_expressoes(textos, por_texto=False).resumo()
+        assert executor.estatisticas_expressoes([]).qtd_textos == 0
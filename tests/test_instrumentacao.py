@@ -0,0 +1,62 @@
+"""test_instrumentacao.py
+================================
+Testes para a instrumentação das etapas e das regras.
+
+Testes implementados:
+- test_instrumentacao_preserva_resultados: verifica que as saídas não mudam com a instrumentação ativa
+- test_instrumentacao_regras: verifica as contagens por regra e os eventos dos ganchos
+- test_instrumentacao_desativada: verifica que nada é registrado fora do bloco `with`
+"""
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.instrumentacao import Instrumentacao, instrumentacao_ativa, instrumentar
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def test_instrumentacao_preserva_resultados():
+    """Testa que os resultados instrumentados são iguais aos do caminho normal."""
+    textos = ler_entrada_json()
+    categorias = aplica_regras(textos)
+    expressoes = encontra_expressoes(textos)
+
+    with instrumentar() as instrumentacao:
+        assert aplica_regras(textos) == categorias
+        assert encontra_expressoes(textos) == expressoes
+
+    resumo = instrumentacao.resumo()
+    assert resumo["etapas"]["separar_sentencas"]["chamadas"] == 2 * len(textos)
+    assert resumo["etapas"]["avaliar_regras"]["chamadas"] == len(textos)
+    assert "Regras mais caras:" in instrumentacao.relatorio()
+
+
+def test_instrumentacao_regras():
+    """Testa as contagens por regra, a taxa de disparo e os ganchos."""
+    textos = [
+        {"id": 1, "texto": "Pitágoras escreveu onde."},
+        {"id": 2, "texto": "Sem nomes aqui."},
+    ]
+    eventos = []
+
+    with instrumentar(Instrumentacao([lambda *evento: eventos.append(evento)])) as instrumentacao:
+        aplica_regras(textos)
+
+    regras = {estatisticas["regra"]: estatisticas for estatisticas in instrumentacao.resumo()["regras"]}
+    pitagoras = regras['Se "Pitágoras" aparece no texto, então a categoria é A']
+    assert pitagoras["avaliacoes"] == 2
+    assert pitagoras["disparos"] == 1
+    assert pitagoras["taxa_disparo"] == 0.5
+
+    eventos_regras = [evento for evento in eventos if evento[0] == "regra"]
+    assert len(eventos_regras) == 2 * len(regras)
+    assert all(isinstance(evento[2], int) for evento in eventos)
+    assert "Regras que nunca dispararam" in instrumentacao.relatorio()
+
+
+def test_instrumentacao_desativada():
+    """Testa que a instrumentação é restaurada ao sair do bloco."""
+    instrumentacao = Instrumentacao()
+    with instrumentar(instrumentacao):
+        assert instrumentacao_ativa() is instrumentacao
+    assert instrumentacao_ativa() is None
+
+    aplica_regras(ler_entrada_json())
+    assert instrumentacao.resumo() == {"etapas": {}, "regras": []}
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""test_paralelo.py
+================================
+Testes para a execução em paralelo com processos (ExecutorProcessos) e threads (ExecutorThreads).
+
+Testes implementados:
+- test_dividir_em_lotes: verifica a divisão dos registros pelo tamanho dos textos
+- test_executor_processos_preserva_ordem: compara com a execução sequencial
+- test_executor_threads_preserva_ordem: compara o pool de threads com a execução sequencial
+- test_automato_literais_entre_threads: verifica o autômato compartilhado por várias threads
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.automato_literais import AutomatoLiterais
+from analizador_de_texto.estatisticas_expressoes import estatisticas_expressoes
+from analizador_de_texto.paralelo import ExecutorProcessos, ExecutorThreads, dividir_em_lotes
+from analizador_de_texto.utils import ler_entrada_json
+
+
+def test_dividir_em_lotes():
+    """Testa que os lotes respeitam o limite de caracteres e que textos longos ficam sozinhos."""
+    registros = [{"id": i, "texto": "x" * tamanho} for i, tamanho in enumerate([4, 4, 4, 20, 1, 1])]
+
+    lotes = list(dividir_em_lotes(registros, caracteres_por_lote=10, max_textos_por_lote=5))
+
+    assert [[r["id"] for r in lote] for lote in lotes] == [[0, 1], [2], [3], [4, 5]]
+
+
+def test_executor_processos_preserva_ordem():
+    """Testa que os resultados paralelos são iguais aos sequenciais e na mesma ordem."""
+    amostras = ler_entrada_json()
+    textos = [{"id": i, "texto": amostras[i % 2]["texto"][: 50 + i * 7]} for i in range(60)]
+
+    with ExecutorProcessos(workers=2, caracteres_por_lote=500) as executor:
+        assert executor.aplica_regras(textos) == aplica_regras(textos)
+        assert executor.encontra_expressoes(iter(textos)) == encontra_expressoes(textos)
+
+
+def test_executor_threads_preserva_ordem():
+    """Testa que os resultados do pool de threads são iguais aos sequenciais e na mesma ordem."""
+    amostras = ler_entrada_json()
+    textos = [{"id": i, "texto": amostras[i % 2]["texto"][: 50 + i * 7]} for i in range(60)]
+
+    with ExecutorThreads(workers=4, caracteres_por_lote=500) as executor:
+        assert executor.aplica_regras(textos) == aplica_regras(textos)
+        assert executor.encontra_expressoes(iter(textos)) == encontra_expressoes(textos)
+        assert executor.estatisticas_expressoes(textos).estado() == estatisticas_expressoes(textos).estado()
+
+
+def test_automato_literais_entre_threads():
+    """Testa que o autômato construído e completado por várias threads conta como str.count."""
+    literais = ["a", "aa", "ab", "ba", "b,", ","]
+    textos = ["abab, aa, ba" * (i + 1) for i in range(40)]
+    automato = AutomatoLiterais(literais)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        contagens = list(pool.map(automato.contar, textos))
+
+    assert contagens == [{literal: texto.count(literal) for literal in literais} for texto in textos]
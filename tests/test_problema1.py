@@ -11,13 +11,16 @@ Testes implementados:
 - test_encontra_expressoes_multiplos_textos: testa com vários textos
 - test_encontra_expressoes_caso_real: testa com os exemplos do desafio
 - test_encontra_expressoes_vazio: testa com texto vazio
+- test_encontra_expressoes_iter: testa a versão em fluxo (gerador)
 """
 import pytest
 from analizador_de_texto import encontra_expressoes
+from analizador_de_texto.problema1 import encontra_expressoes_iter
+from analizador_de_texto.registro import registro
 
 
 # Mock da função ler_expressoes para usar expressões de teste
-def mock_ler_expressoes():
+def mock_ler_expressoes(arquivo=None):
     return [
         "a partir do exposto",
         "baseado no que foi dito",
@@ -30,7 +33,11 @@ def mock_ler_expressoes():
 # Patch das funções que acessam arquivos
 @pytest.fixture(autouse=True)
 def patch_utils(monkeypatch):
-    monkeypatch.setattr("analizador_de_texto.problema1.ler_expressoes", mock_ler_expressoes)
+    monkeypatch.setattr("analizador_de_texto.registro.ler_expressoes", mock_ler_expressoes)
+    # Descarta os recursos em cache antes e depois de cada teste
+    registro.recarregar()
+    yield
+    registro.recarregar()
 
 
 def test_encontra_expressoes_basico():
@@ -150,3 +157,17 @@ def test_encontra_expressoes_vazio():
     assert resultado[0]["id"] == 5
     assert len(resultado[0]["sentencas"]) == 0
     assert resultado[0]["sentencas"] == []
+
+
+
+def test_encontra_expressoes_iter():
+    """Testa que a versão em fluxo produz os mesmos resultados da versão em lista."""
+    textos = [
+        {"id": 1, "texto": "Texto simples. Por fim, uma conclusão."},
+        {"id": 2, "texto": "Como consequência, o resultado é positivo."}
+    ]
+
+    resultados = encontra_expressoes_iter(iter(textos))
+
+    assert next(resultados) == encontra_expressoes(textos[:1])[0]
+    assert list(resultados) == encontra_expressoes(textos[1:])
\ No newline at end of file
@@ -22,10 +22,12 @@ Testes implementados:
 - test_aplica_regras_sem_categoria: testa quando nenhuma regra é atendida
 - test_aplica_regras_multiplos_textos: testa com vários textos
 - test_aplica_regras_caso_real: testa com os exemplos do desafio
+- test_aplica_regras_iter: testa a versão em fluxo (gerador)
 """
 import pytest
 from analizador_de_texto import aplica_regras
-from analizador_de_texto.problema2 import ParserRegras
+from analizador_de_texto.problema2 import ParserRegras, aplica_regras_iter
+from analizador_de_texto.registro import registro
 
 
 # Mock das funções que acessam arquivos
@@ -51,21 +53,12 @@ def patch_utils(monkeypatch):
             "perante os argumentos citados"
         ]
 
-    monkeypatch.setattr("analizador_de_texto.problema2.ler_regras", mock_ler_regras)
-    monkeypatch.setattr("analizador_de_texto.problema2.ler_expressoes", mock_ler_expressoes)
-    monkeypatch.setattr("analizador_de_texto.problema2.separar_sentencas",
-                        lambda texto: texto.split('. ') if texto else [])
-
-    # Mock simplificado para verificar_expressao_inicio
-    def mock_verificar_expressao_inicio(sentenca, expressoes):
-        sentenca_lower = sentenca.lower()
-        for expr in expressoes:
-            if expr.lower() in sentenca_lower and sentenca_lower.find(expr.lower()) < 20:
-                return expr
-        return None
-
-    monkeypatch.setattr("analizador_de_texto.problema2.verificar_expressao_inicio",
-                        mock_verificar_expressao_inicio)
+    monkeypatch.setattr("analizador_de_texto.registro.ler_regras", mock_ler_regras)
+    monkeypatch.setattr("analizador_de_texto.registro.ler_expressoes", mock_ler_expressoes)
+    # Descarta os recursos em cache antes e depois de cada teste
+    registro.recarregar()
+    yield
+    registro.recarregar()
 
 
 def test_aplica_regras_multiplos_textos():
@@ -147,4 +140,16 @@ def test_parser_regras():
     assert not regras_processadas[0]["condicao"](dados_texto)
 
     # A segunda regra deve ser atendida ("palavra" aparece no texto)
-    assert regras_processadas[1]["condicao"](dados_texto)
\ No newline at end of file
+    assert regras_processadas[1]["condicao"](dados_texto)
+
+
+def test_aplica_regras_iter():
+    """Testa que a versão em fluxo produz os mesmos resultados da versão em lista."""
+    textos = [
+        {"id": 3, "texto": "Primeira frase. Segunda frase. Pitágoras foi um filósofo importante."},
+        {"id": 4, "texto": "Esta é uma frase, sem expressões, bastante, simples, com, poucas, vírgulas."}
+    ]
+
+    resultados = aplica_regras_iter(texto for texto in textos)
+
+    assert list(resultados) == aplica_regras(textos)
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""test_recategorizacao.py
+================================
+Testes para a recategorização incremental quando as regras mudam.
+
+Testes implementados:
+- test_diferenca_regras: verifica as regras adicionadas, removidas e as categorias afetadas
+- test_recategorizar_equivale_aplica_regras: compara com a categorização completa pelas regras novas
+- test_recategorizar_literal_novo: verifica o uso do texto original para literais não contados
+- test_recategorizar_texto_alterado: verifica a reanálise de um texto modificado
+"""
+import json
+
+import pytest
+
+from analizador_de_texto import aplica_regras
+from analizador_de_texto.parser_regras import ParserRegras
+from analizador_de_texto.recategorizacao import diferenca_regras, gerar_estado_iter, recategorizar_iter
+from analizador_de_texto.utils import ler_entrada_json, ler_regras
+
+REGRAS_ANTIGAS = [
+    "Se número de sentenças é maior que 2, então a categoria é X.",
+    "Se \"palavra\" aparece no texto, então a categoria é Y.",
+    "Se número de \",\" é maior ou igual a 2, então a categoria é Y.",
+    "Se número de tokens é maior que 10 E não tem expressões, então a categoria é Z.",
+]
+
+REGRAS_NOVAS = [
+    # Reordenada e com outra preposição: não é uma mudança
+    "Se não tem expressões E número de tokens é maior que 10, então a categoria é Z.",
+    "Se número de sentenças é maior a 3, então a categoria é X.",
+    "Se \"Palavra\" aparece no texto, então a categoria é Y.",
+    "Se número de sentenças com expressão é maior que 0, então a categoria é W.",
+]
+
+TEXTOS = [
+    {"id": 1, "texto": "Uma palavra. Duas, três, quatro. Cinco."},
+    {"id": 2, "texto": "Por fim, uma sentença. Outra. Mais uma! E outra."},
+    {"id": 3, "texto": "Texto curto, sem ponto final, só vírgulas"},
+]
+
+
+def _escrever_regras(caminho, regras):
+    caminho.write_text("\n".join(regras), encoding="utf-8")
+    return str(caminho)
+
+
+def test_diferenca_regras():
+    """Testa que só as regras realmente alteradas aparecem na diferença."""
+    parser = ParserRegras()
+
+    diferenca = diferenca_regras(parser.estruturar_regras(REGRAS_ANTIGAS), parser.estruturar_regras(REGRAS_NOVAS))
+
+    assert [regra['regra'] for regra in diferenca.adicionadas] == [REGRAS_NOVAS[1], REGRAS_NOVAS[3]]
+    assert [regra['regra'] for regra in diferenca.removidas] == [REGRAS_ANTIGAS[0], REGRAS_ANTIGAS[2]]
+    assert diferenca.categorias_afetadas == {"X", "Y", "W"}
+
+
+def test_recategorizar_equivale_aplica_regras(tmp_path):
+    """Testa que o estado recategorizado coincide com aplica_regras pelas regras novas."""
+    antigas = _escrever_regras(tmp_path / "antigas.txt", REGRAS_ANTIGAS)
+    novas = _escrever_regras(tmp_path / "novas.txt", REGRAS_NOVAS)
+    textos = ler_entrada_json() + TEXTOS
+
+    estados = list(gerar_estado_iter(textos, antigas))
+    assert [{'id': e['id'], 'categorias': e['categorias']} for e in estados] == aplica_regras(textos, antigas)
+    # O estado é serializável e pode ser relido de um arquivo
+    estados = json.loads(json.dumps(estados))
+
+    mudancas = list(recategorizar_iter(estados, REGRAS_ANTIGAS, REGRAS_NOVAS))
+
+    esperado = aplica_regras(textos, novas)
+    assert [{'id': e['id'], 'categorias': e['categorias']} for e in estados] == esperado
+    anteriores = aplica_regras(textos, antigas)
+    assert mudancas == [
+        {'id': novo['id'], 'categorias': novo['categorias'], 'anteriores': antigo['categorias']}
+        for novo, antigo in zip(esperado, anteriores) if novo['categorias'] != antigo['categorias']
+    ]
+    # Sem mudanças nas regras, nada é emitido
+    assert list(recategorizar_iter(estados, REGRAS_NOVAS, REGRAS_NOVAS)) == []
+
+
+def test_recategorizar_literal_novo():
+    """Testa que um literal não contado exige o texto original, e passa a ser guardado."""
+    regras_novas = ler_regras() + ["Se \"uma\" aparece no texto, então a categoria é V."]
+    estados = list(gerar_estado_iter(TEXTOS[:1]))
+
+    with pytest.raises(ValueError):
+        list(recategorizar_iter(estados, ler_regras(), regras_novas))
+
+    textos = {info_texto["id"]: info_texto["texto"] for info_texto in TEXTOS}
+    mudancas = list(recategorizar_iter(estados, ler_regras(), regras_novas, textos))
+
+    assert mudancas[0]['id'] == 1 and "V" in mudancas[0]['categorias']
+    assert estados[0]['contagens']['uma'] == 1
+
+
+def test_recategorizar_texto_alterado(tmp_path):
+    """Testa que um texto com conteúdo diferente do registrado é reanalisado por completo."""
+    antigas = _escrever_regras(tmp_path / "antigas.txt", REGRAS_ANTIGAS)
+    estados = list(gerar_estado_iter(TEXTOS[:1], antigas))
+    alterado = {"id": 1, "texto": "Agora, com a palavra e mais vírgulas, muitas."}
+
+    mudancas = list(recategorizar_iter(estados, REGRAS_ANTIGAS, REGRAS_ANTIGAS, {1: alterado["texto"]}))
+
+    assert mudancas == [{'id': 1, 'categorias': aplica_regras([alterado], antigas)[0]['categorias'],
+                         'anteriores': aplica_regras(TEXTOS[:1], antigas)[0]['categorias']}]
+    assert estados[0]['qtd_sentencas'] == 1
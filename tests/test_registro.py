@@ -0,0 +1,78 @@
+"""test_registro.py
+================================
+Testes para o registro de recursos em memória (RegistroRecursos).
+
+Testes implementados:
+- test_registro_reutiliza_recursos: verifica que os arquivos são lidos uma única vez
+- test_registro_recarrega_arquivo_modificado: verifica a invalidação por data de modificação
+- test_registro_mantem_recursos_sem_mudanca_de_conteudo: verifica a invalidação por hash
+- test_registro_recarregar: verifica o descarte explícito dos recursos
+"""
+import os
+
+import pytest
+
+from analizador_de_texto import registro as modulo_registro
+from analizador_de_texto import utils
+from analizador_de_texto.registro import RegistroRecursos
+from analizador_de_texto.texto_analisado import TextoAnalisado
+
+
+@pytest.fixture
+def dados(tmp_path, monkeypatch):
+    """Redireciona os arquivos de recursos para um diretório temporário."""
+    caminho = lambda nome_arquivo: str(tmp_path / nome_arquivo)
+    monkeypatch.setattr(utils, "caminho_amostras", caminho)
+    monkeypatch.setattr(modulo_registro, "caminho_amostras", caminho)
+    (tmp_path / "expressoes.txt").write_text("por fim\n", encoding="utf-8")
+    (tmp_path / "regras.txt").write_text('Se "onde" aparece no texto, então a categoria é A.\n', encoding="utf-8")
+    return tmp_path
+
+
+def escrever(caminho, conteudo):
+    """Reescreve o arquivo garantindo uma nova data de modificação."""
+    estado = os.stat(caminho)
+    caminho.write_text(conteudo, encoding="utf-8")
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+
+
+def test_registro_reutiliza_recursos(dados):
+    """Testa que a árvore e o avaliador são construídos uma única vez."""
+    registro = RegistroRecursos()
+
+    assert registro.trie_expressoes() is registro.trie_expressoes()
+    assert registro.avaliador_regras("regras.txt") is registro.avaliador_regras("regras.txt")
+    assert registro.expressoes() == ["por fim"]
+
+
+def test_registro_recarrega_arquivo_modificado(dados):
+    """Testa que uma edição no arquivo de regras é percebida sem reiniciar o processo."""
+    registro = RegistroRecursos()
+    texto = TextoAnalisado("Onde está?")
+    assert registro.avaliador_regras("regras.txt")(texto) == {"A"}
+
+    escrever(dados / "regras.txt", 'Se "onde" aparece no texto, então a categoria é B.\n')
+
+    assert registro.avaliador_regras("regras.txt")(texto) == {"B"}
+
+
+def test_registro_mantem_recursos_sem_mudanca_de_conteudo(dados):
+    """Testa que um arquivo apenas tocado (mesmo conteúdo) não reconstrói os recursos."""
+    registro = RegistroRecursos()
+    avaliador = registro.avaliador_regras("regras.txt")
+
+    escrever(dados / "regras.txt", 'Se "onde" aparece no texto, então a categoria é A.\n')
+
+    assert registro.avaliador_regras("regras.txt") is avaliador
+
+
+def test_registro_recarregar(dados):
+    """Testa que recarregar descarta os recursos e precarregar os reconstrói."""
+    registro = RegistroRecursos()
+    trie = registro.trie_expressoes()
+
+    registro.recarregar()
+    registro.precarregar(arquivo_regras="regras.txt")
+
+    assert registro.trie_expressoes() is not trie
+    assert registro.trie_expressoes().buscar("Por fim, acabou.") == "por fim"
\ No newline at end of file
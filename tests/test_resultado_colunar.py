@@ -0,0 +1,60 @@
+"""test_resultado_colunar.py
+================================
+Testes para o formato colunar dos resultados de encontra_expressoes.
+
+Testes implementados:
+- test_colunar_equivale_encontra_expressoes: verifica a conversão sem perdas para o formato JSON
+- test_colunar_colunas: verifica as colunas e as agregações
+- test_colunar_numpy: verifica as colunas NumPy (se o NumPy estiver instalado)
+"""
+import pytest
+
+from analizador_de_texto import encontra_expressoes
+from analizador_de_texto.resultado_colunar import SEM_EXPRESSAO, encontra_expressoes_colunar
+from analizador_de_texto.utils import ler_entrada_json
+
+TEXTOS = [
+    {"id": 1, "texto": "Por fim, algo.   Outra frase!  Em suma, acabou?"},
+    {"id": "b", "texto": ""},
+    {"id": 3, "texto": "Sem pontuação final"},
+    {"id": 4, "texto": "Por fim, de novo."},
+]
+
+
+def test_colunar_equivale_encontra_expressoes():
+    """Testa que para_json reproduz a saída de encontra_expressoes."""
+    textos = ler_entrada_json() + TEXTOS
+
+    resultado = encontra_expressoes_colunar(textos)
+
+    assert len(resultado) == len(textos)
+    assert resultado.para_json() == encontra_expressoes(textos)
+
+
+def test_colunar_colunas():
+    """Testa o conteúdo das colunas e a contagem de expressões."""
+    resultado = encontra_expressoes_colunar(TEXTOS)
+
+    assert resultado.ids == [1, "b", 3, 4]
+    assert list(resultado.inicio_sentencas) == [0, 3, 3, 3, 4]
+    assert (resultado.sentenca_inicio[1], resultado.sentenca_fim[1]) == (17, 29)
+    assert resultado.expressao[1] == SEM_EXPRESSAO
+    assert list(resultado.texto_das_sentencas()) == [0, 0, 0, 3]
+    assert resultado.contagem_expressoes() == {"por fim": 2}
+
+
+def test_colunar_numpy():
+    """Testa as colunas NumPy, que compartilham a memória dos arrays."""
+    numpy = pytest.importorskip("numpy")
+    resultado = encontra_expressoes_colunar(TEXTOS)
+
+    colunas = resultado.colunas_numpy()
+
+    assert isinstance(colunas["expressao"], numpy.ndarray)
+    assert colunas["inicio_sentencas"].tolist() == [0, 3, 3, 3, 4]
+    assert int((colunas["expressao"] != SEM_EXPRESSAO).sum()) == 2
+
+    vazias = encontra_expressoes_colunar([]).colunas_numpy()
+    assert vazias["inicio_sentencas"].tolist() == [0]
+    assert all(vazias[nome].size == 0 and vazias[nome].dtype == numpy.int64
+               for nome in ("sentenca_inicio", "sentenca_fim", "expressao"))
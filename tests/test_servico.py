@@ -0,0 +1,73 @@
+"""test_servico.py
+================================
+Testes de ponta a ponta para o serviço HTTP (ServicoClassificacao) com o ClienteServico.
+
+Testes implementados:
+- test_servico_responde_como_funcoes_locais: compara as respostas com as funções locais
+- test_servico_agrupa_requisicoes_concorrentes: verifica a formação de micro-lotes
+- test_servico_erros: verifica as respostas de erro
+"""
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+
+import pytest
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.servico import ClienteServico, ServicoClassificacao
+from analizador_de_texto.utils import ler_entrada_json
+
+
+@pytest.fixture
+def servico():
+    """Executa o serviço em uma thread com o seu próprio laço de eventos."""
+    loop = asyncio.new_event_loop()
+    servico = ServicoClassificacao(porta=0, max_lote=16, max_espera=0.05)
+    loop.run_until_complete(servico.iniciar())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield servico
+
+    asyncio.run_coroutine_threadsafe(servico.encerrar(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def test_servico_responde_como_funcoes_locais(servico):
+    """Testa que o serviço produz as mesmas saídas das funções locais."""
+    textos = ler_entrada_json()
+
+    with ClienteServico(servico.host, servico.porta) as cliente:
+        assert cliente.aplica_regras(textos) == aplica_regras(textos)
+        assert cliente.encontra_expressoes(textos) == encontra_expressoes(textos)
+        # A conexão persistente continua utilizável
+        assert cliente.saude()["status"] == "ok"
+
+
+def test_servico_agrupa_requisicoes_concorrentes(servico):
+    """Testa que requisições concorrentes são processadas em menos lotes que requisições."""
+    textos = [{"id": i, "texto": f"Por fim, texto {i}. Outra frase."} for i in range(32)]
+
+    def requisitar(texto):
+        with ClienteServico(servico.host, servico.porta) as cliente:
+            return cliente.aplica_regras([texto])[0]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        resultados = list(executor.map(requisitar, textos))
+
+    assert resultados == aplica_regras(textos)
+    with ClienteServico(servico.host, servico.porta) as cliente:
+        saude = cliente.saude()
+    assert saude["registros_processados"] == 32
+    assert saude["lotes_processados"] < 32
+
+
+def test_servico_erros(servico):
+    """Testa as respostas para rota inexistente e corpo inválido."""
+    with ClienteServico(servico.host, servico.porta) as cliente:
+        with pytest.raises(RuntimeError, match="404"):
+            cliente._requisitar("POST", "/inexistente", [])
+        with pytest.raises(RuntimeError, match="400"):
+            cliente._requisitar("POST", "/categorias", [{"id": 1}])
\ No newline at end of file
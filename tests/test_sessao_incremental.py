@@ -0,0 +1,69 @@
+"""test_sessao_incremental.py
+================================
+Testes para a reanálise incremental de um texto editado (SessaoTexto).
+
+Testes implementados:
+- test_dividir_em_trechos: verifica os trechos terminados por pontuação
+- test_sessao_reprocessa_apenas_trechos_alterados: verifica o número de trechos reprocessados
+- test_sessao_equivale_recalculo_completo: compara edições aleatórias com o recálculo completo
+"""
+import random
+
+from analizador_de_texto import aplica_regras, encontra_expressoes
+from analizador_de_texto.sessao_incremental import SessaoTexto, dividir_em_trechos
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.utils import ler_entrada_json, ler_expressoes
+
+
+def test_dividir_em_trechos():
+    """Testa que os trechos terminam em pontuação e reconstroem o texto."""
+    assert dividir_em_trechos("Uma. Duas!! Três? fim") == ["Uma.", " Duas!", "!", " Três?", " fim"]
+    assert dividir_em_trechos("") == []
+    assert dividir_em_trechos("sem pontuação") == ["sem pontuação"]
+
+
+def test_sessao_reprocessa_apenas_trechos_alterados():
+    """Testa que uma sentença editada reprocessa um único trecho e atualiza os agregados."""
+    sessao = SessaoTexto(id_texto=1)
+    texto = "Primeira sentença. Por fim, a segunda. A terceira!"
+
+    sessao.atualizar(texto)
+    assert sessao.trechos_reprocessados == 3
+
+    editado = texto.replace("a segunda", "a segunda editada, com mais tokens")
+    resultado = sessao.atualizar(editado)
+
+    esperado = TextoAnalisado(editado, sessao.texto_analisado().trie_expressoes)
+    assert sessao.trechos_reprocessados == 1
+    assert sessao.qtd_tokens == esperado.qtd_tokens
+    assert sessao.qtd_sentencas_com_expressao == esperado.qtd_sentencas_com_expressao
+    assert resultado == aplica_regras([{"id": 1, "texto": editado}])[0]
+
+
+def test_sessao_equivale_recalculo_completo():
+    """Testa inserções, remoções e edições aleatórias contra o recálculo completo."""
+    gerador = random.Random(0)
+    expressoes = ler_expressoes()[:20]
+    texto = ler_entrada_json()[0]["texto"]
+    sessao = SessaoTexto(id_texto=1)
+
+    for _ in range(150):
+        trechos = dividir_em_trechos(texto)
+        posicao = gerador.randrange(len(trechos) + 1)
+        operacao = gerador.random()
+        if operacao < 0.3:
+            trechos.insert(posicao, f" {gerador.choice(expressoes).capitalize()}, algo{gerador.choice('.?!')}")
+        elif operacao < 0.5 and trechos:
+            trechos.pop(min(posicao, len(trechos) - 1))
+        elif trechos:
+            indice = min(posicao, len(trechos) - 1)
+            corte = gerador.randrange(len(trechos[indice]) + 1)
+            trechos[indice] = (trechos[indice][:corte] + gerador.choice(["x", "  ", ".", "!!", "Logo, ", " Σ"])
+                               + trechos[indice][corte:])
+        texto = "".join(trechos)
+
+        informacoes = [{"id": 1, "texto": texto}]
+        assert sessao.atualizar(texto) == aplica_regras(informacoes)[0]
+        sentencas = encontra_expressoes(informacoes)[0]["sentencas"]
+        assert sessao.sentencas == [sentenca["sentenca"] for sentenca in sentencas]
+        assert sessao.expressoes_sentencas == [sentenca["expressao"] for sentenca in sentencas]
@@ -0,0 +1,74 @@
+"""test_texto_analisado.py
+================================
+Testes para a classe TextoAnalisado.
+
+Testes implementados:
+- test_texto_analisado_caracteristicas: verifica as características calculadas
+- test_texto_analisado_memoriza: verifica que cada característica é calculada uma única vez
+- test_texto_analisado_spans: verifica o cálculo pelas posições das sentenças
+- test_texto_analisado_de_dados: verifica a conversão a partir do dicionário dados_texto
+"""
+from analizador_de_texto import texto_analisado as modulo
+from analizador_de_texto.texto_analisado import TextoAnalisado
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+
+
+def test_texto_analisado_caracteristicas():
+    """Testa as características calculadas para um texto simples."""
+    texto = TextoAnalisado("Por fim, uma frase. Outra frase, sem nada!", TrieExpressoes(["por fim"]), 7)
+
+    assert texto.id == 7
+    assert texto.sentencas == ["Por fim, uma frase.", "Outra frase, sem nada!"]
+    assert texto.qtd_sentencas == 2
+    assert texto.qtd_tokens == 12
+    assert texto.tokens_por_sentenca == [6, 6]
+    assert texto.expressoes_sentencas == ["por fim", None]
+    assert texto.qtd_sentencas_com_expressao == 1
+    assert texto.contem("FRASE")
+    assert not texto.contem("onde")
+    assert texto.contar_ocorrencias(",") == 2
+
+
+def test_texto_analisado_memoriza(monkeypatch):
+    """Testa que a tokenização do texto é feita uma única vez."""
+    chamadas = []
+
+    def tokenize_contando(texto):
+        chamadas.append(texto)
+        return texto.split()
+
+    monkeypatch.setattr(modulo, "tokenize", tokenize_contando)
+    texto = TextoAnalisado("uma frase curta.")
+
+    assert len(texto.tokens) == 3
+    assert len(texto.tokens) == 3
+    # Com os tokens já calculados, a contagem os reutiliza
+    assert texto.qtd_tokens == 3
+    assert len(chamadas) == 1
+
+
+def test_texto_analisado_spans():
+    """Testa que contagens e expressões são calculadas sem copiar as sentenças."""
+    texto = TextoAnalisado("  Por fim, uma frase.  Outra, curta!  resto", TrieExpressoes(["por fim"]))
+
+    assert texto.qtd_sentencas == 2
+    assert texto.qtd_tokens == 11
+    assert texto.tokens_por_sentenca == [6, 4]
+    assert texto.expressoes_sentencas == ["por fim", None]
+    assert "sentencas" not in texto.__dict__
+    assert texto.sentencas == ["Por fim, uma frase.", "Outra, curta!"]
+
+
+def test_texto_analisado_de_dados():
+    """Testa a criação a partir do dicionário usado anteriormente pelas regras."""
+    dados_texto = {
+        "texto": "Uma. Duas.",
+        "sentencas": ["Uma.", "Duas."],
+        "expressoes_sentencas": [None, "x"]
+    }
+
+    texto = TextoAnalisado.de_dados(dados_texto)
+
+    assert texto.qtd_sentencas == 2
+    assert texto.qtd_sentencas_com_expressao == 1
+    assert TextoAnalisado.de_dados(texto) is texto
\ No newline at end of file
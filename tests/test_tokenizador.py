@@ -0,0 +1,68 @@
+"""test_tokenizador.py
+================================
+Testes para o subsistema de tokenização.
+
+Testes implementados:
+- test_tokenizar_equivale_tokenize_anterior: verifica os tokens em textos aleatórios e Unicode
+- test_contar_tokens: verifica a contagem sem criar os tokens, no texto e em trechos
+- test_iterar_tokens_limitado: verifica o iterador preguiçoso limitado a N tokens
+- test_lotes: verifica a tokenização e a contagem em lote
+"""
+import random
+import re
+
+from analizador_de_texto import tokenizador
+
+TEXTOS = [
+    "",
+    "   ",
+    "Por fim, uma frase.",
+    "Àquela hora — disse ele — não havia ninguém!!",
+    "Números: 3,14 e 2.718; e-mail: a_b@c.d",
+    "日本語のテキスト、とても長い。 Ελληνικά κείμενο.",
+    "tab\tnova\nlinha espaço largo",
+]
+
+
+def _tokenize_anterior(texto):
+    """Tokenização original de `utils.tokenize`."""
+    return [token for token in re.findall(r'(\w+|\S)', texto) if token]
+
+
+def _textos_aleatorios(quantidade=200):
+    gerador = random.Random(17)
+    alfabeto = "abcçãé XYZ019_.,;!?-'\"\t\n  日本ñ"
+    return [''.join(gerador.choice(alfabeto) for _ in range(gerador.randrange(60))) for _ in range(quantidade)]
+
+
+def test_tokenizar_equivale_tokenize_anterior():
+    """Testa que os tokens são os mesmos da tokenização original."""
+    for texto in TEXTOS + _textos_aleatorios():
+        assert tokenizador.tokenizar(texto) == _tokenize_anterior(texto)
+        assert list(tokenizador.iterar_tokens(texto)) == _tokenize_anterior(texto)
+
+
+def test_contar_tokens():
+    """Testa a contagem no texto inteiro e em trechos."""
+    for texto in TEXTOS + _textos_aleatorios():
+        assert tokenizador.contar_tokens(texto) == len(_tokenize_anterior(texto))
+        meio = len(texto) // 2
+        assert tokenizador.contar_tokens(texto, 0, meio) == len(_tokenize_anterior(texto[:meio]))
+        assert tokenizador.contar_tokens(texto, meio) == len(_tokenize_anterior(texto[meio:]))
+        assert tokenizador.tokenizar(texto, 1, meio) == _tokenize_anterior(texto[1:meio])
+
+
+def test_iterar_tokens_limitado():
+    """Testa que o iterador para após o limite e respeita o trecho."""
+    texto = "Uma frase, com vírgula. Outra frase!"
+    assert list(tokenizador.iterar_tokens(texto, 3)) == ["Uma", "frase", ","]
+    assert list(tokenizador.iterar_tokens(texto, 0)) == []
+    assert list(tokenizador.iterar_tokens(texto, 100)) == _tokenize_anterior(texto)
+    assert list(tokenizador.iterar_tokens(texto, 2, 24)) == ["Outra", "frase"]
+
+
+def test_lotes():
+    """Testa a tokenização e a contagem de vários textos em uma chamada."""
+    textos = TEXTOS + _textos_aleatorios(20)
+    assert tokenizador.tokenizar_lote(textos) == [_tokenize_anterior(texto) for texto in textos]
+    assert tokenizador.contar_tokens_lote(iter(textos)) == [len(_tokenize_anterior(texto)) for texto in textos]
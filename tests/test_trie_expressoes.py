@@ -0,0 +1,115 @@
+"""test_trie_expressoes.py
+================================
+Testes para a árvore de prefixos de expressões (TrieExpressoes).
+
+Este módulo verifica que a busca pela árvore produz os mesmos resultados que a
+varredura linear de `verificar_expressao_inicio`.
+
+Testes implementados:
+- test_trie_encontra_expressao_inicio: verifica expressões nos primeiros tokens
+- test_trie_respeita_max_tokens_inicio: verifica o limite de tokens iniciais
+- test_trie_prioriza_ordem_da_lista: verifica a prioridade entre expressões
+- test_trie_equivalente_verificar_expressao_inicio: compara com a implementação original
+- test_trie_buscar_indices_spans: compara a busca pelas posições das sentenças com a busca por strings
+- test_trie_cache_prefixos: compara a busca com e sem o cache de prefixos e verifica os contadores
+"""
+import random
+
+from analizador_de_texto.trie_expressoes import TrieExpressoes
+from analizador_de_texto.utils import (ler_expressoes, separar_sentencas, separar_sentencas_spans,
+                                       verificar_expressao_inicio)
+
+
+def test_trie_encontra_expressao_inicio():
+    """Testa a identificação de expressões nos primeiros tokens da sentença."""
+    trie = TrieExpressoes(["baseado no que foi dito", "por fim"])
+
+    assert trie.buscar("Logo, baseado no que foi dito, vale citar.") == "baseado no que foi dito"
+    assert trie.buscar("Por fim, uma conclusão.") == "por fim"
+    assert trie.buscar("Uma frase comum.") is None
+    assert trie.buscar("") is None
+
+
+def test_trie_respeita_max_tokens_inicio():
+    """Testa que expressões além dos tokens iniciais não são consideradas."""
+    trie = TrieExpressoes(["por fim"], max_tokens_inicio=2)
+
+    assert trie.buscar("Então, por fim, acabou.") is None
+    assert trie.buscar("Então por fim acabou.") == "por fim"
+
+
+def test_trie_prioriza_ordem_da_lista():
+    """Testa que, com mais de uma expressão possível, vale a primeira da lista."""
+    expressoes = ["por outro lado", "por"]
+    assert TrieExpressoes(expressoes).buscar("Por outro lado, não.") == "por outro lado"
+    assert TrieExpressoes(expressoes[::-1]).buscar("Por outro lado, não.") == "por"
+
+
+def test_trie_equivalente_verificar_expressao_inicio():
+    """Testa a equivalência com a implementação linear em sentenças aleatórias."""
+    expressoes = ler_expressoes() + ["é válido analisar , ainda", "Logo"]
+    trie = TrieExpressoes(expressoes)
+    vocabulario = [
+        "logo", ",", "por", "fim", "outro", "lado", "é", "válido", "analisar", "ainda",
+        "no", "entanto", "nesse", "sentido", "texto", "a", "partir", "do", "exposto", "Em",
+    ]
+    gerador = random.Random(42)
+
+    for _ in range(2000):
+        tokens = [gerador.choice(vocabulario) for _ in range(gerador.randint(0, 10))]
+        separadores = [gerador.choice([" ", "", "  "]) for _ in tokens]
+        sentenca = "".join(t + s for t, s in zip(tokens, separadores)) + "."
+        assert trie.buscar(sentenca) == verificar_expressao_inicio(sentenca, expressoes)
+
+
+def test_trie_buscar_indices_spans():
+    """Testa a busca por posições, inclusive com minúsculas que mudam o tamanho do texto ou o sigma."""
+    expressoes = ["por fim", "σας", "ος", "i̇stanbul"]
+    trie = TrieExpressoes(expressoes)
+    palavras = ["Por", "fim", ",", "ΟΣ", "ΣΑΣ", "σας", "İstanbul", " ", ".", "!", "\n", "A.Σ"]
+    gerador = random.Random(0)
+
+    for _ in range(2000):
+        texto = " ".join(gerador.choice(palavras) for _ in range(gerador.randint(0, 10)))
+        indices = trie.buscar_indices_spans(texto, separar_sentencas_spans(texto))
+        assert [None if indice is None else expressoes[indice] for indice in indices] == \
+            [trie.buscar(sentenca) for sentenca in separar_sentencas(texto)]
+
+
+def test_trie_cache_prefixos():
+    """Testa que o cache de prefixos (inclusive pequeno, com remoções) não altera o resultado."""
+    expressoes = ler_expressoes() + ["a", "por outro lado , ainda", "Logo"]
+    palavras = ["Logo", "LOGO", ",", "por", "Por", "outro", "lado", "ainda", "a", "partir", "do", "exposto",
+                "texto", "İstanbul"]
+    gerador = random.Random(7)
+    sentencas = []
+    for _ in range(1000):
+        tokens = [gerador.choice(palavras) for _ in range(gerador.randint(0, 9))]
+        sentencas.append("".join(t + gerador.choice([" ", "", "  "]) for t in tokens) + ".")
+
+    for max_tokens_inicio in (0, 1, 3):
+        sem_cache = TrieExpressoes(expressoes, max_tokens_inicio, max_prefixos=0)
+        com_cache = TrieExpressoes(expressoes, max_tokens_inicio, max_prefixos=50)
+        for sentenca in sentencas + sentencas:
+            assert com_cache.buscar(sentenca) == sem_cache.buscar(sentenca)
+
+    assert sem_cache.cache_prefixos is None
+    estatisticas = com_cache.cache_prefixos.estatisticas()
+    assert estatisticas["itens"] == 50 and estatisticas["remocoes"] > 0
+    # Uma consulta por sentença, inclusive com prefixos abertos
+    assert estatisticas["acertos"] + estatisticas["faltas"] == 2 * len(sentencas)
+    assert 0 < estatisticas["taxa_acerto"] < 1
+
+    # Aberturas repetidas: a segunda passada só tem acertos
+    trie = TrieExpressoes(expressoes, max_prefixos=10)
+    for sentenca in ["Logo, o texto.", "Por outro lado, ainda assim."]:
+        trie.buscar(sentenca)
+    faltas = trie.cache_prefixos.faltas
+    acertos = trie.cache_prefixos.acertos
+    assert trie.buscar("Logo, o texto.") == "Logo"
+    # Mesma abertura com outras maiúsculas e outro espaçamento: mesma entrada
+    assert trie.buscar("LOGO ,  o texto.") == "Logo"
+    # Prefixo aberto ("por outro lado" pode continuar): um único acerto
+    assert trie.buscar("Por outro lado, ainda assim.") == "por outro lado"
+    assert trie.cache_prefixos.faltas == faltas
+    assert trie.cache_prefixos.acertos == acertos + 3
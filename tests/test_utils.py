@@ -7,9 +7,11 @@ utils.py.
 
 Testes implementados:
 - test_caminho_amostras: verifica se a função retorna o caminho correto
+- test_caminho_amostras_absoluto: verifica que caminhos absolutos são mantidos
+- test_separar_sentencas_spans: verifica as posições das sentenças no texto
 """
 import os
-from analizador_de_texto.utils import caminho_amostras
+from analizador_de_texto.utils import caminho_amostras, separar_sentencas, separar_sentencas_spans
 
 def test_caminho_amostras():
     """Testa se caminho_amostras usa corretamente os recursos do pacote."""
@@ -23,4 +25,16 @@ def test_caminho_amostras():
     assert os.path.exists(caminho)
 
     # Verifica se o caminho termina com o nome do arquivo
-    assert caminho.endswith("expressoes.txt")
\ No newline at end of file
+    assert caminho.endswith("expressoes.txt")
+
+def test_caminho_amostras_absoluto(tmp_path):
+    """Testa se caminhos absolutos são devolvidos sem alteração."""
+    caminho = str(tmp_path / "regras.txt")
+    assert caminho_amostras(caminho) == caminho
+
+
+def test_separar_sentencas_spans():
+    """Testa que as posições recortam exatamente as sentenças de separar_sentencas."""
+    for texto in ["", "Sem ponto", "  Uma.  Duas!\n\tTrês? resto", " . ?", "Ç é.\u2003Fim."]:
+        spans = separar_sentencas_spans(texto)
+        assert [texto[inicio:fim] for inicio, fim in spans] == separar_sentencas(texto)
\ No newline at end of file